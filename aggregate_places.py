@@ -0,0 +1,67 @@
+import argparse
+import logging
+import time
+
+from parser.log import configure_logging
+from parser.aggregates import AGGREGATED_CSV, AGGREGATED_JSON, AggregateStore, write_places_json, write_places_csv
+from parser.map_bundle import write_bundle
+from parser.convert import iter_reviews
+from parser.places import PLACES_CSV, iter_places
+from parser.writer import is_append_only
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Пересчет рейтингов и количества отзывов мест по собранным отзывам')
+    parser.add_argument('--reviews', type=str, nargs='*', default=[],
+                        help='Файлы с отзывами; .jsonl учитываются только дописанной частью')
+    parser.add_argument('--state', type=str, default='data/aggregates.json',
+                        help='Файл с накопленными агрегатами (default: data/aggregates.json)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Пересчитать агрегаты с нуля (нужно для файлов с JSON-массивом)')
+    parser.add_argument('--places', type=str, default=PLACES_CSV,
+                        help=f'Справочник мест с названиями и координатами (default: {PLACES_CSV})')
+    parser.add_argument('--out-json', type=str, default=AGGREGATED_JSON, help=f'default: {AGGREGATED_JSON}')
+    parser.add_argument('--out-csv', type=str, default=AGGREGATED_CSV, help=f'default: {AGGREGATED_CSV}')
+    parser.add_argument('--map-bundle', type=str, nargs='?', const='map/data.js', default=None,
+                        help='Пересобрать данные карты (default: map/data.js)')
+    parser.add_argument('--debug', action='store_true', help='Включить режим отладки')
+
+    args = parser.parse_args()
+    configure_logging(debug=args.debug)
+    if args.places in (args.out_csv, args.out_json):
+        parser.error('--out-csv/--out-json не должны совпадать с --places: справочник перезапишется')
+
+    aggregates = AggregateStore(args.state)
+    if args.rebuild:
+        aggregates.places.clear()
+        aggregates.offsets.clear()
+
+    for path in args.reviews:
+        if is_append_only(path):
+            added = aggregates.sync_jsonl(path)
+        elif args.rebuild:
+            before = sum(stats.count for stats in aggregates.places.values())
+            aggregates.add(iter_reviews(path))
+            added = sum(stats.count for stats in aggregates.places.values()) - before
+        else:
+            logger.warning(f"{path} - не JSON Lines, его нельзя учесть дописанной частью; используйте --rebuild")
+            continue
+        logger.info(f"{path}: учтено {added} новых отзывов")
+    aggregates.save()
+
+    started = time.perf_counter()
+    places = aggregates.apply(iter_places(args.places))
+    write_places_json(places, args.out_json)
+    write_places_csv(places, args.out_csv)
+    if args.map_bundle:
+        write_bundle(places, args.map_bundle)
+    logger.info(
+        f"Обновлено {len(places)} мест за {(time.perf_counter() - started) * 1000:.0f} мс "
+        f"({len(aggregates.places)} с собранными отзывами)"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+import argparse
+import logging
+
+from parser.log import configure_logging
+from parser.map_bundle import write_bundle, MIN_SIZE, MAX_SIZE, SIZE_BUCKETS
+from parser.places import PLACES_JSON, iter_places
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Сборка данных карты map/data.js по столбцам с готовыми цветами и размерами')
+    parser.add_argument('--places', type=str, default=PLACES_JSON,
+                        help=f'Места: JSON в формате companyData или full_places.csv (default: {PLACES_JSON})')
+    parser.add_argument('--output', type=str, default='map/data.js', help='default: map/data.js')
+    parser.add_argument('--min-size', type=int, default=MIN_SIZE, help=f'default: {MIN_SIZE}')
+    parser.add_argument('--max-size', type=int, default=MAX_SIZE, help=f'default: {MAX_SIZE}')
+    parser.add_argument('--size-buckets', type=int, default=SIZE_BUCKETS,
+                        help=f'Количество ступеней размера кружков (default: {SIZE_BUCKETS})')
+    parser.add_argument('--debug', action='store_true', help='Включить режим отладки')
+
+    args = parser.parse_args()
+    configure_logging(debug=args.debug)
+
+    write_bundle(
+        iter_places(args.places),
+        args.output,
+        min_size=args.min_size,
+        max_size=args.max_size,
+        buckets=args.size_buckets
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+import argparse
+import logging
+
+from parser.log import configure_logging
+from parser.map_tiles import build_tiles
+from parser.places import PLACES_CSV, iter_places
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Предрасчет кластеров и тайлов для карты (map.html?mode=tiles)')
+    parser.add_argument('--places', type=str, default=PLACES_CSV,
+                        help=f'Места: full_places.csv или JSON в формате companyData (default: {PLACES_CSV})')
+    parser.add_argument('--output', type=str, default='map/tiles', help='Папка тайлов (default: map/tiles)')
+    parser.add_argument('--min-zoom', type=int, default=0)
+    parser.add_argument('--max-zoom', type=int, default=17)
+    parser.add_argument('--grid-size', type=int, default=64,
+                        help='Размер ячейки кластеризации в пикселях (default: 64)')
+    parser.add_argument('--cluster-max-zoom', type=int, default=15,
+                        help='Начиная со следующего масштаба места показываются без кластеров (default: 15)')
+    parser.add_argument('--debug', action='store_true', help='Включить режим отладки')
+
+    args = parser.parse_args()
+    configure_logging(debug=args.debug)
+
+    build_tiles(
+        iter_places(args.places),
+        args.output,
+        min_zoom=args.min_zoom,
+        max_zoom=args.max_zoom,
+        grid_size=args.grid_size,
+        cluster_max_zoom=args.cluster_max_zoom
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+import argparse
+import logging
+
+from parser.log import configure_logging
+from parser.convert import convert_to_csv
+from parser.places import PLACES_CSV
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Потоковая конвертация отзывов из JSON/JSONL в CSV')
+    parser.add_argument('--input', type=str, required=True,
+                        help='Файл с отзывами: JSON-массив или .jsonl (можно .gz/.bz2/.xz)')
+    parser.add_argument('--output', type=str, default='reviews.csv',
+                        help='Выходной CSV; сжимается при расширении .gz/.bz2/.xz (default: reviews.csv)')
+    parser.add_argument('--places', type=str, nargs='?', const=PLACES_CSV, default=None,
+                        help=f'Добавить name и координаты мест из справочника (default: {PLACES_CSV})')
+    parser.add_argument('--debug', action='store_true', help='Включить режим отладки')
+
+    args = parser.parse_args()
+    configure_logging(debug=args.debug)
+
+    convert_to_csv(args.input, args.output, places_path=args.places)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import logging
+
+from parser.discovery import (
+    DEFAULT_CAP, DEFAULT_CELL_DEG, ID_LIST, MIN_CELL_DEG, MOSCOW_BBOX, PlacesCsvSink, discover_places, load_id_list
+)
+from parser.driver_pool import DriverManager
+from parser.log import configure_logging
+from parser.scheduler import TokenBucket
+from parser.selenium_helper import set_politeness_delay, set_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Поиск мест по сетке окон карты (замена places_parser.ipynb) с записью в формате full_places.csv'
+    )
+    parser.add_argument('--query', type=str, default='тц', help='Поисковый запрос (default: тц)')
+    parser.add_argument('--bbox', type=float, nargs=4, action='append', metavar=('SOUTH', 'WEST', 'NORTH', 'EAST'),
+                        help='Область поиска, можно указать несколько (default: Москва)')
+    parser.add_argument('--output', type=str, default='discovered_places.csv',
+                        help='CSV для новых мест; существующий файл дописывается (default: discovered_places.csv)')
+    parser.add_argument('--known-ids', type=str, default=ID_LIST,
+                        help=f'Уже известные id, которые пропускаем (default: {ID_LIST})')
+    parser.add_argument('--update-id-list', action='store_true',
+                        help='Дописать id найденных мест в файл --known-ids')
+    parser.add_argument('--cell-deg', type=float, default=DEFAULT_CELL_DEG,
+                        help=f'Размер ячейки сетки в градусах широты (default: {DEFAULT_CELL_DEG})')
+    parser.add_argument('--min-cell-deg', type=float, default=MIN_CELL_DEG,
+                        help=f'Меньше этого ячейки не делятся (default: {MIN_CELL_DEG})')
+    parser.add_argument('--cap', type=int, default=DEFAULT_CAP,
+                        help=f'Потолок выдачи: ячейка с таким числом карточек делится на 4 (default: {DEFAULT_CAP})')
+    parser.add_argument('--workers', type=int, default=2, help='Количество параллельных браузеров (default: 2)')
+    parser.add_argument('--rps', type=float, default=1.0,
+                        help='Общий лимит запросов к Яндекс Картам в секунду (default: 1)')
+    parser.add_argument('--politeness', type=float, default=0.5,
+                        help='Минимальный интервал между прокрутками в секундах (default: 0.5)')
+    parser.add_argument('--debug', action='store_true', help='Включить режим отладки')
+    parser.add_argument('--no-headless', action='store_true', help='Запустить браузер в обычном режиме')
+
+    args = parser.parse_args()
+    configure_logging(debug=args.debug)
+    set_politeness_delay(args.politeness)
+    set_rate_limiter(TokenBucket(rate=args.rps))
+
+    known_ids = load_id_list(args.known_ids)
+    logger.info("Известных мест: %d", len(known_ids))
+    sink = PlacesCsvSink(args.output, known_ids=known_ids)
+    manager = DriverManager(size=args.workers, debug=args.no_headless)
+    try:
+        stats = discover_places(
+            manager,
+            args.bbox or [MOSCOW_BBOX],
+            sink,
+            query=args.query,
+            cell_deg=args.cell_deg,
+            min_cell_deg=args.min_cell_deg,
+            cap=args.cap,
+            workers=args.workers
+        )
+    finally:
+        manager.close()
+        sink.close()
+        set_rate_limiter(None)
+
+    logger.info("Записано %d новых мест в %s", stats['new'], args.output)
+    new_ids = sorted(sink.new_ids)
+    if args.update_id_list and new_ids:
+        with open(args.known_ids, 'a', encoding='utf-8') as f:
+            f.write(''.join(f'{place_id}\n' for place_id in new_ids))
+        logger.info("Добавлено %d id в %s", len(new_ids), args.known_ids)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+import argparse
+import logging
+
+from parser.log import configure_logging
+from parser.main import load_json
+from parser.column_store import ColumnStore, export_columns, DEFAULT_BLOCK_ROWS
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Экспорт отзывов в сжатые столбцы для анализа')
+    parser.add_argument('--input', type=str, required=True,
+                        help='Файл с отзывами (.json или .jsonl, например json/1.json)')
+    parser.add_argument('--output', type=str, required=True,
+                        help='Папка хранилища (rating.col, timestamp.col, place_id.col, index.json)')
+    parser.add_argument('--block-rows', type=int, default=DEFAULT_BLOCK_ROWS,
+                        help=f'Строк в одном сжатом блоке (default: {DEFAULT_BLOCK_ROWS})')
+    parser.add_argument('--debug', action='store_true', help='Включить режим отладки')
+
+    args = parser.parse_args()
+    configure_logging(debug=args.debug)
+
+    records = load_json(args.input)
+    if records is None:
+        logger.error(f"Файл не найден: {args.input}")
+        return
+
+    export_columns(records, args.output, block_rows=args.block_rows)
+    with ColumnStore(args.output) as store:
+        logger.info(f"Проверка: в хранилище {len(store)} отзывов, {len(store.places)} организаций")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import logging
+import time
+
+from parser.log import configure_logging
+from parser.synthetic import iter_chunks, PlacesSink, ReviewsSink, MapBundleSink, DEFAULT_CHUNK
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Генерация синтетических мест и отзывов для нагрузочного тестирования')
+    parser.add_argument('--count', type=int, default=500, help='Количество мест (default: 500)')
+    parser.add_argument('--places', type=str, default=None,
+                        help='Файл мест: .jsonl или .csv (можно .gz/.bz2/.xz)')
+    parser.add_argument('--map', type=str, default=None,
+                        help='Файл данных карты в формате map/data.js')
+    parser.add_argument('--reviews', type=str, default=None,
+                        help='Файл отзывов в формате парсера: .jsonl или .csv (можно .gz/.bz2/.xz)')
+    parser.add_argument('--reviews-per-place', type=int, default=50,
+                        help='Не больше стольких отзывов на место (default: 50, как --limit парсера)')
+    parser.add_argument('--distribution', type=str, default='normal', choices=['normal', 'clusters'],
+                        help='Координаты: normal - вокруг (59.5, 30.5), clusters - несколько скоплений')
+    parser.add_argument('--clusters', type=int, default=3, help='Количество скоплений (default: 3)')
+    parser.add_argument('--chunk', type=int, default=DEFAULT_CHUNK,
+                        help=f'Мест в одной пачке; другой размер дает другие данные (default: {DEFAULT_CHUNK})')
+    parser.add_argument('--seed', type=int, default=0, help='Зерно генератора (default: 0)')
+    parser.add_argument('--debug', action='store_true', help='Включить режим отладки')
+
+    args = parser.parse_args()
+    configure_logging(debug=args.debug)
+    if not (args.places or args.map or args.reviews):
+        parser.error('Укажите хотя бы один выход: --places, --map или --reviews')
+
+    sinks = []
+    if args.places:
+        sinks.append(PlacesSink(args.places))
+    if args.map:
+        sinks.append(MapBundleSink(args.map))
+    reviews_sink = ReviewsSink(args.reviews) if args.reviews else None
+
+    started = time.perf_counter()
+    places_total = reviews_total = 0
+    completed = False
+    try:
+        for places, reviews in iter_chunks(
+            args.count,
+            chunk_size=args.chunk,
+            seed=args.seed,
+            distribution=args.distribution,
+            clusters=args.clusters,
+            with_reviews=reviews_sink is not None,
+            per_place_limit=args.reviews_per_place
+        ):
+            for sink in sinks:
+                sink.write(places)
+            if reviews_sink is not None:
+                reviews_sink.write(reviews)
+                reviews_total += len(reviews['place_id'])
+            places_total += len(places['id'])
+            logger.info(f"Сгенерировано {places_total} мест, {reviews_total} отзывов")
+        completed = True
+    finally:
+        for sink in sinks + ([reviews_sink] if reviews_sink is not None else []):
+            sink.close(discard=not completed)
+
+    logger.info(f"Готово за {time.perf_counter() - started:.1f} сек")
+
+
+if __name__ == '__main__':
+    main()
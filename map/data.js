@@ -0,0 +1,2 @@
+// Сгенерировано build_map_bundle.py, не редактировать вручную
+const mapBundle = {"count":815,"columns":{"id":["234397670737","1065617412","1016177464","1128638135","149373957185","1113219372","1664687615","1267319939","49672038340","1010479265","1013729832","1331623198","72900666552","1001676447","1049720078","1052969913","28397857759","1125531085","1073228998","1235004933","47864381288","1036421425","1895190251","74657555402","1211722324","1189573038","1068005570","1518062377","87433230783","1036827082","1101898262","1214451177","1226142029","99774578525","162259177167","1258507688","1217233852","1721803077","1111244100","57376845339","1574116136","1039696501","209781762382","1019842047","1025882484","1352653158","3670913550","1382927229","1018013300","5887915293","1017099200","1290863261","1011120006","1268319033","1129181602","1706535484","1158641065","1047245367","1095559046","20842527585","1151616644","123063144674","1032412382","1097586622","1197807147","54600495034","1739323955","1030374391","91284566176","1208913804","161241477081","1423427873","1800675062","1375833137","1088829979","209217158784","1163971736","235455881116","1053891331","87301613832","1243234156","1074401254","1024672227","1262750173","1381514687","1120099881","23737284330","201554487578","1181157077","106962112972","1072202069","235735632668","150262037526","1062349409","111051214674","27747695168","83564086143","141380456685","1225387023","1824860516","1039804468","1137694973","1002579738","1093441083","1019689452","32893404919","175437576931","1214842276","38471990018","1054119810","2688724652","198648627980","1038972273","1739390075","85615225239","1043327863","1807838321","1102876611","1126849301","1161562124","1777846095","1071724435","1317369510","1241031952","1067823121","83942629196","1000339903","1278799042","1077371640","1003792929","210426576010","96777486600","1029057503","1788778964","1725110455","1203349621","1107302304","239426221958","212986650150","80741333463","1277434509","1136178701","1085762984","1755208521","26124361429","1003900071","10023080557","1389291244","1022520445","1124930593","140097893959","1381622328","1749017180","1228935243","1032760968","59907767391","104445441759","1353980721","1086601275","1030209739","1250027852","1052407198","1077768815","1746870647","1100483810","1042174987","1218481775","1208971575","1240511734","174511597096","214797091828","3637966821","1260899767","68957372101","32404842459","1090177051","136598280940","220287969624","1013198421","200181621417","1087960794","1045250272","42086401455","30007788202","215606109698","1216082933","1807005079","1010213177","1705102147","1000958166","133859605860","88074950697","1042081312","1202428446","235998599158","1000833751","1102548165","55619508463","1067451155","1019547178","1011107844","1013698959","30327442469","1078945362","1386552946","1093487471","1231321915","213180484923","1657950735","1045096846","1182298197","1057696465","234556565251","1104789676","1046457270","1334994265","1261537194","88186924832","1260147327","1004738327","1177959849","1066492017","1045137134","1689709996","1117095330","1047741225","1071984825","1378456387","1153674265","1087675658","94926387332","117378564554","1186009338","89724602393","1039939322","79206390286","1276579514","213784097416","1001604682","1091680631","1140519390","119187895024","1266735201","1198609266","1740677279","21181518311","1123694020","1139596807","77318935351","1058114895","1106385834","103798867013","196417691093","1162831234","1120978374","209809476826","1015826312","1135124734","1013078859","25938278642","26243389586","1013814700","88764434583","127560708723","89949623783","1119385644","1040313828","124260289598","1045484363","1732662883","1134826985","1086034794","101419209791","18069606993","42578408182","1376931514","218974071549","1072432761","153272678561","1676007552","1080599766","176299533868","1122858032","1028705527","1124945076","1040250993","1179049803","204225475823","1056396222","3526886323","1089915390","1082364508","1119831968","1084221101","1323776061","114847291998","61948663473","1138173409","1256010306","1322757089","68577522226","145519145649","1004193730","78698673899","1059231340","240187602905","1041332612","71052159978","1180178189","1165426191","1171123124","1072313657","185007908535","221428516897","126548460372","1197890979","1687701936","1007160335","1073627438","1165609214","160302360088","1130762674","95629958321","104421477126","33845655648","239047090802","121451897973","142756307895","1031523523","1018844297","100493331493","82424611421","11535489203","1041564044","1040025854","1106016536","236776270056","1171311677","90093452064","1290437170","1803825703","1726465711","1236202953","1305086043","33920496024","37829998644","242766278588","151969294997","99432903874","231461827596","1216153061","1039999460","231769520257","1044938154","148505923100","1114544087","1059501464","104059948900","1148057153","68284085683","1026931892","103626152772","66921577285","235447864873","173625065492","1094739637","1265823363","171510470160","1000345899","1099635963","1382686474","1061416589","1764780947","1733662553","235594594549","1398910467","1088314095","1699067750","185328894702","1091716672","36544352677","120659265081","171692015849","1770438258","85094954815","1217781055","196935405338","49724037255","106103842093","1256925303","89204366627","45719825865","1022649138","1274659372","1105267235","1104252867","170974433604","230817013547","1068450205","218073564346","230831317836","1114351505","1091159741","1701841705","52386322450","65780993579","112727639494","1236185405","204266565972","42200571518","189887696609","113240606797","148861376734","1368708577","1013946668","80237883662","4970871984","219061721660","1011725681","1141393821","68092894139","1693826814","96520285777","1185871361","52973236856","56679230527","4871817042","1677641459","1002809896","1753751496","29469772692","146446870223","179479731280","1815036129","1771564413","1254441052","237418175195","176088575942","1063711415","103177112779","73342208451","44015226829","197167007605","1056280245","200903081767","69745309368","197034420807","127304392383","1097912505","225334304034","1050340949","89610173306","1069677335","1117005556","22698850099","1159629229","1100017757","52617025701","5403521082","1171443771","234647345287","158500770941","176915481731","1261615993","1020577046","1030115756","225494312669","232985630483","144656510161","32644378553","37319957594","51776861526","1710219530","113857972166","217019528504","25273717096","1119939719","19671378901","14670907869","191314483596","1747413594","18246927656","1386758773","1002275095","1521897701","144162099895","199753143580","179434209093","178303290046","1008389200","148085205173","22294550385","1059692350","1264946451","1277007781","1126795691","1770641981","212469043663","1233619731","103670552412","1031939294","110728833088","1708002086","1404408958","1113978633","13059669770","1067977848","206097060587","1101627183","207513470303","1089543132","23050934480","166055129922","1099223332","230791330732","98215497654","139022341603","56012408172","1301139554","1131847368","1141233392","149182795703","244747820772","1698604254","1016099156","166101282608","1554433878","1794987356","228388265848","190968364535","58083730471","1224526346","1256536973","80155570611","177099730702","21861046572","1764057309","161524114186","1091564613","1155230444","1367540435","1123278100","112582527670","103204585186","1262257562","1087289978","117953605872","62285082397","1145195033","56964773995","1325715742","1693930967","117858943297","1044368594","139446245651","212756672648","1711570229","156595568139","1047251915","90171566334","188423352311","129784207286","60983209997","1351612162","74939045205","103939601034","96195273992","244712949309","1696289627","218975081637","1353594355","151645431594","1931527338","194479580083","1025248550","110059339673","1256690803","151484016042","141941374405","191398108353","89840437148","1129072966","112106173291","66297697856","233478126926","214052643171","158827127966","119197083554","1042570034","1245908776","131985652241","198400466234","108368362035","133731006878","222847466975","166377467691","56119932270","174763411025","1685999674","157284218033","70447453799","1291595335","41906463399","1108757128","19688357516","245141006725","1621221159","1150926251","145211566889","182125832729","179089341482","1059845619","191013329249","245355830177","78573361211","1229213826","1005349035","96779549613","9099269166","50803862414","51866116696","1130166934","1702721420","186843359838","1328811666","79200751181","135308393306","1317199801","207386972706","89336340060","62052554087","97914125654","57478652003","1249385442","77012648308","1003502633","1106030227","227195336555","234850574527","134552439709","5935848956","150142862939","1717821620","57741991725","118431355960","244372168562","155185174011","1086423900","205575167529","53102728015","66234077554","48868654852","1208702167","179082141298","17347620791","31748761911","1288100810","15767335948","154820535900","1497408338","191628991600","167345139405","1031467571","1233918317","17054764184","72541222723","1006808253","85891906146","120640729257","10934349667","60911973433","1675671455","193456571601","43775684638","1771884547","67623579609","1195028001","25833207567","11599997010","240271211123","1071477206","12768133278","190547635242","1458672083","1098046133","232908891150","206147579946","1699554422","1756568453","48364827038","204571436350","123637235445","141365250040","53862328006","1105750360","44262511132","217289168220","137391492602","221761521105","1750975140","1086172662","46117005375","12749680496","207553093748","96733282178","97493274319","193853859916","1720542211","1400074805","79437039828","1256986454","170639609091","2952002578","160980588489","1029738633","224613142290","68135573177","45377872296","113752541031","1738659781","82351309123","1087687280","193539278557","1042544712","1775776713","1019795149","148456648017","1742045642","185985616619","1758202620","149147922328","232513828852","1087757728","160280223677","1069141780","64948725375","45043963691","1094539325","231089620132","3312425161","1102012847","220942304910","1144700151","1197696003","5097924825","67513993787","199204268085","38488667692","1206048741","1120686416","42709731489","155350212215","78667711940","1103241031","125624589608","174293332829","15465060186","1049524069","1316675219","1348095276","13885343877","55036163116","159561874944","138653656095","147539559660","32301460748","1130356378","1107887820","25366798680","23200782286","1041982969","27077154549","76051421652","1127493902","177732919295","92054407347","1012806985","1044181528","1120147510","1066972836","1060369114","195540092429","120641131845","127084008234","242828001314","42586581000","32215852714","1735040569","218936654956","31186815193","1256330917","226469633006","168504764103","1143837629","1346010196","86440883477","1361883321","151940440314","229099337105","1112120378","1258814794","197601406119","25641353340","1690438062","203326581811","1326099661","49541678761","167872684241","1773329445","213940042069","25070494134","1001045297","224991649131","1007246965","191680380710"],"name":["Грай","Торгово-ярмарочный комплекс Москва","Крылатский","Мегаполис","Botanica","Европейский","Мозаика","Декстер","Дубровка","Атриум","Гагаринский","ГУМ","Павелецкая Плаза","Европолис","Город","РИО","Метрополис","Капитолий","Московский","Ханой-Москва","Щёлковский","ВЭБ Центр","Водный","Центральный детский магазин","Калейдоскоп","Columbus","Капитолий","Океания","Ереван Плаза","ТЦ Севастополь","XL","Гудзон","Парк 11","РИО","Миля","Парус","Дружба","Fort","Алтуфьевский","Хорошо!","Avenue Southwest","Калужский","Место встречи Янтарь","Галерея Аэропорт","Экстрим","Москворечье","Место встречи Ангара","Времена Года","РМ","Место встречи Будапешт","Пятая Авеню","Mari","Варшавский","Весна","Фестиваль","На Беговой","Vegas","Никольская Плаза","Семёновский","Черёмушки","Савёловский Модный","Место встречи София","ЕвроПарк","Капитолий","Модный сезон","Киевский","Март","Люблю Молл","Тиара","Свиблово","Kvartal West","Калита","Город","Тимирязевский","Петровский Пассаж","Нора","Metromall","Саларис","Гименей","Небо","Зелёный","Александр Лэнд","Елоховский Пассаж","Филион","Зиг-Заг","Кунцево Плаза","Prime Plaza","Измайловский Пассаж","Капитолий","Вешняки","Аркадия","Vegas","Discovery","Праздник","Измайловский","Бутово Молл","Смоленский Пассаж 2","Новомосковский","Таганский пассаж","Торговый центр W","Триумфальный","Голден Гросс","Мега","Мега","Family Room","Кузьминки Молл","Зум Зиларт","Метромаркет","Петровский","Планерная","Флотилия","Место встречи Киргизия","Метромаркет","Торговый центр","Торговый центр","Домодедовский","Торговый центр","Компас","Панорама","Наутилус","Gardenmir","Торговый центр","Алексеевский","Клён","ТК Измайлово","Заря","Старт","БраVo!","Горбушка","Принц Плаза","Место встречи Рассвет","Торговый центр","Галерея","Новоарбатский","Торговый центр","Люблино","Улей","Место встречи Высота","Сказка","Гавань","For you","K24","Сфера","Торговый центр","Серебряный дом","Дарья","ТЦ Потапово","Океан","Облака","Ключевой","Галеон","Глобал Молл","Щёлково","Фабрика","BoscoVesna","Мега","Торговый дом Савеловский","Мост","Звёздочка","Таганка","УниверСити","Ареал","Кожевники","Шоколад","Никольский пассаж","Тульский","Горбушкин Двор","Парк Хаус","Электроника на Пресне","Азовский","Парагон","Добрынинский","Маркос-Молл","Зенит","Соле Молл","Радужный","Место встречи Прага","Солнце Москвы","Мариэль","Крокус Сити Молл","Бухарест","Дарья","Вега","Июнь","Место встречи Орбита","Мираж","Торговый центр","Час Пик","Перово Молл","Столица","Декоратор","Фили Град","Круг","Авентура","Место встречи Нева","Багратионовский","Fort","РТС Рублевский","Метромаркет","Витте Молл","Квадро","Звёздочка","Савёловский Детский","Нижегородский Пассаж","Драйв","Коломенский","Vegas Сити","Торговый центр","Волжский","Ритейл Парк","Спектр","Митинский радиорынок","Торговый центр","Три-D","Чукотка","Мандарин","Аэробус","Южная галерея","Московские товары","Торговый центр","Галерея Атлантис","Глобал Сити","Мини-Молл","Мандарин","Ховрино","Европа","Матвеевский","Пассаж","XL Outlet","Белорусский торгово-выставочный центр","ТЦ Саларьево","Торговый центр","ТЦ Кунцево","Торговая галерея","Ареал","Кондор","Сормовский","5 Планет","Столица","Молодежный","Торговый центр","Плаза","Динамо","Ясенево","Мобильный","Место встречи Солнцево","Митино","РТС","Лухмановский пассаж","Мал","Ладья","Филёвский","Южный","Прага","Фили","Baby Store","Торговый центр","Планета","Кантемировский","Лес","Шоколад","Будапешт","Старк","Торговый центр","Семеновский пассаж","Гвоздь","Бутырский рынок","Орбион","Ньюдэл","Дизайн завод","Метр квадратный","Марьинский пассаж","Пятницкий Митино","Триумф","Волгоградский","Любимый","Наш","Красный кит","Савёловский Спортивный","Дирижабль","Северное Сияние","Авиатор","Западный","Владыкино","Радуга","Престиж-М","Миг","Выходной","Петровский","Парус","Ленинский 101","Гран плюс","Арколь","Любимый","МЦ","Садовод, корпус А","Салют","Люблинский пассаж","Перловский","Конфетти","Лайм","Депо Молл","Пятницкий","Павелецкий","Премьер","СпортХит","Русское раздолье","Место встречи Бирюсинка","У Речного","Ваш Дом","Затонка","МовТрейд","Зёрнышко","Бусиново","Дропин","СпортЕХ","Бенефис","Щелчок","Торговый дом","Камп","ЦДиИ Экспострой","Outlet Village Белая Дача","Столица","Солнцево парк","Корабль","Пролетарский","Отрада","Лианозово","Крона","Европа","Китайский павильон","Аструм","Мега","Тук-Тук","Вавилон-92","РТС","Neva Towers","Реутов Парк","Невский Причал","Лучик","Торговый центр","Ноев ковчег","Вектор","Нахимовский","Торговый центр","ТЦ Рублево","Шоколад","Автомобили","Торговый центр","Фили","Fashion House","Перерва","Волна","Галла","Михалковский","Торговый центр Шолохов","Торговый центр на Озёрной","Енисей","Конфитюр","Baby&Kid","Отрадное","Конкорд Маркет","Волна","Радиокомплекс Южный","На Ивантеевской","Дудинка","Армадахоум","Торговый центр Тихорецкий бульвар","Автозаводский","Персей","Экватор","Гранд Юг","Ярославчик","Лось","Аннино","Гипермаркет Говорово","Новый","Торговый центр","Октябрьский","Вэйпарк","Капитолий","ТЦ Московский","Грант","4Daily","Бута Парк","Твин Плаза","Город","Торговый центр","Ассортида","Олимп","Москва","Звезда","Арфа","Восточный ветер","ТЦ Чертановская 30","Гренада","Галерея Новые Вешки","Лабиринт","Меркурий","Тбилиси","Level Причальный","Место встречи Саяны","Московские товары","Нагатинский","Центральный","Гвоздь-2","Фиеста","Лефортовский стройцентр","Моя Ветка","Торговый центр","Каштановая роща","Ochakovskiy Mall","Сфера","Ангар","Обувь-Сити","Утёсов","Галерея","Пруды","Торговый центр Зелёный проспект","Июнь","Мебель Парк","Торговый центр","Марка","Северный","Виктория","Ясный","Мост","Аркада","Большая Медведица","Поворот","Passage","Мультисервис","Марсаков","Набережный","Квадрат","Бульвар","Мульти","Кувшинка","Братеевский","Смолл","Бусинка","Торговая галерея","Коммунарка","Лига","Торговый центр","Люблинское поле","Крылья","Арус","Вертикаль","Смолл","Ховринский Хозяин","Купчино","Каспий","Давыдково","Новогиреевский","Курс","Экватор","ТЦ Горки","Мебель","Торговый центр","Место встречи Первомайский","Торговые ряды","Спутник","Интер-север","Новые Химки","Свод","Комета","Торговый центр","Ривер-парк","ТК Север","Forum City","Лухмановский","Астория","Акварель","Сбер Первый","Аструм","Северная Европа","Корабль","Ассортида","ТЦ Вегас","Коломенский пассаж","Ореховский","А58","Дегунино","Альтаир-1","Хард-Вуд 99","Август","Премьера","Море","Ангара","Лайт Молл","Торговый центр","Торговые ряды Люблино","Маяк","Каренфор","Волна","Мелитопольский","На Воронежской","Карат","Family Room","Mobel Expo","Константа","Покров Мост","Суздальский","Лосинка","Ферганский","Светофор","Ковчег","Приалит","Петровский","Кристалл","Пролетарский 24","Октябрь","Радонеж","Товары для всей семьи","Artplay","РигаStar","Твой","Милор","Мегаполис","Тропарёво","Аннино","Меха и кожа","Гелиос","Гран Плюс","Торговые ряды","Гранд","Бриз","МиМиМи","Торговый центр","Мусоргский","ЭлитСтрой Материалы","XL-Эконом","Новоизмайловский","Терлецкий","Торговый центр","Славянский Стан","Ассортида","Интерьер","Формат","Цитрус","Торговый Дом Беловежский","Торговый центр","Московские товары","МПлаза","Ивановский","Мирус авто","Бутово парк","Весна","Колибри","Авалон","Dekor&Mobel Expo","Нововатутинский","Белореченский","Галерея Ремонта","Этажи","Формула X","Раменки Пять","Московский","Трехгорка","Южный полюс","Дом мебели","Славянский","Атлас","Отрада","Радиус","Даниэль","Vnukovo Outlet Village","ТЦ Норд","Торгово-выставочный комплекс Заречье","М5","Подземная галерея","Красный Кит","Северодвинская 21","Ампуриа","ТД Висти","Евразия","Шолоховский","Победа","Иринка","Торговый центр","Пикник","Сафа","ТЦ","У Речного","Флагман","Нежино","На Фрязевской","Пражский Град","Фрегат","Глобус","Бирюлевский","Александрия","ТЦ Лихачёвский","Центр дизайна Румянцево","Колодезный","ТЦ Коробка Парк","Тетрис Молл","Альфа","Лучи","Торговый центр Горки","Визит","Лофт","Кони-Айленд","На Шитова","Отрада","Янтарный","Персей для детей","Торговый центр","Дирижабль","Навитек","Фэвори","Николин парк","Торговый центр Мисайлово","Уютный дом","Московский","Досуг","Торговый центр Ларец","114 Яр","Олимп","Альянс","Солнечный Рай","Радуга","Гусь","Идея","Якорь","Лосиноостровский","Каширский","Альта","Скандинавия","Можайский двор","Кэмз","Саянский","Галерея 1","Кубик","Галион","XL Home","Яуза","Торговый центр Кинезис","Мытищи","ТераБит","Перерва 32","Максим","Ладный","Торговый центр","Братиславский рынок","Водный Пассаж","Светофор","Гирей","Смолл Борисовский","Торговый центр","Торговый центр","Торгсин-Маркет","Галерея 9-18","Фиделити","Эталон","Егоза","Панорама","Карамель","Сити","Полёт","Торговый центр","Марьинский","Лабиринт","Ярмарка 10000 товаров","Перец","Торговый дом","Моя лавка","Скобелевский","Корниловский","ТЦ Трехэтажка","Россошанка","Магаз","Торговый центр","На Покрышкина","София","Спас","Подсолнух","Vnukovo Premium Outlet","Апельсин","Клиффстор","Грин","Торговый центр","Парк Авеню","Персей для детей","М36","Март","Фермер","Калач","Катюшки","Торговый центр","ТЦ Автозапчасти","Торговый дом Сетунь","Торговый центр","Алькор-ЮЗ","Маяк","Юлиян","Молодёжный","New Moscow","Калач","Курс","Гараж 57","Декстер","Комфорт","Подземка","Шипиловский","Черта","Торговый центр","Вестор","Поляна","Криста","Ладный","Крокус Экспо","Боброво","Развилка","Торговый центр","Юбилейный","Дмитровский","Торговый центр № 1","Круиз","ТЦ Сакура","ТЦ Сатурн","Торговый комплекс","Пчёлка","Мечта","Гагарин","Автокластер 19/21","Каскад","Томилино","Станция","Черкизово","Мельница","Торус","Универсам","Сходня","Котельники","Торговый комплекс Звёздный","Курс","Мармел","Удача","Красногорский","Ёлка","Идея","Планета","Фермерский рынок","Пятачок","Кузьминки","Outlet Aparinki","Вертикаль","Актюбинск-525","Луч","Аргумент","Альмирал","Мегаполис Плюс","Box city","Торговый центр","Торговый дом Забытые традиции","Торговый дом Томилино","Шком-Бирюлево","Айс","Горизонт","Всё для дома и ремонта. Пав. 39-40. ТЦ Кар-Трейд","Торговый центр","Deluxe","Торговый центр Лето","Пушкинский","Интерьер сити","Контур","Кубик","Эй Маркет","Никольский парк","Оникс","ТЦ Корабль","38 Метров","Малина","Тарасовка","Фламинго","Пассаж","Пирамида","Парк","Леонидовка","Канцпарад","Удача","Пулмарт","Весна","Мегаполис 2","Гараж","Нептун","Торговый центр Валентиновка","Торговая галерея на Транспортном","Московские товары","Садко","Новый","Носовихинский","Подмосковье","Владимирский тракт","Галатея-Микс","Кучинский","Никольский","Три Кита","Пушкинский","Красный Камень","Лотос","Торговый центр","Сити","ТСК Подсолнух","Виртус","Фабрика","Пушкинский рынок","Go Park","Дар","Торговый центр Арбатский","Маяк","Майя","Скандинавский пассаж"],"lat":[55.673282,55.673816,55.759242,55.695824,55.844278,55.744263,55.710742,55.893082,55.704931,55.757113,55.707081,55.754572,55.730937,55.845855,55.747836,55.689616,55.823216,55.803301,55.7759,55.877835,55.81097,55.757783,55.840265,55.760274,55.850481,55.612228,55.692065,55.727877,55.708969,55.650948,55.863769,55.664253,55.808001,55.663782,55.685891,55.8379,55.780091,55.863187,55.852773,55.777204,55.663067,55.655876,55.809047,55.801765,55.870011,55.653407,55.651473,55.731743,55.824311,55.897419,55.799804,55.649758,55.653668,55.913052,55.678022,55.774201,55.585051,55.757995,55.782946,55.67011,55.794217,55.803739,55.766415,55.687283,55.75709,55.743418,55.782821,55.65871,55.697509,55.856186,55.707654,55.607687,55.729786,55.819481,55.762472,55.682653,55.857049,55.623569,55.73834,55.642909,55.813511,55.885702,55.772283,55.744056,55.889741,55.739172,55.656332,55.789609,55.641048,55.724058,55.744515,55.720306,55.878662,55.826861,55.79275,55.52408,55.748232,55.593784,55.741354,55.582677,55.683081,55.754378,55.654006,55.602653,55.827944,55.701817,55.698825,55.805812,55.825639,55.862684,55.854124,55.751662,55.731882,55.812928,55.810245,55.609742,55.719179,55.850961,55.671531,55.759183,55.780137,55.716711,55.808174,55.875735,55.788233,55.781743,55.790365,55.639034,55.741211,55.618608,55.824049,55.655037,55.759145,55.752085,55.747014,55.673794,55.862886,55.699767,55.634803,55.840957,55.68445,55.728214,55.753223,55.805641,55.782052,55.792941,55.533168,55.678246,55.612128,55.640044,55.647827,55.712183,55.811072,55.816736,55.752007,55.911143,55.793909,55.708229,55.741807,55.740773,55.693349,55.897734,55.730453,55.763827,55.755613,55.710041,55.742605,55.625148,55.76497,55.64766,55.795031,55.729292,55.8883,55.790647,55.858394,55.869203,55.792658,55.826113,55.649096,55.819487,55.65557,55.806017,55.838825,55.920592,55.676328,55.705567,55.851825,55.898589,55.745252,55.64701,55.729302,55.75532,55.569749,55.636895,55.862752,55.74348,55.606843,55.754013,55.818897,55.547922,55.725604,55.66513,55.795748,55.738491,55.703604,55.678244,55.820766,55.708246,55.700011,55.633488,55.619427,55.844712,55.714546,55.73541,55.851182,55.814565,55.64022,55.611058,55.775247,55.664087,55.582932,55.622609,55.73921,55.85504,55.867025,55.778636,55.702579,55.793402,55.891841,55.831909,55.623178,55.735889,55.74058,55.797166,55.643673,55.869617,55.71083,55.995695,55.619605,55.718582,55.793311,55.846937,55.793212,55.611951,55.794381,55.652797,55.847736,55.879268,55.714605,55.864989,55.846219,55.751794,55.621879,55.600874,55.742642,55.823619,55.625479,55.738515,55.637715,55.822554,55.740683,55.70436,55.626339,55.803334,55.782054,55.830711,55.794259,55.699559,55.880705,55.805128,55.720945,55.652255,55.85722,55.870023,55.702148,55.691482,55.890269,55.916692,55.796844,55.665958,55.574945,55.827318,55.755482,55.848607,55.738487,55.790304,55.739984,55.685291,55.717444,55.88504,55.666654,55.894005,55.767464,55.70096,55.640223,55.652786,55.653493,55.67705,55.891917,55.678863,55.810144,55.819272,55.74336,55.712691,55.674495,55.70587,55.79012,55.579639,55.855611,55.748977,55.679243,55.646571,55.666029,55.881743,55.636167,55.738147,55.806663,55.810592,55.823255,55.870456,55.671693,55.660941,55.604597,55.625807,55.71014,55.630712,55.875479,55.897421,55.840872,55.739801,55.835874,55.718396,55.657746,55.705347,55.86969,55.755556,55.751611,55.75219,55.835671,55.857413,55.594336,55.833833,55.809278,55.668587,55.635936,55.787841,55.644335,55.705611,55.71216,55.763915,55.980198,55.654157,55.745263,55.787112,55.837393,55.636803,55.672979,55.860015,55.931236,55.78428,55.865297,55.723487,55.560328,55.620366,55.814084,55.861976,55.614324,55.679106,55.708517,55.842574,55.751789,55.609534,55.878994,55.880402,55.588473,55.658851,55.777602,55.582045,55.792685,55.85932,55.621409,55.606701,55.674565,55.921266,55.669979,55.617797,55.93621,55.642766,55.645812,55.751349,55.596297,55.883977,55.894472,55.809197,55.620235,55.669921,55.925574,55.636224,55.751924,55.67174,55.759981,55.768364,55.78509,55.682195,55.933636,55.675929,55.933384,55.747822,55.735864,55.545451,56.055794,55.669249,55.816524,55.71954,55.678023,55.7685,55.635071,55.635011,55.752073,55.819322,55.633916,55.511322,55.879032,55.869604,55.880605,55.599025,55.708212,55.784225,55.893757,56.008411,55.762453,55.735629,55.806499,55.95815,55.570031,55.757779,55.879237,55.671313,55.637862,55.622218,55.882935,55.71081,55.567881,55.888643,55.658535,55.678701,55.809686,55.536193,55.793713,55.65408,55.861164,55.826956,55.638957,55.735604,55.759417,55.747295,55.659662,55.530235,55.782472,55.888186,55.793605,55.784566,55.807228,55.854024,55.899182,55.640136,55.854219,55.892686,55.940614,55.740168,55.67751,55.722181,55.69241,56.000561,55.738252,55.535705,55.799581,55.89004,55.851639,55.943739,55.680395,55.62239,55.650226,55.864829,55.714075,55.811627,55.870877,55.662973,55.677017,55.675059,55.962377,55.599072,55.672964,55.608475,55.613445,55.821522,55.539347,55.610322,55.753386,55.630038,55.672504,55.683995,55.781828,55.73802,55.863167,55.695763,55.692051,55.736374,55.742536,55.897685,55.733954,55.632574,55.79768,55.823597,55.689838,55.752598,55.80444,55.84632,55.699788,55.848975,55.630636,55.583914,55.656175,55.914414,55.883101,55.730846,55.886529,55.703623,55.809227,55.61984,55.862352,55.683871,55.895841,55.790851,55.764667,55.832864,55.609253,55.709885,55.657733,55.929734,55.894113,55.714401,55.677066,55.672757,55.709006,55.769631,55.72632,55.54589,55.582222,55.676468,55.733497,55.671671,55.514346,55.66105,55.659618,55.608604,55.576796,55.693,55.599913,55.697189,55.586363,55.879443,55.72733,55.690895,55.892541,55.917716,55.903671,55.610241,55.966582,55.678001,55.668538,55.761858,55.819531,55.892949,55.53684,55.88583,55.72556,55.643057,56.011731,55.893485,55.957167,55.708467,55.779239,55.771628,55.856268,55.568121,55.709627,55.744988,55.611939,55.920022,55.55707,55.586652,55.570571,55.921728,55.633926,55.798226,55.877439,55.816399,55.652692,55.547144,55.510024,55.715604,55.639608,55.632516,55.806324,55.87411,55.822497,55.571545,55.660023,55.926368,55.54848,55.724134,55.589081,55.561229,55.571881,55.825844,55.672994,55.54234,55.866391,55.520694,55.640717,55.82955,55.591522,55.614615,55.784614,55.894538,55.863591,55.597316,55.916408,55.564104,55.71218,55.769508,55.769097,55.568837,55.768814,55.796048,55.89181,55.906393,55.910223,55.899412,55.81475,55.652982,55.509047,55.68868,55.71266,55.657942,55.84031,55.794274,55.752505,55.613373,55.602274,55.827614,55.602911,55.545156,55.681406,55.556966,55.564304,55.735264,55.819125,55.914499,55.946017,55.810984,55.650863,55.611229,55.823908,55.583198,55.745551,55.683235,55.546511,55.603477,55.97352,55.593192,55.913975,55.763023,55.66508,55.916857,55.83902,55.53516,55.610658,55.904924,55.567555,55.56709,55.902508,55.820238,55.592767,55.846128,55.928241,55.587852,55.595899,56.008602,55.92252,55.910035,55.722235,55.566784,55.752432,55.757539,55.702199,55.815518,55.572633,55.707812,55.551645,55.549594,55.893177,55.697911,55.901259,55.621696,55.629045,55.94832,55.684514,55.893954,55.850198,55.827463,55.822528,55.540153,55.595339,56.012519,55.673597,55.960304,55.917266,55.996996,56.075381,55.917883,55.620206,55.851668,55.907386,55.975238,55.699026,55.705437,55.654771,55.542396,55.970031,56.005466,55.914264,55.893422,55.950598,55.673305,55.90638,55.686609,55.545544,55.970544,55.834639,55.831361,55.938192,55.661298,55.827439,55.6914,55.704542,55.573364,55.933597,55.578864,55.629289,55.712102,55.661752,55.878935,55.82226,55.839249,55.799885,55.658197,55.591307,55.694117,56.046019,55.865675,55.907925,55.593465,55.965374,56.013387,55.63965,55.826398,55.968392,55.679859,55.749852,55.850102,55.913493,55.631442,55.687893,55.95545,55.683147,55.815618,55.799744,55.817882,55.923006,55.848234,55.970722,56.003658,55.750369,55.920888,55.690384,55.906211,55.931216,55.913918,55.91341,55.86407,55.541606,55.750982,55.927463,55.777569,55.64804,55.751491,55.760469,55.702594,56.003633,55.545962,55.750983,56.009773,55.914166,55.571463,55.90784,55.813173,56.013895,55.93779,55.631367,55.658559,55.893808,55.917452,55.554262],"lon":[37.612475,37.781388,37.40925,37.665235,37.637066,37.565527,37.67545,37.501263,37.640926,37.659049,37.591437,37.621182,37.639973,37.662093,37.706952,37.60247,37.497468,37.619107,37.660524,37.730735,37.799968,37.582441,37.491685,37.624747,37.444372,37.606924,37.527865,37.475662,37.622179,37.596279,37.545826,37.627747,37.573442,37.511308,37.853848,37.576659,37.601371,37.601976,37.585613,37.523292,37.48086,37.541598,37.730053,37.531894,37.469888,37.646369,37.612392,37.487628,37.634407,37.604505,37.482988,37.770157,37.620285,37.584917,37.46733,37.545828,37.723202,37.624389,37.721264,37.552339,37.592608,37.800493,37.381219,37.603948,37.617307,37.562781,37.705813,37.741699,37.500292,37.653418,37.456664,37.532523,37.730896,37.578416,37.618939,37.662307,37.559014,37.422243,37.614628,37.399328,37.603953,37.602471,37.678196,37.508274,37.538414,37.411276,37.569378,37.752205,37.530496,37.825078,37.630105,37.379831,37.479251,37.444336,37.787104,37.517748,37.58142,37.351477,37.658646,37.671568,37.549279,37.659284,37.84484,37.489706,37.489353,37.764525,37.638072,37.515043,37.516563,37.435005,37.497067,37.819853,37.663992,37.706544,37.787758,37.719906,37.778988,37.679161,37.553754,37.624868,37.633644,37.792222,37.638046,37.665401,37.787307,37.705139,37.544367,37.759228,37.502663,37.506486,37.518152,37.484894,37.610898,37.596237,37.774577,37.760539,37.585449,37.76533,37.33507,37.485338,37.621963,37.580337,37.575895,37.413274,37.704022,37.493577,37.497893,37.697386,37.732698,37.758149,37.481396,37.656697,37.830744,37.735183,37.588291,37.3968,37.593397,37.73062,37.655708,37.657628,37.53376,37.588207,37.645494,37.84473,37.621979,37.623354,37.504613,37.761031,37.557882,37.596395,37.783536,37.622049,37.588462,37.680111,37.685846,37.663169,37.577901,37.628698,37.744894,37.387541,37.571581,37.39547,37.572325,37.708486,37.665344,37.768658,37.646342,37.629585,37.797331,37.41169,37.734575,37.51005,37.579036,37.598867,37.471208,37.498648,37.536283,37.406443,37.5735,37.543171,37.449752,37.481547,37.59338,37.674247,37.833705,37.66487,37.388148,37.727547,37.752454,37.623933,37.509276,37.383325,37.803832,37.70168,37.646089,37.772235,37.621701,37.606775,37.485821,37.482179,37.595229,37.605939,37.484381,37.355537,37.494138,37.479832,37.46657,37.492513,37.748783,37.625562,37.441585,37.479696,37.417393,37.717309,37.526264,37.666863,37.812034,37.537009,37.752185,37.420287,37.565684,37.357415,37.559929,37.537661,37.590802,37.393274,37.36006,37.547026,37.899748,37.604079,37.358447,37.514051,37.611308,37.609244,37.499616,37.500261,37.483449,37.661311,37.656273,37.82336,37.658174,37.765802,37.666494,37.513308,37.716265,37.396746,37.578583,37.343975,37.694767,37.585258,37.697221,37.742069,37.350283,37.533884,37.795706,37.486828,37.588024,37.758816,37.593874,37.549025,37.580232,37.444858,37.402729,37.590768,37.666676,37.679812,37.861062,37.877769,37.413876,37.407274,37.515521,37.617286,37.72925,37.503485,37.532962,37.829148,37.822316,37.764863,37.727273,37.642708,37.779091,37.577616,37.629504,37.645615,37.504609,37.404316,37.678497,37.649006,37.47699,37.771719,37.687662,37.715592,37.786155,37.488798,37.521033,37.717558,37.406247,37.797752,37.756794,37.663167,37.584205,37.879708,37.356891,37.306362,37.620446,37.658526,37.332171,37.554089,37.48725,37.665867,37.625923,37.676714,37.843373,37.479101,37.63722,37.68134,37.534528,37.887664,37.490487,37.58322,37.605705,37.523299,37.79836,37.591666,37.67278,37.355608,37.520738,37.689474,37.895324,37.487384,37.303797,37.716405,37.879902,37.674826,37.537376,37.354485,37.451162,37.659212,37.494493,37.715052,37.604404,37.61032,37.80586,37.608866,37.733531,37.687674,37.606623,37.776346,37.656653,37.484174,37.859451,37.604999,37.720333,37.708809,37.600671,37.430204,37.516904,37.661456,37.494048,37.39542,37.713962,37.351694,37.861224,37.719224,37.763591,37.505757,37.492916,37.540493,37.720645,37.81625,37.468085,37.666835,37.588206,37.841212,37.588895,37.871289,37.601784,37.511264,37.812842,37.569916,37.517415,37.832779,37.718703,37.651776,37.493295,37.662225,37.556504,37.71645,37.830034,37.55623,37.531309,37.447799,37.460272,37.628103,37.507428,37.494274,37.332134,37.73642,37.816296,37.346513,37.441017,37.573957,37.579491,37.507759,37.712929,37.726046,37.730657,37.721651,37.662582,37.440064,37.619839,37.5216,37.584998,37.445743,37.580728,37.40905,37.556759,37.449684,37.757582,37.750864,37.495871,37.610603,37.47776,37.433753,37.757416,37.779719,37.460191,37.515375,37.938929,37.647558,37.503033,37.450268,37.604412,37.467863,37.795205,37.862245,37.747689,37.8124,37.702614,37.438473,37.805919,37.717752,37.394529,37.475937,37.409071,37.606522,37.620597,37.599147,37.866734,37.573791,37.509326,37.905688,37.727586,37.88148,37.613449,37.640779,37.407239,37.388365,37.511615,37.345435,37.66313,37.701721,37.469348,37.572568,37.819614,37.729327,37.676603,37.485663,37.800274,37.470618,37.666138,37.350201,37.738943,37.579862,37.606353,37.826535,37.576326,37.746492,37.858004,37.423915,37.582532,37.723113,37.707076,37.846648,37.682472,37.820654,37.896524,37.467334,37.86733,37.613586,37.667341,37.658703,37.938736,37.807573,37.579256,37.669926,37.299766,37.373384,37.739564,37.354126,37.482179,37.599338,37.834222,37.866648,37.605532,37.674242,37.436792,37.685629,37.781025,37.718261,37.619988,37.41285,37.55667,37.886381,37.824809,37.932201,37.487523,37.744191,37.759906,37.751011,37.449878,37.397221,37.881021,37.579913,37.361714,37.832799,37.381,37.586841,37.912361,37.858463,37.861731,37.583329,37.351995,37.776015,37.428655,37.537399,37.696566,37.494738,37.354692,37.336816,37.648256,37.634575,37.472626,37.303671,37.626301,37.842341,37.384776,37.334361,37.532062,37.408317,37.865587,37.623288,37.320598,37.680004,37.529392,37.556687,37.449792,37.343285,37.847731,37.558254,37.86255,37.359038,37.600341,37.865295,37.478673,37.568954,37.470704,37.817283,37.603282,37.762608,37.494403,37.666596,37.47661,37.514054,37.440064,37.697488,37.328362,37.341568,37.613516,37.548382,37.783654,37.881569,37.607114,37.519656,37.729345,37.333635,37.875322,37.564681,37.878582,37.522288,37.324566,37.689052,37.454259,37.829843,37.451854,37.960533,37.748015,37.709346,37.707253,37.598559,37.603487,37.308265,37.366107,37.472605,37.87737,37.613081,37.682771,37.723347,37.772484,37.499975,37.372983,37.516595,37.832753,37.585966,37.832524,37.963522,37.745222,37.738377,37.780576,37.721036,37.362711,37.733969,37.561419,37.862642,37.376526,37.751647,37.486007,37.926578,37.821053,37.729662,37.482596,37.368996,37.542512,37.699153,37.448933,37.554353,37.571107,37.830028,37.33843,37.805131,37.505881,37.796918,37.742606,37.699013,37.63425,37.743283,37.859015,37.852668,37.555418,37.480141,37.903477,37.611699,37.414748,37.844547,37.47173,37.842943,37.378773,37.447509,37.337791,37.717134,37.57368,37.566799,37.407751,37.312452,37.612935,37.363021,37.721935,37.663722,37.592081,37.449014,37.832513,37.778852,37.388724,37.690563,37.820529,37.851792,37.848866,37.355127,37.473575,37.404866,37.702476,37.54416,37.501161,37.898553,37.407102,37.726121,37.599906,37.494703,37.296281,37.451246,37.426484,37.443704,37.385788,37.611355,37.739232,37.482875,37.862944,37.534059,37.867176,37.862327,37.550132,37.868995,37.784065,37.346651,37.453785,37.906626,37.805987,37.893209,37.951598,37.572434,37.79275,37.435677,37.763397,37.610589,37.297295,37.861234,37.86786,37.305773,37.590239,37.743789,37.297572,37.302473,37.314006,37.950118,37.444907,37.860687,37.765322,37.755797,37.843521,37.903106,37.865522,37.669461,37.481453,37.420835,37.384987,37.304098,37.530938,37.92306,37.663474,37.90831,37.547206,37.572358,37.865924,37.367448,37.939373,37.842994,37.824009,37.955,37.911491,37.889546,37.888719,37.437718,37.868312,37.806969,37.89829,37.824437,37.89335,37.340184,37.936563,37.31126,37.783791,37.359763,37.742977,37.876745,37.853424,37.844837,37.862017,37.851172,37.890425,37.413666,37.862562,37.682565,37.719278,37.924102,37.859355,37.855261,37.735542,37.955064,37.89645,37.355698,37.853119,37.720988,37.95361,37.850819,37.80354,37.601732,37.867137,37.957761,37.843173,37.32314,37.848716,37.923847,37.45164,37.763147,37.512765],"rating":[4.2,4.5,4.4,4.5,4.9,4.9,5.0,4.6,4.5,4.8,4.9,5.0,5.0,4.9,4.9,4.8,5.0,4.7,4.3,5.0,5.0,4.4,4.8,5.0,5.0,5.0,4.9,5.0,4.5,4.4,4.5,4.6,4.3,4.8,4.9,4.4,4.5,4.7,4.4,5.0,4.9,4.6,4.8,4.5,4.8,4.6,4.9,4.8,4.6,4.9,4.5,4.9,4.4,5.0,4.9,4.2,5.0,4.8,4.7,4.3,4.4,5.0,4.9,4.6,4.4,4.7,4.3,4.7,4.3,4.4,4.8,4.7,4.7,4.3,4.7,4.6,4.2,5.0,4.3,5.0,4.1,4.7,4.2,4.5,4.4,4.9,4.7,4.4,4.6,4.5,4.3,5.0,4.7,4.3,4.4,5.0,4.7,4.9,4.3,4.6,4.2,4.9,5.0,5.0,4.4,5.0,4.9,4.3,4.5,4.3,4.4,4.6,4.1,4.2,4.0,4.5,4.2,4.1,4.3,4.3,4.3,3.9,4.1,4.8,4.4,4.3,4.1,4.8,4.4,4.3,5.0,4.2,4.3,4.3,4.1,4.3,4.3,4.8,4.7,4.5,4.2,4.2,4.3,4.4,4.3,4.0,4.7,4.3,4.5,4.6,4.4,4.4,4.3,4.3,4.4,5.0,4.4,4.1,4.1,4.2,4.1,4.2,4.0,4.9,4.4,4.3,4.4,4.6,4.2,4.5,4.3,4.2,4.4,4.2,4.2,4.3,4.7,5.0,4.4,5.0,4.3,4.3,4.0,5.0,4.4,4.3,4.0,4.4,4.3,4.7,4.7,4.4,4.4,4.6,4.8,4.4,4.5,4.2,4.2,4.6,4.1,4.4,4.3,4.3,4.2,4.2,5.0,3.1,4.5,4.4,4.6,4.8,3.8,4.0,4.3,4.4,4.3,5.0,4.0,4.1,4.4,4.7,4.3,4.4,4.3,4.1,4.3,3.9,4.8,4.3,5.0,3.9,4.1,4.0,4.3,4.1,4.3,4.8,4.6,4.4,3.9,4.4,4.3,4.4,4.3,3.7,4.4,4.1,4.3,4.3,4.5,4.1,4.3,4.4,4.2,4.3,4.1,3.9,4.1,4.5,4.3,4.3,4.1,4.0,4.0,4.2,4.4,4.9,4.3,5.0,4.2,4.3,4.6,3.4,4.6,4.2,4.3,5.0,4.4,4.2,4.4,4.2,4.3,4.0,3.8,3.9,4.2,4.9,4.3,4.2,4.4,4.1,4.2,4.2,4.4,4.6,4.2,4.2,4.4,4.2,4.1,4.1,4.1,4.3,4.1,4.9,4.0,4.4,4.3,4.3,4.2,4.5,4.6,4.3,4.3,4.8,4.3,3.9,4.3,4.1,4.7,5.0,4.9,4.7,4.2,4.4,5.0,4.3,4.1,4.0,4.4,4.1,5.0,4.3,4.3,3.8,4.7,4.9,4.3,4.2,3.4,3.9,4.0,4.1,4.2,4.8,4.3,4.4,4.4,4.2,4.9,4.4,4.1,4.0,4.3,4.3,4.1,4.2,4.6,4.4,4.3,4.2,4.5,4.4,3.2,4.3,4.3,4.4,4.2,4.1,4.6,4.5,3.9,4.2,4.3,4.9,4.0,3.7,3.7,4.4,4.7,4.3,5.0,4.6,4.4,4.2,4.9,4.3,4.3,3.9,4.1,4.1,4.2,4.4,4.1,4.7,4.7,4.1,4.1,4.4,4.0,4.1,4.1,4.1,4.5,4.0,4.2,4.2,4.3,4.2,4.8,4.0,4.2,3.7,4.1,4.2,4.0,4.4,4.0,4.6,5.0,3.9,4.3,3.9,4.2,4.5,4.1,3.9,4.1,4.6,4.4,4.1,4.4,4.5,4.4,4.2,4.4,4.1,4.5,4.3,4.0,4.3,4.5,4.7,4.1,4.5,4.3,4.3,4.5,3.8,4.3,4.1,4.3,4.1,4.0,4.3,3.6,4.9,4.2,4.3,4.1,3.2,4.3,4.2,4.4,4.1,2.5,4.4,4.6,3.2,3.6,4.5,4.0,5.0,3.3,4.8,4.0,4.3,3.9,3.8,3.9,4.0,4.2,4.3,3.9,4.0,3.9,4.2,4.2,4.3,4.8,3.9,3.2,4.0,4.3,4.0,4.2,4.0,4.4,4.7,4.4,4.1,3.9,4.3,4.3,4.4,4.9,4.1,4.1,4.0,4.3,3.7,4.1,4.2,3.7,4.3,4.4,4.1,3.9,4.3,4.2,4.4,4.3,4.4,4.0,3.9,4.8,3.8,4.0,4.0,3.9,4.8,4.2,4.8,4.4,3.9,4.3,4.0,4.2,4.7,4.3,4.2,4.4,4.1,4.4,4.2,4.5,4.5,4.9,4.4,4.2,4.5,4.3,4.0,4.7,4.3,4.8,3.9,4.3,4.6,4.3,4.3,4.3,4.7,4.2,4.3,4.2,5.0,4.6,4.7,4.8,4.0,4.7,4.3,4.3,3.9,4.1,4.1,4.7,4.1,4.3,4.5,3.9,3.9,4.3,4.1,4.1,3.9,4.3,4.3,5.0,4.3,4.3,4.3,4.8,4.5,4.7,4.6,3.8,4.3,4.7,3.9,4.1,4.0,3.9,4.5,4.5,4.0,5.0,4.6,4.3,3.6,4.6,4.2,4.5,4.3,4.0,4.7,4.3,4.3,3.8,4.7,4.4,4.8,4.4,3.6,4.2,4.1,4.4,4.3,4.5,4.1,4.1,3.6,1.3,4.3,4.5,4.7,4.2,4.5,4.1,4.0,4.1,4.2,4.3,4.3,4.1,4.6,4.0,4.2,4.0,4.3,4.4,4.8,4.0,4.3,4.1,4.0,4.4,4.3,4.3,3.1,4.1,3.9,4.2,4.3,4.0,4.3,4.3,4.4,4.8,4.0,4.6,4.7,4.0,4.5,3.8,4.3,5.0,4.3,4.1,4.1,3.2,4.4,4.0,4.0,4.4,4.2,4.2,4.6,3.5,4.7,4.1,4.4,4.0,4.3,3.4,4.4,4.0,3.9,4.4,4.5,4.4,4.6,4.5,4.1,4.3,4.2,4.5,4.3,3.8,4.2,5.0,4.5,4.4,3.8,4.5,4.3,4.6,4.3,4.1,4.1,4.4,4.0,4.3,4.8,4.9,4.3,4.3,4.1,4.3,4.4,4.2,4.1,4.2,4.0,4.3,4.4,4.2,4.4,4.3,4.7,4.3,4.3,4.1,4.8,4.2,4.2,4.5,4.3,4.3,3.6,4.0,4.3,4.6,4.3,4.1,4.7,4.1,4.4,3.8,4.4,3.8,4.3,4.1,4.2,4.4,4.4,4.6,4.3,4.3,4.0,4.3,4.5,4.3,4.9,4.3,4.1,4.5,4.4,4.3,4.3,4.3,4.3,3.6,4.2,4.3,4.0,3.9,4.6,3.9,4.1,4.5,4.0,4.3,4.7,4.1,4.2,4.4,4.5,4.4,4.3,4.3,3.4,4.2,3.7,4.3,4.4,4.4,5.0,4.4,4.4,4.3,4.0,2.0],"reviews":[501,36090,3328,18618,1311,217962,54185,3536,168,108897,91456,172951,37489,126760,91559,27312,164509,11146,13613,33096,53152,4790,33897,112975,67497,214177,40931,91844,45304,13271,24108,30936,5216,38097,22550,12983,7328,31546,6780,56049,38670,32497,4349,17165,18699,26820,7628,10523,11398,9872,17145,34007,17416,63552,26992,2881,103338,4881,29945,19783,34707,19364,25220,10346,3273,7222,3619,19213,8451,11477,11661,17576,46873,2338,2912,18272,3492,132918,1283,13395,2658,11867,3637,42823,16056,46232,6730,8831,9391,6877,5072,61915,6989,10355,6604,40014,1823,20353,3673,6542,2712,2760,138991,88511,2198,7194,488,7002,6747,19171,3715,7176,1934,503,314,37409,550,1214,6833,2130,539,476,879,14461,4484,1486,3609,8782,21185,52597,5348,340,626,564,398,8127,2661,5683,5953,3833,1462,946,1696,209,3418,1022,1319,2087,28949,6752,4060,4893,17247,1388,1914,113722,2945,2152,8357,3464,2085,5515,2001,49735,3376,2433,38654,6081,4283,12974,2345,321,12428,2470,958,7489,722,787,13404,18763,3002,5014,1065,46274,2048,4808,255,10142,5687,10010,6779,3696,11999,10331,2707,3486,8289,1873,1101,11050,974,7532,1985,1415,2010,5076,90579,78,1448,7574,19317,65928,145,1061,2101,6933,7714,7696,307,317,5640,13897,1702,5789,2997,343,1563,717,8606,343,2222,166,1962,145,3023,2132,1724,6847,6727,3611,142,708,753,2728,1044,546,7206,3500,327,1865,17050,582,2911,5539,605,3073,293,419,2400,2645,675,2726,480,73,529,3475,9464,4881,342,24135,2364,4707,1434,16,2368,279,2387,78794,858,1544,6594,504,2146,1243,420,548,1813,26720,1896,7391,2523,962,1988,511,3084,5638,1763,2914,11156,4475,511,327,449,845,1075,11664,836,2160,3734,1706,1104,4077,125,1010,2812,8468,837,1550,1221,1523,15263,81930,6384,5182,2623,3648,16921,1238,1944,452,759,145,9132,3621,899,777,196,35524,1551,1379,373,636,1093,839,522,571,1120,3651,633,1175,29043,366,734,380,548,1513,655,382,9736,483,1456,1110,31,2647,193,1029,2944,370,1064,1030,12244,12205,586,665,349,6841,221,297,251,14785,206,631,5224,10532,1180,3138,5676,258,13,874,143,269,1715,2919,400,6362,413,512,335,70,11,589,376,777,257,2412,141,618,940,216,2396,109,703,221,972,232,62,251,840,19516,2103,104,758,200,466,518,284,123,766,7763,248,57,139,1047,3918,624,835,508,1907,333,353,116,881,14214,131,6970,1030,193,7225,106,1887,243,2238,529,12,2383,263,290,71,255,76,88,210,1949,3470,807,11,518,238,5,127,433,521,15897,7,3724,587,508,3,28,443,485,296,1822,497,145,129,315,403,126,1206,231,92,622,1566,724,820,239,6492,10148,1080,147,191,1255,692,386,25933,754,1150,123,815,766,14,989,88,6,304,252,50,854,1130,119,1670,9938,420,129,13180,271,411,84,360,2362,339,3466,385,37,1320,6,349,3174,2543,80,236,84,574,748,1694,1033,8971,4184,211,1069,474,381,256,524,9113,247,1101,756,626,983,163,5963,15,32,282,51132,1342,388,9455,171,14683,63,1510,267,161,831,4862,183,298,1122,85,135,203,271,421,75,1476,2011,1482,1072,427,66,4203,149,149,2676,74,351,576,515,38,306,4,25,886,913,197,699,148,129,803,24,363,471,349,3447,156,53,299,7479,1143,216,1576,195,550,736,2110,54,4076,116,328,129,360,5937,3651,534,119,1207,52,4,914,531,105,506,151,13349,138,134,5,291,1272,4471,35,709,536,483,4663,1047,1352,6,255,313,94,399,93,120,1155,100,1616,418,1074,242,467,871,213,362,363,260,533,228,12,1627,917,180,214,1255,878,1191,206,160,137,1517,185,473,59,527,86,264,6836,310,197,1201,1044,518,138,283,1206,751,149,110,2648,128,518,165,18,69,607,1599,210,559,108,274,453,12375,750,315,547,218,393,865,1328,414,398,568,923,1909,1105,264,2326,1208,893,1022,159,1328,4,64,4244,891,710,9,54,147,310,269,98,2177,125,1913,105,20,118,477,198,621,1238,1074,1502,162,1811,118,220,1118,512,81,1539,820,1430,3767,858,128,55,3080,230,651,350,376,4,220,96,83,261,223,829,18731,153,197,213,7143,2055,4374,198,156,130,182,112,152,2389,885,1063,463,133,268,4],"color":[3,5,4,5,6,6,8,5,5,5,6,8,8,6,6,5,8,5,4,8,8,4,5,8,8,8,6,8,5,4,5,5,4,5,6,4,5,5,4,8,6,5,5,5,5,5,6,5,5,6,5,6,4,8,6,3,8,5,5,4,4,8,6,5,4,5,4,5,4,4,5,5,5,4,5,5,3,8,4,8,3,5,3,5,4,6,5,4,5,5,4,8,5,4,4,8,5,6,4,5,3,6,8,8,4,8,6,4,5,4,4,5,3,3,2,5,3,3,4,4,4,2,3,5,4,4,3,5,4,4,8,3,4,4,3,4,4,5,5,5,3,3,4,4,4,2,5,4,5,5,4,4,4,4,4,8,4,3,3,3,3,3,2,6,4,4,4,5,3,5,4,3,4,3,3,4,5,8,4,8,4,4,2,8,4,4,2,4,4,5,5,4,4,5,5,4,5,3,3,5,3,4,4,4,3,3,8,1,5,4,5,5,1,2,4,4,4,8,2,3,4,5,4,4,4,3,4,2,5,4,8,2,3,2,4,3,4,5,5,4,2,4,4,4,4,1,4,3,4,4,5,3,4,4,3,4,3,2,3,5,4,4,3,2,2,3,4,6,4,8,3,4,5,1,5,3,4,8,4,3,4,3,4,2,1,2,3,6,4,3,4,3,3,3,4,5,3,3,4,3,3,3,3,4,3,6,2,4,4,4,3,5,5,4,4,5,4,2,4,3,5,8,6,5,3,4,8,4,3,2,4,3,8,4,4,1,5,6,4,3,1,2,2,3,3,5,4,4,4,3,6,4,3,2,4,4,3,3,5,4,4,3,5,4,1,4,4,4,3,3,5,5,2,3,4,6,2,1,1,4,5,4,8,5,4,3,6,4,4,2,3,3,3,4,3,5,5,3,3,4,2,3,3,3,5,2,3,3,4,3,5,2,3,1,3,3,2,4,2,5,8,2,4,2,3,5,3,2,3,5,4,3,4,5,4,3,4,3,5,4,2,4,5,5,3,5,4,4,5,1,4,3,4,3,2,4,1,6,3,4,3,1,4,3,4,3,0,4,5,1,1,5,2,8,1,5,2,4,2,1,2,2,3,4,2,2,2,3,3,4,5,2,1,2,4,2,3,2,4,5,4,3,2,4,4,4,6,3,3,2,4,1,3,3,1,4,4,3,2,4,3,4,4,4,2,2,5,1,2,2,2,5,3,5,4,2,4,2,3,5,4,3,4,3,4,3,5,5,6,4,3,5,4,2,5,4,5,2,4,5,4,4,4,5,3,4,3,8,5,5,5,2,5,4,4,2,3,3,5,3,4,5,2,2,4,3,3,2,4,4,8,4,4,4,5,5,5,5,1,4,5,2,3,2,2,5,5,2,8,5,4,1,5,3,5,4,2,5,4,4,1,5,4,5,4,1,3,3,4,4,5,3,3,1,0,4,5,5,3,5,3,2,3,3,4,4,3,5,2,3,2,4,4,5,2,4,3,2,4,4,4,1,3,2,3,4,2,4,4,4,5,2,5,5,2,5,1,4,8,4,3,3,1,4,2,2,4,3,3,5,1,5,3,4,2,4,1,4,2,2,4,5,4,5,5,3,4,3,5,4,1,3,8,5,4,1,5,4,5,4,3,3,4,2,4,5,6,4,4,3,4,4,3,3,3,2,4,4,3,4,4,5,4,4,3,5,3,3,5,4,4,1,2,4,5,4,3,5,3,4,1,4,1,4,3,3,4,4,5,4,4,2,4,5,4,6,4,3,5,4,4,4,4,4,1,3,4,2,2,5,2,3,5,2,4,5,3,3,4,5,4,4,4,1,3,1,4,4,4,8,4,4,4,2,0],"size":[0,3,1,2,1,7,3,1,0,5,5,6,3,5,5,2,6,2,2,3,3,1,3,5,4,7,3,5,3,2,2,3,1,3,2,2,1,3,1,4,3,3,1,2,2,2,1,2,2,1,2,3,2,4,2,1,5,1,3,2,3,2,2,2,1,1,1,2,1,2,2,2,3,1,1,2,1,5,1,2,1,2,1,3,2,3,1,1,1,1,1,4,1,2,1,3,1,2,1,1,1,1,6,4,1,1,0,1,1,2,1,1,1,0,0,3,0,1,1,1,0,0,0,2,1,1,1,1,2,3,1,0,0,0,0,1,1,1,1,1,1,0,1,0,1,0,1,1,3,1,1,1,2,1,1,5,1,1,1,1,1,1,1,3,1,1,3,1,1,2,1,0,2,1,0,1,0,0,2,2,1,1,0,3,1,1,0,2,1,1,1,1,2,2,1,1,1,1,0,2,0,1,1,1,1,1,5,0,1,1,2,4,0,0,1,1,1,1,0,0,1,2,1,1,1,0,1,0,1,0,1,0,1,0,1,1,1,1,1,1,0,0,0,1,0,0,1,1,0,1,2,0,1,1,0,1,0,0,1,1,0,1,0,0,0,1,1,1,0,2,1,1,1,0,1,0,1,4,0,1,1,0,1,1,0,0,1,2,1,1,1,0,1,0,1,1,1,1,2,1,0,0,0,0,0,2,0,1,1,1,0,1,0,0,1,1,0,1,1,1,2,4,1,1,1,1,2,1,1,0,0,0,1,1,0,0,0,3,1,1,0,0,0,0,0,0,1,1,0,1,3,0,0,0,0,1,0,0,1,0,1,0,0,1,0,0,1,0,0,0,2,2,0,0,0,1,0,0,0,2,0,0,1,2,1,1,1,0,0,0,0,0,1,1,0,1,0,0,0,0,0,0,0,0,0,1,0,0,0,0,1,0,0,0,0,0,0,0,0,2,1,0,0,0,0,0,0,0,0,1,0,0,0,0,1,0,0,0,1,0,0,0,0,2,0,1,0,0,1,0,1,0,1,0,0,1,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,2,0,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,1,0,0,0,1,0,0,0,1,2,0,0,0,1,0,0,2,0,1,0,0,0,0,0,0,0,0,0,0,0,1,0,1,1,0,0,2,0,0,0,0,1,0,1,0,0,1,0,0,1,1,0,0,0,0,0,1,0,1,1,0,0,0,0,0,0,1,0,0,0,0,0,0,1,0,0,0,3,1,0,1,0,2,0,1,0,0,0,1,0,0,1,0,0,0,0,0,0,1,1,1,0,0,0,1,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,1,1,0,1,0,0,0,1,0,1,0,0,0,0,1,1,0,0,1,0,0,0,0,0,0,0,2,0,0,0,0,1,1,0,0,0,0,1,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,1,0,1,0,0,0,1,0,0,0,0,0,0,1,0,0,1,0,0,0,0,1,0,0,0,1,0,0,0,0,0,0,1,0,0,0,0,0,2,0,0,0,0,0,0,1,0,0,0,0,1,0,0,1,1,0,0,0,1,0,0,1,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,1,0,1,0,1,0,0,1,0,0,1,0,1,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,2,0,0,0,1,1,1,0,0,0,0,0,0,1,0,0,0,0,0,0],"icon":[0,1,2,3,4,5,6,7,8,9,10,11,6,10,10,3,11,3,12,6,6,2,1,13,14,15,16,13,1,12,3,1,2,1,17,12,7,1,2,14,16,1,7,3,3,3,4,3,3,4,3,16,12,14,17,18,13,7,1,12,19,20,17,3,2,7,2,3,2,12,3,3,1,2,7,3,18,13,2,20,18,3,18,1,12,16,7,2,7,7,2,14,7,12,2,6,7,17,2,7,18,4,11,14,2,21,22,2,7,12,2,7,18,0,23,1,0,18,2,2,24,23,0,3,2,2,18,7,12,19,21,0,24,24,0,2,2,7,7,7,18,0,2,24,2,23,7,2,1,7,2,2,12,2,2,13,2,18,18,18,18,18,25,16,2,2,19,7,18,3,2,0,12,18,0,2,8,26,12,20,2,2,23,6,2,2,23,12,2,7,7,2,12,3,7,2,7,18,0,3,0,2,2,2,18,18,13,27,7,2,3,28,27,23,2,2,2,21,23,0,2,3,2,2,2,0,2,23,7,24,21,23,18,23,2,18,2,7,7,2,23,24,24,2,24,27,2,18,24,2,3,0,2,2,0,2,0,23,18,7,24,2,0,23,23,18,2,4,24,20,18,2,7,27,7,0,2,14,24,18,2,0,2,25,27,23,18,17,2,18,2,0,18,0,2,7,18,18,12,18,0,0,0,24,0,17,23,2,2,2,0,7,8,24,2,7,24,25,2,18,3,14,4,7,18,2,20,2,18,23,24,0,21,2,24,27,8,16,2,18,27,23,23,0,0,8,2,2,24,18,16,24,0,23,24,2,0,0,7,24,2,0,8,2,27,24,2,24,0,0,3,3,23,0,24,4,23,27,27,12,8,24,21,3,2,18,4,24,24,23,0,0,18,2,0,7,8,0,0,24,23,0,0,0,8,25,0,0,24,0,7,23,0,27,0,0,23,24,23,3,21,23,24,23,0,8,0,23,0,7,24,0,24,8,2,0,24,0,7,24,23,24,8,3,0,7,24,24,7,27,2,0,2,0,23,2,27,22,0,24,0,27,24,18,2,0,29,24,8,27,27,8,23,20,27,7,23,24,23,27,23,23,0,2,23,23,23,0,0,24,7,23,27,23,2,23,0,23,2,3,24,0,23,2,24,24,17,0,18,23,24,27,0,0,27,24,24,0,23,24,18,24,2,2,23,23,3,27,23,23,23,7,0,7,24,23,2,23,0,7,2,0,24,0,24,0,7,8,4,2,0,8,24,23,8,24,7,23,24,8,24,24,24,7,0,24,0,6,7,8,7,23,3,24,2,23,0,0,7,0,24,7,23,23,24,0,0,23,2,2,21,24,24,24,7,8,8,7,27,24,8,23,0,23,23,8,8,23,26,8,24,27,8,0,8,24,23,7,24,24,27,7,2,8,2,27,0,0,2,24,7,0,0,27,29,2,7,8,0,7,0,23,0,0,24,24,0,3,23,0,23,24,2,7,23,24,0,23,2,24,2,27,0,23,0,24,23,24,2,24,7,23,8,8,23,8,27,24,26,24,0,0,27,2,23,23,24,18,0,7,27,8,0,2,23,24,27,24,23,23,2,8,24,7,8,0,24,0,7,24,27,0,21,8,24,27,8,24,8,2,0,0,24,23,24,3,22,24,24,0,24,24,18,0,0,23,24,2,0,24,2,7,24,24,0,7,0,0,7,24,24,27,23,24,8,24,0,7,0,2,27,24,27,24,0,0,2,24,7,24,2,23,24,7,24,22,2,0,7,2,24,24,24,2,27,0,24,23,23,8,23,0,8,23,24,3,0,0,24,7,2,2,24,27,0,27,24,24,2,26,24,24,24,23,29]},"palette":["#600010","#ff0000","#ff6600","#ffcc00","#e1ff00ff","#0ad70aff","#008b00ff","#003c1e","#067198ff"],"sizes":[15,20,25,30,35,40,45,50],"icons":["data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2215%22%20height%3D%2215%22%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%226.5%22%20fill%3D%22%23ffcc00%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%225.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%223.75%22%20fill%3D%22%23ffcc00%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2230%22%20height%3D%2230%22%3E%3Ccircle%20cx%3D%2215.0%22%20cy%3D%2215.0%22%20r%3D%2214.0%22%20fill%3D%22%230ad70aff%22%2F%3E%3Ccircle%20cx%3D%2215.0%22%20cy%3D%2215.0%22%20r%3D%2210.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2215.0%22%20cy%3D%2215.0%22%20r%3D%227.5%22%20fill%3D%22%230ad70aff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2220%22%20height%3D%2220%22%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%229.0%22%20fill%3D%22%23e1ff00ff%22%2F%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%226.666666666666667%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%225.0%22%20fill%3D%22%23e1ff00ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2225%22%20height%3D%2225%22%3E%3Ccircle%20cx%3D%2212.5%22%20cy%3D%2212.5%22%20r%3D%2211.5%22%20fill%3D%22%230ad70aff%22%2F%3E%3Ccircle%20cx%3D%2212.5%22%20cy%3D%2212.5%22%20r%3D%228.333333333333334%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2212.5%22%20cy%3D%2212.5%22%20r%3D%226.25%22%20fill%3D%22%230ad70aff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2220%22%20height%3D%2220%22%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%229.0%22%20fill%3D%22%23008b00ff%22%2F%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%226.666666666666667%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%225.0%22%20fill%3D%22%23008b00ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2250%22%20height%3D%2250%22%3E%3Ccircle%20cx%3D%2225.0%22%20cy%3D%2225.0%22%20r%3D%2224.0%22%20fill%3D%22%23008b00ff%22%2F%3E%3Ccircle%20cx%3D%2225.0%22%20cy%3D%2225.0%22%20r%3D%2216.666666666666668%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2225.0%22%20cy%3D%2225.0%22%20r%3D%2212.5%22%20fill%3D%22%23008b00ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2230%22%20height%3D%2230%22%3E%3Ccircle%20cx%3D%2215.0%22%20cy%3D%2215.0%22%20r%3D%2214.0%22%20fill%3D%22%23067198ff%22%2F%3E%3Ccircle%20cx%3D%2215.0%22%20cy%3D%2215.0%22%20r%3D%2210.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2215.0%22%20cy%3D%2215.0%22%20r%3D%227.5%22%20fill%3D%22%23067198ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2220%22%20height%3D%2220%22%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%229.0%22%20fill%3D%22%230ad70aff%22%2F%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%226.666666666666667%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%225.0%22%20fill%3D%22%230ad70aff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2215%22%20height%3D%2215%22%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%226.5%22%20fill%3D%22%230ad70aff%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%225.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%223.75%22%20fill%3D%22%230ad70aff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2240%22%20height%3D%2240%22%3E%3Ccircle%20cx%3D%2220.0%22%20cy%3D%2220.0%22%20r%3D%2219.0%22%20fill%3D%22%230ad70aff%22%2F%3E%3Ccircle%20cx%3D%2220.0%22%20cy%3D%2220.0%22%20r%3D%2213.333333333333334%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2220.0%22%20cy%3D%2220.0%22%20r%3D%2210.0%22%20fill%3D%22%230ad70aff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2240%22%20height%3D%2240%22%3E%3Ccircle%20cx%3D%2220.0%22%20cy%3D%2220.0%22%20r%3D%2219.0%22%20fill%3D%22%23008b00ff%22%2F%3E%3Ccircle%20cx%3D%2220.0%22%20cy%3D%2220.0%22%20r%3D%2213.333333333333334%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2220.0%22%20cy%3D%2220.0%22%20r%3D%2210.0%22%20fill%3D%22%23008b00ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2245%22%20height%3D%2245%22%3E%3Ccircle%20cx%3D%2222.5%22%20cy%3D%2222.5%22%20r%3D%2221.5%22%20fill%3D%22%23067198ff%22%2F%3E%3Ccircle%20cx%3D%2222.5%22%20cy%3D%2222.5%22%20r%3D%2215.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2222.5%22%20cy%3D%2222.5%22%20r%3D%2211.25%22%20fill%3D%22%23067198ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2225%22%20height%3D%2225%22%3E%3Ccircle%20cx%3D%2212.5%22%20cy%3D%2212.5%22%20r%3D%2211.5%22%20fill%3D%22%23e1ff00ff%22%2F%3E%3Ccircle%20cx%3D%2212.5%22%20cy%3D%2212.5%22%20r%3D%228.333333333333334%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2212.5%22%20cy%3D%2212.5%22%20r%3D%226.25%22%20fill%3D%22%23e1ff00ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2240%22%20height%3D%2240%22%3E%3Ccircle%20cx%3D%2220.0%22%20cy%3D%2220.0%22%20r%3D%2219.0%22%20fill%3D%22%23067198ff%22%2F%3E%3Ccircle%20cx%3D%2220.0%22%20cy%3D%2220.0%22%20r%3D%2213.333333333333334%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2220.0%22%20cy%3D%2220.0%22%20r%3D%2210.0%22%20fill%3D%22%23067198ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2235%22%20height%3D%2235%22%3E%3Ccircle%20cx%3D%2217.5%22%20cy%3D%2217.5%22%20r%3D%2216.5%22%20fill%3D%22%23067198ff%22%2F%3E%3Ccircle%20cx%3D%2217.5%22%20cy%3D%2217.5%22%20r%3D%2211.666666666666666%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2217.5%22%20cy%3D%2217.5%22%20r%3D%228.75%22%20fill%3D%22%23067198ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2250%22%20height%3D%2250%22%3E%3Ccircle%20cx%3D%2225.0%22%20cy%3D%2225.0%22%20r%3D%2224.0%22%20fill%3D%22%23067198ff%22%2F%3E%3Ccircle%20cx%3D%2225.0%22%20cy%3D%2225.0%22%20r%3D%2216.666666666666668%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2225.0%22%20cy%3D%2225.0%22%20r%3D%2212.5%22%20fill%3D%22%23067198ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2230%22%20height%3D%2230%22%3E%3Ccircle%20cx%3D%2215.0%22%20cy%3D%2215.0%22%20r%3D%2214.0%22%20fill%3D%22%23008b00ff%22%2F%3E%3Ccircle%20cx%3D%2215.0%22%20cy%3D%2215.0%22%20r%3D%2210.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2215.0%22%20cy%3D%2215.0%22%20r%3D%227.5%22%20fill%3D%22%23008b00ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2225%22%20height%3D%2225%22%3E%3Ccircle%20cx%3D%2212.5%22%20cy%3D%2212.5%22%20r%3D%2211.5%22%20fill%3D%22%23008b00ff%22%2F%3E%3Ccircle%20cx%3D%2212.5%22%20cy%3D%2212.5%22%20r%3D%228.333333333333334%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2212.5%22%20cy%3D%2212.5%22%20r%3D%226.25%22%20fill%3D%22%23008b00ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2220%22%20height%3D%2220%22%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%229.0%22%20fill%3D%22%23ffcc00%22%2F%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%226.666666666666667%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%225.0%22%20fill%3D%22%23ffcc00%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2230%22%20height%3D%2230%22%3E%3Ccircle%20cx%3D%2215.0%22%20cy%3D%2215.0%22%20r%3D%2214.0%22%20fill%3D%22%23e1ff00ff%22%2F%3E%3Ccircle%20cx%3D%2215.0%22%20cy%3D%2215.0%22%20r%3D%2210.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2215.0%22%20cy%3D%2215.0%22%20r%3D%227.5%22%20fill%3D%22%23e1ff00ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2225%22%20height%3D%2225%22%3E%3Ccircle%20cx%3D%2212.5%22%20cy%3D%2212.5%22%20r%3D%2211.5%22%20fill%3D%22%23067198ff%22%2F%3E%3Ccircle%20cx%3D%2212.5%22%20cy%3D%2212.5%22%20r%3D%228.333333333333334%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2212.5%22%20cy%3D%2212.5%22%20r%3D%226.25%22%20fill%3D%22%23067198ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2220%22%20height%3D%2220%22%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%229.0%22%20fill%3D%22%23067198ff%22%2F%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%226.666666666666667%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%225.0%22%20fill%3D%22%23067198ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2215%22%20height%3D%2215%22%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%226.5%22%20fill%3D%22%23008b00ff%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%225.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%223.75%22%20fill%3D%22%23008b00ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2215%22%20height%3D%2215%22%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%226.5%22%20fill%3D%22%23ff6600%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%225.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%223.75%22%20fill%3D%22%23ff6600%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2215%22%20height%3D%2215%22%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%226.5%22%20fill%3D%22%23e1ff00ff%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%225.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%223.75%22%20fill%3D%22%23e1ff00ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2220%22%20height%3D%2220%22%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%229.0%22%20fill%3D%22%23ff6600%22%2F%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%226.666666666666667%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2210.0%22%20cy%3D%2210.0%22%20r%3D%225.0%22%20fill%3D%22%23ff6600%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2215%22%20height%3D%2215%22%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%226.5%22%20fill%3D%22%23067198ff%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%225.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%223.75%22%20fill%3D%22%23067198ff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2215%22%20height%3D%2215%22%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%226.5%22%20fill%3D%22%23ff0000%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%225.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%223.75%22%20fill%3D%22%23ff0000%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2235%22%20height%3D%2235%22%3E%3Ccircle%20cx%3D%2217.5%22%20cy%3D%2217.5%22%20r%3D%2216.5%22%20fill%3D%22%230ad70aff%22%2F%3E%3Ccircle%20cx%3D%2217.5%22%20cy%3D%2217.5%22%20r%3D%2211.666666666666666%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%2217.5%22%20cy%3D%2217.5%22%20r%3D%228.75%22%20fill%3D%22%230ad70aff%22%2F%3E%3C%2Fsvg%3E","data:image/svg+xml;charset=utf-8,%3Csvg%20xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22%20width%3D%2215%22%20height%3D%2215%22%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%226.5%22%20fill%3D%22%23600010%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%225.0%22%20fill%3D%22white%22%2F%3E%3Ccircle%20cx%3D%227.5%22%20cy%3D%227.5%22%20r%3D%223.75%22%20fill%3D%22%23600010%22%2F%3E%3C%2Fsvg%3E"]};
@@ -4,6 +4,18 @@ let map, objectManager;
 let minSize = 15, maxSize = 50;
 let circleCache = {};
 
+// map.html?mode=tiles - загрузка заранее посчитанных кластеров (build_map_tiles.py) только для видимых тайлов.
+// Тайлы читаются через fetch, поэтому страницу нужно открывать через http-сервер
+const TILE_MODE = new URLSearchParams(window.location.search).get('mode') === 'tiles';
+const TILES_URL = 'tiles';
+let tileMeta = null;
+let loadedTiles = new Map();  // "z/x/y" -> id объектов тайла
+let tileRequest = 0;
+
+// Размеры кружков, для которых построены иконки mapBundle (data.js)
+let bundleIconSizes = null;
+let sizeParamRange = null;
+
 async function initMap() {
     // Создаем карту
     map = new ymaps.Map('map', {
@@ -11,9 +23,9 @@ async function initMap() {
         zoom: 10
     });
     
-    // Создаем ObjectManager с кластеризацией
+    // Создаем ObjectManager с кластеризацией (в режиме тайлов кластеры уже посчитаны)
     objectManager = new ymaps.ObjectManager({
-        clusterize: true,
+        clusterize: !TILE_MODE,
         gridSize: 64,
         clusterDisableClickZoom: true
     });
@@ -41,12 +53,22 @@ async function initMap() {
     objectManager.objects.events.add('click', function (e) {
         const objectId = e.get('objectId');
         const object = objectManager.objects.getById(objectId);
+
+        // Для данных из mapBundle HTML балуна собирается при первом открытии
+        if (object && !object.properties.balloonContent) {
+            object.properties.balloonContent = companyBalloonHTML({...object.properties, id: object.properties.yandexId});
+        }
         
         // Открываем балун для объекта
         objectManager.objects.balloon.open(objectId);
     });
     
     map.geoObjects.add(objectManager);
+
+    if (TILE_MODE) {
+        await initTileLoading();
+        return;
+    }
     
     // Загружаем и отображаем компании
     await loadAndDisplayCompanies();
@@ -66,7 +88,47 @@ async function initMap() {
     });
 }
 
+function displayBundle() {
+    // Данные по столбцам с готовыми индексами иконок из build_map_bundle.py
+    const columns = mapBundle.columns;
+    const features = new Array(mapBundle.count);
+    for (let i = 0; i < mapBundle.count; i++) {
+        const icon = mapBundle.icons[columns.icon[i]];
+        const size = mapBundle.sizes[columns.size[i]];
+        features[i] = {
+            type: 'Feature',
+            id: i,
+            geometry: {type: 'Point', coordinates: [columns.lat[i], columns.lon[i]]},
+            properties: {
+                name: columns.name[i] || `Компания ${columns.id[i]}`,
+                yandexId: columns.id[i],
+                averageRating: columns.rating[i],
+                reviewsNum: columns.reviews[i],
+                // Балун собирается при открытии, а не для каждой точки заранее
+                balloonContent: ''
+            },
+            options: {
+                iconImageHref: icon,
+                iconImageSize: [size, size],
+                iconImageOffset: [-size / 2, -size / 2]
+            }
+        };
+    }
+    objectManager.add({type: 'FeatureCollection', features});
+    bundleIconSizes = [minSize, maxSize];
+
+    if (features.length > 0) {
+        map.setBounds(objectManager.getBounds(), {checkZoomRange: true});
+    }
+    console.log(`Загружено ${features.length} компаний`);
+}
+
 async function loadAndDisplayCompanies() {
+    if (typeof mapBundle !== 'undefined') {
+        displayBundle();
+        return;
+    }
+
     const features = [];
     
     // Обрабатываем пачками по batchSize штук
@@ -94,19 +156,7 @@ async function loadAndDisplayCompanies() {
                 const color = getColorByValue(averageRating);
                 
                 // Формируем HTML для балуна 
-                const balloonHTML = `
-                    <div style="padding: 10px; font-family: Arial, sans-serif;">
-                        <h3 style="margin: 0 0 10px 0;">${company.name || 'Компания'}</h3>
-                        <p style="margin: 5px 0;">Рейтинг: <strong>${company.averageRating}</strong></p>
-                        ${company.reviewsNum !== undefined ? `<p style="margin: 5px 0;">Всего отзывов: <strong>${company.reviewsNum}</strong></p>` : ''}
-                        <p style="margin: 5px 0;">ID: ${company.id}</p>
-                        <a href="https://yandex.ru/maps/org/${company.id}" 
-                           target="_blank" 
-                           style="display: inline-block; margin-top: 10px; padding: 5px 10px; background: #f33; color: white; text-decoration: none; border-radius: 3px;">
-                            Открыть в Яндекс.Картах
-                        </a>
-                    </div>
-                `;
+                const balloonHTML = companyBalloonHTML(company);
                 
                 features.push({
                     type: 'Feature',
@@ -147,6 +197,122 @@ async function loadAndDisplayCompanies() {
     console.log(`Загружено ${features.length} компаний из ${companyData.length}`);
 }
 
+function companyBalloonHTML(company) {
+    return `
+        <div style="padding: 10px; font-family: Arial, sans-serif;">
+            <h3 style="margin: 0 0 10px 0;">${company.name || 'Компания'}</h3>
+            <p style="margin: 5px 0;">Рейтинг: <strong>${company.averageRating}</strong></p>
+            ${company.reviewsNum !== undefined ? `<p style="margin: 5px 0;">Всего отзывов: <strong>${company.reviewsNum}</strong></p>` : ''}
+            <p style="margin: 5px 0;">ID: ${company.id}</p>
+            <a href="https://yandex.ru/maps/org/${company.id}" 
+               target="_blank" 
+               style="display: inline-block; margin-top: 10px; padding: 5px 10px; background: #f33; color: white; text-decoration: none; border-radius: 3px;">
+                Открыть в Яндекс.Картах
+            </a>
+        </div>
+    `;
+}
+
+async function initTileLoading() {
+    tileMeta = await fetch(`${TILES_URL}/meta.json`).then(response => response.json());
+    if (tileMeta.bounds) {
+        map.setBounds(tileMeta.bounds, {checkZoomRange: true});
+    }
+    map.events.add('boundschange', loadVisibleTiles);
+    await loadVisibleTiles();
+}
+
+function visibleTiles(zoom) {
+    // Тайлы, которые пересекает видимая область, в пиксельных координатах масштаба zoom
+    const projection = map.options.get('projection');
+    const [[south, west], [north, east]] = map.getBounds();
+    const [left, top] = projection.toGlobalPixels([north, west], zoom);
+    const [right, bottom] = projection.toGlobalPixels([south, east], zoom);
+    const last = Math.pow(2, zoom) - 1;
+    const clamp = value => Math.max(0, Math.min(last, Math.floor(value / tileMeta.tileSize)));
+
+    const tiles = [];
+    for (let x = clamp(left); x <= clamp(right); x++) {
+        for (let y = clamp(top); y <= clamp(bottom); y++) {
+            tiles.push([x, y]);
+        }
+    }
+    return tiles;
+}
+
+async function loadVisibleTiles() {
+    const request = ++tileRequest;
+    const zoom = Math.max(tileMeta.minZoom, Math.min(tileMeta.maxZoom, Math.round(map.getZoom())));
+
+    // Кластеры другого масштаба больше не нужны
+    for (const [key, ids] of loadedTiles) {
+        if (!key.startsWith(`${zoom}/`)) {
+            ids.forEach(id => objectManager.remove(id));
+            loadedTiles.delete(key);
+        }
+    }
+
+    const missing = visibleTiles(zoom).filter(([x, y]) => !loadedTiles.has(`${zoom}/${x}/${y}`));
+    const collections = await Promise.all(missing.map(([x, y]) =>
+        fetch(`${TILES_URL}/${zoom}/${x}/${y}.json`)
+            // Пустые тайлы не записываются - 404 означает отсутствие объектов
+            .then(response => response.ok ? response.json() : {features: []})
+            .catch(() => ({features: []}))
+    ));
+
+    // Пока ждали ответы, карту успели сдвинуть - результат устарел
+    if (request !== tileRequest) {
+        return;
+    }
+
+    const features = [];
+    collections.forEach((collection, index) => {
+        const [x, y] = missing[index];
+        const tileFeatures = collection.features.map(styleTileFeature);
+        loadedTiles.set(`${zoom}/${x}/${y}`, tileFeatures.map(feature => feature.id));
+        features.push(...tileFeatures);
+    });
+    if (features.length > 0) {
+        objectManager.add({type: 'FeatureCollection', features});
+    }
+}
+
+function styleTileFeature(feature) {
+    const props = feature.properties;
+    const color = getColorByValue(props.averageRating || 0);
+
+    if (props.cluster) {
+        const size = Math.round(Math.min(60, 24 + 8 * Math.log10(props.count)));
+        feature.options = {
+            iconLayout: 'default#imageWithContent',
+            iconImageHref: getCircleImageUrl(color, size),
+            iconImageSize: [size, size],
+            iconImageOffset: [-size / 2, -size / 2],
+            iconContentLayout: ymaps.templateLayoutFactory.createClass(
+                '<div style="line-height: ' + size + 'px; text-align: center; font-size: 11px; font-weight: bold;">{{ properties.count }}</div>'
+            )
+        };
+        props.name = `Мест: ${props.count}`;
+        props.balloonContent = `
+            <div style="padding: 10px; font-family: Arial, sans-serif;">
+                <p style="margin: 5px 0;">Средний рейтинг: <strong>${props.averageRating ?? '—'}</strong></p>
+                <p style="margin: 5px 0;">Всего отзывов: <strong>${props.reviewsNum}</strong></p>
+            </div>
+        `;
+        return feature;
+    }
+
+    const maxReviews = tileMeta.maxReviews || 1;
+    const size = Math.round(minSize + Math.sqrt((props.reviewsNum || 0) / maxReviews) * (maxSize - minSize));
+    feature.options = {
+        iconImageHref: getCircleImageUrl(color, size),
+        iconImageSize: [size, size],
+        iconImageOffset: [-size / 2, -size / 2]
+    };
+    props.balloonContent = companyBalloonHTML({...props, id: props.yandexId});
+    return feature;
+}
+
 async function getCompanyCoordinates(yandexId, companyObj) {
     if (companyObj && companyObj.coords) {
         const cacheKey = `yandex_coords_${yandexId}`;
@@ -165,7 +331,37 @@ async function getCompanyCoordinates(yandexId, companyObj) {
     return null;
 }
 
+function updateBundleSizes() {
+    // Цвета и ступени размеров уже посчитаны - перестраиваем только общий набор иконок
+    if (bundleIconSizes && bundleIconSizes[0] === minSize && bundleIconSizes[1] === maxSize) {
+        return;
+    }
+    const steps = mapBundle.sizes.length - 1;
+    const sizes = mapBundle.sizes.map((_, bucket) => Math.round(minSize + bucket / steps * (maxSize - minSize)));
+    const icons = {};
+    const columns = mapBundle.columns;
+
+    objectManager.objects.each(function (obj) {
+        const i = obj.id;
+        const key = columns.icon[i];
+        const size = sizes[columns.size[i]];
+        if (!(key in icons)) {
+            icons[key] = getCircleImageUrl(mapBundle.palette[columns.color[i]], size);
+        }
+        objectManager.objects.setObjectOptions(i, {
+            iconImageSize: [size, size],
+            iconImageHref: icons[key],
+            iconImageOffset: [-size / 2, -size / 2]
+        });
+    });
+    bundleIconSizes = [minSize, maxSize];
+}
+
 function updateCircleSizes() {
+    if (typeof mapBundle !== 'undefined' && !TILE_MODE) {
+        updateBundleSizes();
+        return;
+    }
     console.log('Обновление размеров и цветов...');
     
     // Получаем все объекты
@@ -194,10 +390,17 @@ function updateCircleSizes() {
 
 // Расчет размера от reviewsNum
 function calculateSizeFromParam(reviewsNum, min, max) {
-    // Получаем все reviewsNum из данных
-    const allSizeParams = companyData.map(c => c.reviewsNum !== undefined ? c.reviewsNum : c.averageRating);
-    const minParam = Math.min(...allSizeParams);
-    const maxParam = Math.max(...allSizeParams);
+    // Диапазон reviewsNum по всем данным считаем один раз
+    if (sizeParamRange === null) {
+        let minParam = Infinity, maxParam = -Infinity;
+        for (const c of companyData) {
+            const value = c.reviewsNum !== undefined ? c.reviewsNum : c.averageRating;
+            minParam = Math.min(minParam, value);
+            maxParam = Math.max(maxParam, value);
+        }
+        sizeParamRange = [minParam, maxParam];
+    }
+    const [minParam, maxParam] = sizeParamRange;
     
     // Защита от деления на ноль
     if (maxParam === minParam) return (min + max) / 2;
@@ -206,9 +409,7 @@ function calculateSizeFromParam(reviewsNum, min, max) {
     const normalized = Math.sqrt((reviewsNum - minParam) / (maxParam - minParam));
     
     // Линейная интерполяция между min и max
-    const size = min + normalized * (max - min);
-    console.log(`reviewsNum: ${reviewsNum}, size: ${size}`);
-    return size;
+    return min + normalized * (max - min);
 }
 
 function getCircleImageUrl(color, size) {
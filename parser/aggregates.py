@@ -0,0 +1,145 @@
+# file name: parser/aggregates.py
+import csv
+import json
+import logging
+import os
+
+from parser.places import PLACES_CSV_FIELDS, place_to_row
+from parser.writer import committed_offset
+
+logger = logging.getLogger(__name__)
+
+# Результат пересчета пишется отдельно от справочника мест, из которого он читается
+AGGREGATED_CSV = 'places_aggregated.csv'
+AGGREGATED_JSON = os.path.join('data', 'places_aggregated.json')
+AGGREGATED_CSV_FIELDS = PLACES_CSV_FIELDS + ['collectedRating', 'collectedReviews']
+
+
+class PlaceStats:
+    """Накопленные оценки одного места: сумма, количество и гистограмма 1..5"""
+
+    __slots__ = ('total', 'count', 'histogram', 'newest')
+
+    def __init__(self, total: int = 0, count: int = 0, histogram=None, newest: str = None):
+        self.total = total
+        self.count = count
+        self.histogram = histogram or [0] * 5
+        self.newest = newest
+
+    def add(self, rating: int, date: str = None):
+        if rating:
+            self.total += rating
+            self.count += 1
+            self.histogram[rating - 1] += 1
+        if date and (self.newest is None or date > self.newest):
+            self.newest = date
+
+    @property
+    def average(self) -> float or None:
+        return round(self.total / self.count, 1) if self.count else None
+
+    def to_list(self) -> list:
+        return [self.total, self.count, self.histogram, self.newest]
+
+
+class AggregateStore:
+    """
+    Агрегаты отзывов по place_id с сохранением в JSON. Обновляются только новыми
+    пачками: для JSON Lines запоминается, до какого смещения файл уже учтен
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.places = {}
+        # Путь к .jsonl -> смещение, до которого отзывы уже учтены
+        self.offsets = {}
+        if os.path.exists(filepath):
+            with open(filepath, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.places = {int(pid): PlaceStats(*values) for pid, values in state.get('places', {}).items()}
+            self.offsets = state.get('offsets', {})
+            logger.debug(f"Агрегаты {filepath}: {len(self.places)} мест")
+
+    def add(self, records):
+        """Учет пачки отзывов"""
+        for record in records:
+            place_id = record.get('place_id')
+            if place_id is None:
+                continue
+            rating = record.get('review_rating')
+            stats = self.places.get(place_id)
+            if stats is None:
+                stats = self.places[place_id] = PlaceStats()
+            stats.add(int(float(rating)) if rating else None, record.get('datetime'))
+
+    def sync_jsonl(self, filepath: str) -> int:
+        """Учет отзывов, дописанных в .jsonl после прошлой синхронизации"""
+        key = os.path.abspath(filepath)
+        start = self.offsets.get(key, 0)
+        end = committed_offset(filepath)
+        if end is None:
+            end = os.path.getsize(filepath)
+        if end < start:
+            # Файл пересоздан - прежние агрегаты по нему недействительны
+            raise ValueError(f"{filepath} короче учтенного смещения {start}, нужен пересчет с нуля")
+
+        count = 0
+        with open(filepath, 'rb') as f:
+            f.seek(start)
+            while f.tell() < end:
+                line = f.readline()
+                if not line:
+                    break
+                if line.strip():
+                    self.add([json.loads(line)])
+                    count += 1
+        self.offsets[key] = end
+        return count
+
+    def save(self):
+        state = {
+            'places': {str(pid): stats.to_list() for pid, stats in self.places.items()},
+            'offsets': self.offsets,
+        }
+        tmp_path = self.filepath + '.tmp'
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.filepath)
+
+    def apply(self, places) -> list:
+        """
+        Места с collectedRating/collectedReviews по собранным отзывам.
+        Заявленные averageRating/reviewsNum заменяются только для мест, собранных
+        целиком: на них опираются приоритет очереди и лимиты прокрутки
+        """
+        result = []
+        for place in places:
+            stats = self.places.get(int(place['id']))
+            if stats is not None and stats.count:
+                place = {**place, 'collectedRating': stats.average, 'collectedReviews': stats.count}
+                reported = place.get('reviewsNum')
+                if reported is None or stats.count >= reported:
+                    place.update(averageRating=stats.average, reviewsNum=stats.count)
+            result.append(place)
+        return result
+
+
+def write_places_json(places, filepath: str):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(places, f, ensure_ascii=False, indent=2)
+
+
+def write_places_csv(places, filepath: str):
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=AGGREGATED_CSV_FIELDS)
+        writer.writeheader()
+        for place in places:
+            writer.writerow({
+                **place_to_row(place),
+                'collectedRating': place.get('collectedRating'),
+                'collectedReviews': place.get('collectedReviews'),
+            })
+
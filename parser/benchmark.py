@@ -0,0 +1,361 @@
+# file name: parser/benchmark.py
+import datetime as dt
+import json
+import logging
+import os
+import platform
+import re
+import resource
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from parser import main
+from parser import selenium_helper as sh
+from parser import smart_parser, state_parser
+from parser.driver_pool import browser_rss_mb
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 50
+ORG_PATH_RE = re.compile(r'^/maps/org/[^/]+/(\d+)/reviews/?$')
+BASE_TIME = dt.datetime(2025, 11, 1, tzinfo=dt.timezone.utc)
+
+# Размер фикстуры задается id организации: у организации N ровно N отзывов
+DEFAULT_SIZES = (10, 1000, 30000)
+BATCH_MODE = 'batch_smart'
+
+
+def fixture_review(org_id: int, index: int) -> dict:
+    """Отзыв index организации org_id в формате state-view (от новых к старым)"""
+    moment = BASE_TIME - dt.timedelta(minutes=index)
+    return {
+        'reviewId': f'{org_id}-{index}',
+        'businessId': str(org_id),
+        'rating': index * 7 % 5 + 1,
+        'updatedTime': moment.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+    }
+
+
+def fixture_page_reviews(org_id: int, page: int, page_size: int = PAGE_SIZE) -> list:
+    start = page * page_size
+    return [fixture_review(org_id, i) for i in range(start, min(start + page_size, org_id))]
+
+
+REVIEW_CARD = (
+    '<div class="business-reviews-card-view__review">'
+    '<div class="business-review-view__info">'
+    '<div class="business-review-view__author">Автор {index}</div>'
+    '<div class="business-review-view__rating">'
+    '<div class="business-rating-badge-view" itemprop="reviewRating" itemscope itemtype="http://schema.org/Rating">'
+    '<meta itemprop="ratingValue" content="{rating}.0"></div></div>'
+    '<span class="business-review-view__date"><meta itemprop="datePublished" content="{date}">'
+    '<span>{date}</span></span>'
+    '<div class="business-review-view__body" style="height: 120px">Текст отзыва {index}</div>'
+    '</div></div>'
+)
+
+# Бесконечная прокрутка как на Яндекс Картах: у конца списка страница запрашивает
+# fetchReviews и дорисовывает карточки
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Фикстура {org_id}</title></head>
+<body style="margin: 0">
+<div class="scroll__container" style="height: 700px; overflow-y: auto">
+<h2 class="card-section-header__title _wide">Отзывы • {total_text}</h2>
+<div class="business-reviews-card-view__reviews-container">{cards}</div>
+<div class="fixture-loader" style="height: 1px"></div>
+</div>
+<script class="state-view" type="application/json">{state}</script>
+<script>
+(function() {{
+    const orgId = {org_id};
+    const total = {org_id};
+    let page = 1;
+    let loaded = {loaded};
+    let loading = false;
+    const box = document.querySelector('.scroll__container');
+    const list = document.querySelector('.business-reviews-card-view__reviews-container');
+    const loader = document.querySelector('.fixture-loader');
+    const card = {card_js};
+
+    function nearBottom() {{
+        return loader.getBoundingClientRect().top - box.getBoundingClientRect().bottom < 1500;
+    }}
+
+    function maybeLoad() {{
+        if (loading || loaded >= total || !nearBottom()) return;
+        loading = true;
+        fetch('/maps/api/business/fetchReviews?businessId=' + orgId + '&page=' + page)
+            .then(response => response.text())
+            .then(text => {{
+                const reviews = JSON.parse(text).data.reviews;
+                list.insertAdjacentHTML('beforeend', reviews.map(card).join(''));
+                page += 1;
+                loaded += reviews.length;
+                loading = false;
+                // Список после очистки DOM может остаться коротким
+                maybeLoad();
+            }});
+    }}
+
+    box.addEventListener('scroll', maybeLoad);
+    window.addEventListener('scroll', maybeLoad);
+}})();
+</script>
+</body></html>
+"""
+
+CARD_JS = (
+    "(r, i) => `" + REVIEW_CARD.replace('{index}', '${r.reviewId}')
+    .replace('{rating}', '${r.rating}').replace('{date}', '${r.updatedTime}') + "`"
+)
+
+
+def render_fixture_page(org_id: int) -> str:
+    reviews = fixture_page_reviews(org_id, 0)
+    cards = ''.join(
+        REVIEW_CARD.format(index=r['reviewId'], rating=r['rating'], date=r['updatedTime']) for r in reviews
+    )
+    state = json.dumps({'stack': [{'results': {'reviews': reviews}}]}).replace('</', '<\\/')
+    return PAGE_TEMPLATE.format(
+        org_id=org_id,
+        total_text=f'{org_id:,}'.replace(',', ' '),
+        cards=cards,
+        loaded=len(reviews),
+        state=state,
+        card_js=CARD_JS,
+    )
+
+
+class FixtureServer:
+    """Локальный HTTP-сервер со страницами отзывов и ответами fetchReviews"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                url = urlparse(self.path)
+                match = ORG_PATH_RE.match(url.path)
+                if match:
+                    self._send(render_fixture_page(int(match.group(1))), 'text/html')
+                elif url.path == '/maps/api/business/fetchReviews':
+                    query = parse_qs(url.query)
+                    reviews = fixture_page_reviews(int(query['businessId'][0]), int(query['page'][0]))
+                    if server.latency:
+                        time.sleep(server.latency)
+                    self._send(json.dumps({'data': {'reviews': reviews}}), 'application/json')
+                else:
+                    self.send_error(404)
+
+            def _send(self, body: str, content_type: str):
+                payload = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.httpd.server_address[1]}'
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class RoundTripCounter:
+    """Подсчет команд WebDriver: все вызовы идут через driver.execute"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.calls = 0
+        self._original = driver.execute
+
+        def execute(*args, **kwargs):
+            self.calls += 1
+            return self._original(*args, **kwargs)
+
+        driver.execute = execute
+
+    def close(self):
+        self.driver.execute = self._original
+
+
+class RssSampler(threading.Thread):
+    """Пиковый RSS браузера с опросом раз в interval секунд"""
+
+    def __init__(self, driver, interval: float = 0.2):
+        super().__init__(daemon=True)
+        self.driver = driver
+        self.interval = interval
+        self.peak = None
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            rss = browser_rss_mb(self.driver)
+            if rss is not None:
+                self.peak = max(self.peak or 0.0, rss)
+            self._stop_event.wait(self.interval)
+
+    def stop(self) -> float or None:
+        self._stop_event.set()
+        self.join()
+        return self.peak
+
+
+def _count_reviews(mode: str, result, filepath: str) -> int:
+    if isinstance(result, list):
+        return len(result)
+    data = main.load_json(filepath)
+    if mode == 'experimental':
+        # Режим сохраняет JSON состояния целиком
+        return sum(1 for _ in state_parser.iter_state_reviews(data))
+    return len(data or [])
+
+
+def run_mode(driver, mode: str, size: int, limit: int = None) -> dict:
+    """Один прогон режима по фикстуре из size отзывов"""
+    filepath = os.path.join(tempfile.mkdtemp(prefix='bench_'), 'reviews.json')
+    counter = RoundTripCounter(driver)
+    sampler = RssSampler(driver)
+    sampler.start()
+    error = None
+    reviews = 0
+
+    started = time.perf_counter()
+    try:
+        if mode == BATCH_MODE:
+            # Как parse_single_org_smart в run_batch.py: отзывы сразу в память
+            sh.navigate(driver, main.organization_url(size), throttled=False)
+            result = smart_parser.collect_reviews(driver, org_id=size, limit=limit)
+        else:
+            result = main.get_organization_reviews(
+                driver=driver, mode=mode, org_id=size, limit=limit, output_path=filepath
+            )
+        reviews = _count_reviews(mode, result, filepath)
+    except Exception as e:
+        logger.error(f"Бенчмарк {mode} на {size} отзывах: {e}")
+        error = str(e)
+    wall = time.perf_counter() - started
+    calls = counter.calls
+    counter.close()
+    peak_rss = sampler.stop()
+
+    return {
+        'mode': mode,
+        'size': size,
+        'reviews': reviews,
+        'wall_s': round(wall, 3),
+        'reviews_per_s': round(reviews / wall, 2) if wall > 0 else None,
+        'webdriver_calls': calls,
+        'calls_per_review': round(calls / reviews, 3) if reviews else None,
+        'browser_peak_rss_mb': round(peak_rss, 1) if peak_rss is not None else None,
+        'error': error,
+    }
+
+
+def _git_revision() -> str or None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(driver, modes, sizes=DEFAULT_SIZES, limit: int = None, latency: float = 0.0,
+              politeness: float = 0.0) -> dict:
+    """
+    Прогон режимов по локальным фикстурам. Фиксированные паузы парсера
+    (вежливость, повтор поиска элемента) подменяются на время прогона
+    """
+    saved = (main.BASE_URL, sh.POLITENESS_DELAY, sh.RETRY_DELAY)
+    sh.set_politeness_delay(politeness)
+    sh.RETRY_DELAY = 0
+    runs = []
+    try:
+        with FixtureServer(latency=latency) as server:
+            main.BASE_URL = server.url
+            for size in sizes:
+                for mode in modes:
+                    logger.info(f"Бенчмарк: {mode}, {size} отзывов")
+                    run = run_mode(driver, mode, size, limit)
+                    logger.info(
+                        f"{mode} / {size}: {run['reviews']} отзывов за {run['wall_s']} сек, "
+                        f"{run['webdriver_calls']} команд WebDriver"
+                    )
+                    runs.append(run)
+    finally:
+        main.BASE_URL, _, sh.RETRY_DELAY = saved
+        sh.set_politeness_delay(saved[1])
+
+    return {
+        'started': dt.datetime.now(dt.timezone.utc).isoformat(timespec='seconds'),
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'politeness': politeness,
+        'latency': latency,
+        'python_peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'runs': runs,
+    }
+
+
+def compare_runs(previous: dict, current: dict, threshold: float = 0.2) -> list:
+    """Регрессии относительно прошлого прогона: скорость ниже или команд больше на threshold"""
+    before = {(r['mode'], r['size']): r for r in previous.get('runs', [])}
+    regressions = []
+    for run in current['runs']:
+        old = before.get((run['mode'], run['size']))
+        if not old or run['error'] or old['error']:
+            continue
+        if old['reviews_per_s'] and run['reviews_per_s'] is not None \
+                and run['reviews_per_s'] < old['reviews_per_s'] * (1 - threshold):
+            regressions.append(
+                f"{run['mode']} / {run['size']}: {old['reviews_per_s']} -> {run['reviews_per_s']} отзывов/сек"
+            )
+        if old['calls_per_review'] and run['calls_per_review'] is not None \
+                and run['calls_per_review'] > old['calls_per_review'] * (1 + threshold):
+            regressions.append(
+                f"{run['mode']} / {run['size']}: {old['calls_per_review']} -> {run['calls_per_review']} команд на отзыв"
+            )
+    return regressions
+
+
+def save_results(results: dict, directory: str) -> str:
+    """Результат прогона отдельным файлом и строкой в history.jsonl"""
+    os.makedirs(directory, exist_ok=True)
+    stamp = results['started'].replace(':', '').replace('-', '').split('+')[0]
+    path = os.path.join(directory, f'bench_{stamp}.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    with open(os.path.join(directory, 'history.jsonl'), 'a', encoding='utf-8') as f:
+        f.write(json.dumps(results, ensure_ascii=False) + '\n')
+    return path
+
+
+def load_last_results(directory: str) -> dict or None:
+    path = os.path.join(directory, 'history.jsonl')
+    if not os.path.exists(path):
+        return None
+    last = None
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                last = line
+    return json.loads(last) if last else None
@@ -33,11 +33,19 @@ def try_found_elem_if_exist_return_text(
         return parent_element.text
 
 
+def review_key(record: dict) -> tuple:
+    """Составной ключ отзыва для проверки дубликатов"""
+    return record['place_id'], record['datetime']
+
+
 class Review:
     """class for reviews"""
 
+    # Без __dict__: на миллионах отзывов экономит память
+    __slots__ = ('review_rating', 'datetime', 'place_id')
+
     def __repr__(self):
-        return repr(self.__dict__)
+        return repr(self.to_record())
 
     def __init__(self, **kwargs):
         # Оставляем только необходимые поля
@@ -51,6 +59,21 @@ class Review:
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    @classmethod
+    def bulk_from_arrays(cls, ratings, dates, place_id=None):
+        """Создание отзывов из параллельных массивов рейтингов и дат"""
+        return [
+            cls(review_rating=rating, datetime=date, place_id=place_id)
+            for rating, date in zip(ratings, dates)
+        ]
+
+    def to_record(self) -> dict:
+        return {
+            'review_rating': self.review_rating,
+            'datetime': self.datetime,
+            'place_id': self.place_id,
+        }
+
     def parse_base_information(
             self, review_elem: WebElement
     ):
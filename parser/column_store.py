@@ -0,0 +1,241 @@
+# file name: parser/column_store.py
+import bisect
+import json
+import logging
+import mmap
+import os
+import sys
+import zlib
+from array import array
+from functools import lru_cache
+from itertools import accumulate
+
+from parser.columnar import ReviewBatch, MISSING_TIMESTAMP, np, parse_iso_ms
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = 'index.json'
+FORMAT_VERSION = 1
+DEFAULT_BLOCK_ROWS = 65536
+
+# Столбец хранилища -> (поле ReviewBatch, код типа array, кодирование)
+COLUMNS = {
+    'rating': ('ratings', 'B', 'zlib'),
+    'timestamp': ('timestamps', 'q', 'delta+zlib'),
+    'place_id': ('place_ids', 'q', 'zlib'),
+}
+
+
+def _column_path(directory: str, name: str) -> str:
+    return os.path.join(directory, f'{name}.col')
+
+
+def _wrap_int64(value: int) -> int:
+    """Переполнение как в int64: разность с MISSING_TIMESTAMP не влезает в 64 бита"""
+    return (value + 2 ** 63) % 2 ** 64 - 2 ** 63
+
+
+def _encode_block(values: array, encoding: str) -> bytes:
+    if encoding == 'delta+zlib' and len(values):
+        # Внутри организации время отсортировано: разности маленькие и хорошо сжимаются
+        values = array(values.typecode, [values[0]]) + array(
+            values.typecode, (_wrap_int64(b - a) for a, b in zip(values, values[1:]))
+        )
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return zlib.compress(values.tobytes(), 6)
+
+
+def _decode_block(payload: bytes, typecode: str, encoding: str) -> array:
+    values = array(typecode, zlib.decompress(payload))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    if encoding == 'delta+zlib':
+        values = array(typecode, accumulate(values, lambda a, b: _wrap_int64(a + b)))
+    return values
+
+
+def _sort_order(batch: ReviewBatch) -> list:
+    """Порядок строк по (place_id, время)"""
+    if np is not None:
+        columns = batch.to_numpy()
+        return np.lexsort((columns['timestamp_ms'], columns['place_id'])).tolist()
+    place_ids, timestamps = batch.place_ids, batch.timestamps
+    return sorted(range(len(batch)), key=lambda i: (place_ids[i], timestamps[i]))
+
+
+def export_columns(records, directory: str, block_rows: int = DEFAULT_BLOCK_ROWS) -> dict:
+    """
+    Запись отзывов в сжатые столбцы: rating.col, timestamp.col, place_id.col
+    и индекс index.json (блоки столбцов, диапазоны времени блоков, строки каждой организации).
+    records - ReviewBatch или итерируемые записи {'review_rating', 'datetime', 'place_id'}
+    """
+    batch = records if isinstance(records, ReviewBatch) else ReviewBatch.from_records(records)
+    order = _sort_order(batch)
+    os.makedirs(directory, exist_ok=True)
+
+    index = {
+        'version': FORMAT_VERSION,
+        'rows': len(batch),
+        'block_rows': block_rows,
+        'columns': {},
+        'timestamp_ranges': [],
+        'places': [],
+    }
+
+    for name, (field, typecode, encoding) in COLUMNS.items():
+        source = getattr(batch, field)
+        column = array(typecode, (source[i] for i in order))
+        blocks = []
+        tmp_path = _column_path(directory, name) + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            for start in range(0, len(column), block_rows):
+                block = column[start:start + block_rows]
+                payload = _encode_block(block, encoding)
+                blocks.append([f.tell(), len(payload)])
+                f.write(payload)
+
+                if name == 'timestamp':
+                    known = [t for t in block if t != MISSING_TIMESTAMP]
+                    index['timestamp_ranges'].append([min(known), max(known)] if known else None)
+                elif name == 'place_id':
+                    for offset, place_id in enumerate(block, start):
+                        places = index['places']
+                        if places and places[-1][0] == place_id:
+                            places[-1][2] = offset + 1
+                        else:
+                            places.append([place_id, offset, offset + 1])
+        os.replace(tmp_path, _column_path(directory, name))
+        index['columns'][name] = {'typecode': typecode, 'encoding': encoding, 'blocks': blocks}
+
+    # Индекс пишется последним: до его замены читатель видит прежнюю версию
+    index_path = os.path.join(directory, INDEX_FILE)
+    with open(index_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    os.replace(index_path + '.tmp', index_path)
+
+    size = sum(os.path.getsize(_column_path(directory, name)) for name in COLUMNS)
+    logger.info(
+        f"Экспортировано {len(batch)} отзывов ({len(index['places'])} организаций) "
+        f"в {directory}: {size / 1024:.1f} КБ"
+    )
+    return index
+
+
+def _to_ms(value) -> int or None:
+    if value is None or isinstance(value, int):
+        return value
+    return parse_iso_ms([value])[0]
+
+
+class ColumnStore:
+    """
+    Чтение столбцов через mmap: запрос по организации или диапазону дат
+    распаковывает только блоки, в которые попадают нужные строки
+    """
+
+    def __init__(self, directory: str, cache_blocks: int = 64):
+        self.directory = directory
+        with open(os.path.join(directory, INDEX_FILE), 'r', encoding='utf-8') as f:
+            self.index = json.load(f)
+        if self.index.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Неподдерживаемая версия хранилища: {self.index.get('version')}")
+
+        self.rows = self.index['rows']
+        self.block_rows = self.index['block_rows']
+        self.places = {place_id: (start, end) for place_id, start, end in self.index['places']}
+
+        self._files = {}
+        self._maps = {}
+        for name in COLUMNS:
+            path = _column_path(directory, name)
+            f = open(path, 'rb')
+            self._files[name] = f
+            # mmap пустого файла невозможен
+            self._maps[name] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(path) else b''
+
+        self._block = lru_cache(maxsize=cache_blocks)(self._read_block)
+
+    def __len__(self):
+        return self.rows
+
+    def _read_block(self, name: str, number: int) -> array:
+        meta = self.index['columns'][name]
+        offset, length = meta['blocks'][number]
+        return _decode_block(self._maps[name][offset:offset + length], meta['typecode'], meta['encoding'])
+
+    def _column_range(self, name: str, start: int, end: int) -> array:
+        result = array(COLUMNS[name][1])
+        if start >= end:
+            return result
+        for number in range(start // self.block_rows, (end - 1) // self.block_rows + 1):
+            block_start = number * self.block_rows
+            block = self._block(name, number)
+            result.extend(block[max(start - block_start, 0):end - block_start])
+        return result
+
+    def _rows(self, start: int, end: int) -> ReviewBatch:
+        return ReviewBatch(
+            ratings=self._column_range('rating', start, end),
+            timestamps=self._column_range('timestamp', start, end),
+            place_ids=self._column_range('place_id', start, end),
+        )
+
+    def place(self, place_id: int) -> ReviewBatch:
+        """Все отзывы организации, по возрастанию времени"""
+        start, end = self.places.get(place_id, (0, 0))
+        return self._rows(start, end)
+
+    def date_range(self, since=None, until=None, place_id: int = None) -> ReviewBatch:
+        """
+        Отзывы с since <= время < until (ISO-строки или мс от эпохи),
+        по одной организации или по всем
+        """
+        since, until = _to_ms(since), _to_ms(until)
+        low = MISSING_TIMESTAMP + 1 if since is None else since
+        high = 2 ** 63 - 1 if until is None else until
+
+        if place_id is not None:
+            # Внутри организации время отсортировано - хватит бинарного поиска
+            start, end = self.places.get(place_id, (0, 0))
+            timestamps = self._column_range('timestamp', start, end)
+            first = bisect.bisect_left(timestamps, low)
+            last = bisect.bisect_left(timestamps, high)
+            return self._rows(start + first, start + last)
+
+        result = ReviewBatch()
+        for number, bounds in enumerate(self.index['timestamp_ranges']):
+            # Блок целиком вне диапазона по минимуму/максимуму - не распаковываем
+            if bounds is None or bounds[1] < low or bounds[0] >= high:
+                continue
+            timestamps = self._block('timestamp', number)
+            matches = [i for i, t in enumerate(timestamps) if low <= t < high]
+            if not matches:
+                continue
+            ratings = self._block('rating', number)
+            place_ids = self._block('place_id', number)
+            result.extend(ReviewBatch(
+                ratings=array('B', (ratings[i] for i in matches)),
+                timestamps=array('q', (timestamps[i] for i in matches)),
+                place_ids=array('q', (place_ids[i] for i in matches)),
+            ))
+        return result
+
+    def iter_batches(self):
+        """Весь корпус поблочно"""
+        for start in range(0, self.rows, self.block_rows):
+            yield self._rows(start, min(start + self.block_rows, self.rows))
+
+    def close(self):
+        self._block.cache_clear()
+        for name, mapped in self._maps.items():
+            if mapped:
+                mapped.close()
+            self._files[name].close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,133 @@
+# file name: parser/convert.py
+import bz2
+import csv
+import gzip
+import json
+import logging
+import lzma
+
+from parser.places import load_places
+from parser.writer import committed_offset, is_append_only
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 16
+REVIEW_FIELDS = ['review_rating', 'datetime', 'place_id']
+PLACE_FIELDS = ['name', 'coords/0', 'coords/1']
+
+_COMPRESSORS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+}
+
+
+def _strip_compression(filepath: str) -> (str, object):
+    for suffix, opener in _COMPRESSORS.items():
+        if filepath.endswith(suffix):
+            return filepath[:-len(suffix)], opener
+    return filepath, open
+
+
+def open_text(filepath: str, mode: str = 'r', **kwargs):
+    """Открытие текстового файла; .gz/.bz2/.xz сжимаются и распаковываются на лету"""
+    _, opener = _strip_compression(filepath)
+    return opener(filepath, mode + 't' if opener is not open else mode, encoding='utf-8', **kwargs)
+
+
+def iter_json_array(f, chunk_size: int = CHUNK_SIZE):
+    """Элементы JSON-массива верхнего уровня без загрузки всего файла"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+    started = False
+
+    while True:
+        # Пропускаем пробелы и запятые между элементами
+        while pos < len(buffer) and (buffer[pos].isspace() or (started and buffer[pos] == ',')):
+            pos += 1
+
+        if pos < len(buffer):
+            if not started:
+                if buffer[pos] != '[':
+                    raise ValueError("Ожидался JSON-массив")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == ']':
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Элемент обрезан границей блока - дочитываем
+                if eof:
+                    raise
+            else:
+                # Число на границе блока могло прочитаться не целиком
+                if end < len(buffer) or eof:
+                    yield item
+                    pos = end
+                    continue
+
+        if eof:
+            if started:
+                raise ValueError("JSON-массив не закрыт")
+            return
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+def iter_reviews(filepath: str):
+    """Потоковое чтение отзывов из JSON-массива или JSON Lines (в т.ч. сжатых)"""
+    base_path, _ = _strip_compression(filepath)
+    if not is_append_only(base_path):
+        with open_text(filepath) as f:
+            yield from iter_json_array(f)
+        return
+
+    # Для несжатого .jsonl не читаем за последней зафиксированной пачкой
+    limit = committed_offset(filepath) if base_path == filepath else None
+    with open(filepath, 'rb') if base_path == filepath else open_text(filepath) as f:
+        read = 0
+        for line in f:
+            read += len(line)
+            if limit is not None and read > limit:
+                break
+            if line.strip():
+                yield json.loads(line)
+
+
+def convert_to_csv(input_path: str, output_path: str, places_path: str = None) -> int:
+    """
+    JSON/JSONL с отзывами -> CSV за один проход. При places_path к каждому
+    отзыву добавляются name и координаты места. Возвращает количество строк
+    """
+    places = load_places(places_path) if places_path else None
+    fields = REVIEW_FIELDS + (PLACE_FIELDS if places is not None else [])
+    missing_places = set()
+    count = 0
+
+    with open_text(output_path, 'w', newline='') as out:
+        writer = csv.DictWriter(out, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        for review in iter_reviews(input_path):
+            row = review
+            if places is not None:
+                place = places.get(review.get('place_id'))
+                if place is None:
+                    missing_places.add(review.get('place_id'))
+                else:
+                    row = {**review, 'name': place['name'], 'coords/0': place['coords'][0],
+                           'coords/1': place['coords'][1]}
+            writer.writerow(row)
+            count += 1
+            if count % 1000000 == 0:
+                logger.info(f"Записано {count} строк")
+
+    if missing_places:
+        logger.warning(f"Нет в справочнике мест: {len(missing_places)} place_id")
+    logger.info(f"Сохранено {count} отзывов в {output_path}")
+    return count
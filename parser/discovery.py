@@ -0,0 +1,271 @@
+# file name: parser/discovery.py
+import csv
+import logging
+import math
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import quote
+
+from parser import main
+from parser import selenium_helper as sh
+from parser.places import PLACES_CSV_FIELDS, iter_places, place_to_row
+
+logger = logging.getLogger(__name__)
+
+ID_LIST = os.path.join('data', 'id_list_setted.txt')
+# Москва в пределах МКАД и ближайших районов: юг, запад, север, восток
+MOSCOW_BBOX = (55.49, 37.32, 55.96, 37.97)
+
+DEFAULT_CELL_DEG = 0.05
+MIN_CELL_DEG = 0.005
+# Сколько результатов считаем потолком выдачи: ячейка с таким числом мест делится на 4
+DEFAULT_CAP = 100
+
+# Все ещё не разобранные карточки выдачи одним вызовом (те же классы, что в places_parser.ipynb)
+EXTRACT_SNIPPETS_JS = """
+const nodes = document.querySelectorAll('.search-snippet-view:not([data-parsed])');
+const text = (node, cls) => {
+    const found = node.querySelector('.' + cls);
+    return found ? found.textContent : null;
+};
+const result = [];
+for (const node of nodes) {
+    node.setAttribute('data-parsed', '1');
+    const body = node.querySelector('.search-snippet-view__body');
+    if (!body) continue;
+    result.push([
+        body.getAttribute('data-id'),
+        body.getAttribute('data-coordinates'),
+        text(node, 'search-business-snippet-view__title'),
+        text(node, 'business-rating-with-text-view__count'),
+        text(node, 'business-rating-badge-view__rating-text'),
+    ]);
+}
+if (arguments[0] && nodes.length) {
+    nodes[nodes.length - 1].scrollIntoView({block: 'end'});
+}
+return result;
+"""
+
+COUNT_NEW_SNIPPETS_JS = """
+return document.querySelectorAll('.search-snippet-view:not([data-parsed])').length;
+"""
+
+COUNT_RE = re.compile(r'\d[\d\s]*')
+
+
+class Cell:
+    """Прямоугольник карты: юг, запад, север, восток"""
+
+    __slots__ = ('south', 'west', 'north', 'east', 'depth')
+
+    def __init__(self, south: float, west: float, north: float, east: float, depth: int = 0):
+        self.south = south
+        self.west = west
+        self.north = north
+        self.east = east
+        self.depth = depth
+
+    def __repr__(self):
+        return f'Cell({self.south:.4f}, {self.west:.4f}, {self.north:.4f}, {self.east:.4f}, depth={self.depth})'
+
+    def contains(self, lat: float, lon: float) -> bool:
+        # Нижняя и левая границы включены, чтобы соседние ячейки не делили точку
+        return self.south <= lat < self.north and self.west <= lon < self.east
+
+    def split(self) -> list:
+        lat = (self.south + self.north) / 2
+        lon = (self.west + self.east) / 2
+        return [
+            Cell(self.south, self.west, lat, lon, self.depth + 1),
+            Cell(self.south, lon, lat, self.east, self.depth + 1),
+            Cell(lat, self.west, self.north, lon, self.depth + 1),
+            Cell(lat, lon, self.north, self.east, self.depth + 1),
+        ]
+
+    def search_url(self, query: str, base_url: str = None) -> str:
+        """Поиск в окне карты: центр ll и размах spn (долгота, широта)"""
+        lat = (self.south + self.north) / 2
+        lon = (self.west + self.east) / 2
+        return (
+            f"{base_url or main.BASE_URL}/maps/?text={quote(query)}"
+            f"&ll={lon:.6f},{lat:.6f}&spn={self.east - self.west:.6f},{self.north - self.south:.6f}"
+        )
+
+
+def grid_cells(bbox, cell_deg: float = DEFAULT_CELL_DEG) -> list:
+    """Сетка примерно квадратных ячеек: по долготе шаг растянут на 1/cos(широты)"""
+    south, west, north, east = bbox
+    lon_step = cell_deg / math.cos(math.radians((south + north) / 2))
+    rows = max(1, math.ceil((north - south) / cell_deg))
+    cols = max(1, math.ceil((east - west) / lon_step))
+    lat_step = (north - south) / rows
+    lon_step = (east - west) / cols
+    return [
+        Cell(south + r * lat_step, west + c * lon_step, south + (r + 1) * lat_step, west + (c + 1) * lon_step)
+        for r in range(rows) for c in range(cols)
+    ]
+
+
+def _parse_count(text: str or None) -> int or None:
+    match = COUNT_RE.search(text or '')
+    if not match:
+        return None
+    return int(re.sub(r'\D', '', match.group(0)))
+
+
+def _parse_rating(text: str or None) -> float or None:
+    try:
+        return float((text or '').strip().replace(',', '.'))
+    except ValueError:
+        return None
+
+
+def snippet_to_place(snippet) -> dict or None:
+    """Карточка выдачи -> место в формате full_places.csv"""
+    place_id, coordinates, name, count, rating = snippet
+    if not place_id or not coordinates:
+        return None
+    try:
+        # data-coordinates: "долгота,широта"
+        lon, lat = (float(value) for value in coordinates.split(','))
+    except ValueError:
+        return None
+    return {
+        'id': place_id,
+        'averageRating': _parse_rating(rating),
+        'reviewsNum': _parse_count(count),
+        'name': name.strip() if name else None,
+        'coords': [lat, lon],
+    }
+
+
+def search_cell(driver, cell: Cell, query: str, cap: int = DEFAULT_CAP, timeout: float = 10,
+                scroll_timeout: float = 3) -> (list, int):
+    """
+    Выдача поиска в окне ячейки с прокруткой списка до конца или до cap карточек.
+    Возвращает места внутри ячейки и общее число загруженных карточек
+    """
+    sh.navigate(driver, cell.search_url(query))
+    sh.wait_for_js_condition(driver, COUNT_NEW_SNIPPETS_JS, timeout=timeout)
+
+    snippets = []
+    while len(snippets) < cap:
+        new_snippets = driver.execute_script(EXTRACT_SNIPPETS_JS, True)
+        if not new_snippets and not sh.wait_for_js_condition(driver, COUNT_NEW_SNIPPETS_JS, timeout=scroll_timeout):
+            break
+        snippets.extend(new_snippets)
+        sh.politeness_pause(driver)
+
+    places = []
+    for snippet in snippets:
+        place = snippet_to_place(snippet)
+        # Выдача захватывает соседей - их найдет своя ячейка
+        if place is not None and cell.contains(*place['coords']):
+            places.append(place)
+    return places, len(snippets)
+
+
+def load_id_list(filepath: str = ID_LIST) -> set:
+    if not os.path.exists(filepath):
+        return set()
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return {line.strip() for line in f if line.strip()}
+
+
+class PlacesCsvSink:
+    """Потоковая дозапись мест в формате full_places.csv без повторов id"""
+
+    def __init__(self, filepath: str, known_ids: set = None):
+        self.filepath = filepath
+        self.seen = set(known_ids or ())
+        # id, записанные этим запуском (без взятых из файла при продолжении)
+        self.new_ids = []
+
+        exists = os.path.exists(filepath) and os.path.getsize(filepath) > 0
+        if exists:
+            # Продолжение прерванного обхода: уже записанные места пропускаем
+            self.seen.update(str(place['id']) for place in iter_places(filepath))
+        self.file = open(filepath, 'a', encoding='utf-8', newline='')
+        self.writer = csv.DictWriter(self.file, fieldnames=PLACES_CSV_FIELDS)
+        if not exists:
+            self.writer.writeheader()
+
+    def write(self, places) -> list:
+        new_places = []
+        for place in places:
+            if place['id'] in self.seen:
+                continue
+            self.seen.add(place['id'])
+            self.writer.writerow(place_to_row(place))
+            new_places.append(place)
+        self.file.flush()
+        self.new_ids.extend(place['id'] for place in new_places)
+        return new_places
+
+    def close(self):
+        self.file.close()
+
+
+def discover_places(
+    manager,
+    bboxes,
+    sink: PlacesCsvSink,
+    query: str = 'тц',
+    cell_deg: float = DEFAULT_CELL_DEG,
+    min_cell_deg: float = MIN_CELL_DEG,
+    cap: int = DEFAULT_CAP,
+    workers: int = 1
+) -> dict:
+    """
+    Обход ячеек сетки в workers браузерах пула manager (DriverManager).
+    Ячейка, выдача которой уперлась в cap, делится на 4 и обходится заново.
+    Места пишет только вызывающий поток, как и в run_batch
+    """
+    cells = [cell for bbox in bboxes for cell in grid_cells(bbox, cell_deg)]
+    logger.info("Поиск «%s»: %d ячеек по %.3f°, %d воркеров", query, len(cells), cell_deg, workers)
+    stats = {'cells': 0, 'split': 0, 'capped': 0, 'failed': 0, 'found': 0, 'new': 0}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='discovery-worker') as executor:
+        def submit(cell):
+            return executor.submit(manager.run, search_cell, cell=cell, query=query, cap=cap)
+
+        running = {submit(cell): cell for cell in cells}
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                cell = running.pop(future)
+                stats['cells'] += 1
+                try:
+                    places, loaded = future.result()
+                except Exception as e:
+                    stats['failed'] += 1
+                    logger.error("Ячейка %r: %s", cell, e)
+                    continue
+
+                new_places = sink.write(places)
+                stats['found'] += len(places)
+                stats['new'] += len(new_places)
+
+                if loaded >= cap:
+                    if cell.north - cell.south > min_cell_deg:
+                        stats['split'] += 1
+                        for child in cell.split():
+                            running[submit(child)] = child
+                    else:
+                        # Дальше делить некуда - часть мест могла не попасть в выдачу
+                        stats['capped'] += 1
+                        logger.warning("Ячейка %r упирается в потолок выдачи %d", cell, cap)
+
+                logger.info(
+                    "Ячеек: %d, в очереди %d, новых мест %d (в ячейке %d из %d карточек)",
+                    stats['cells'], len(running), stats['new'], len(places), loaded,
+                    extra={'log_key': 'discovery_progress'}
+                )
+
+    logger.info(
+        "Обход завершен: %d ячеек (%d разделено, %d с ошибкой), найдено %d мест, новых %d",
+        stats['cells'], stats['split'], stats['failed'], stats['found'], stats['new']
+    )
+    return stats
@@ -0,0 +1,249 @@
+# file name: parser/driver_pool.py
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from parser.selenium_helper import make_driver
+
+logger = logging.getLogger(__name__)
+
+# Попытки запуска браузера и пауза перед повтором (удваивается)
+START_ATTEMPTS = 3
+START_BACKOFF = 2.0
+
+
+def _read_rss_kb(pid: int) -> int:
+    with open(f'/proc/{pid}/status', 'r') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def _child_pids(pid: int):
+    """Все потомки процесса (content-процессы Firefox)"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                # Имя процесса в скобках может содержать пробелы
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    result = []
+    stack = [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            result.append(child)
+            stack.append(child)
+    return result
+
+
+def browser_rss_mb(driver) -> float or None:
+    """RSS браузера вместе с дочерними процессами; None, если узнать нельзя (не Linux)"""
+    pid = (getattr(driver, 'capabilities', None) or {}).get('moz:processID')
+    if not pid or not os.path.exists('/proc'):
+        return None
+    total_kb = 0
+    for p in [pid] + _child_pids(pid):
+        try:
+            total_kb += _read_rss_kb(p)
+        except OSError:
+            continue
+    return total_kb / 1024
+
+
+class ManagedDriver:
+    """Браузер из пула и счетчик обработанных им организаций"""
+
+    def __init__(self, driver, number: int):
+        self.driver = driver
+        self.number = number
+        self.orgs_done = 0
+
+
+class DriverManager:
+    """
+    Пул заранее запущенных браузеров поверх make_driver.
+    Браузер перезапускается после recycle_after организаций или когда его RSS
+    превышает max_rss_mb; упавшая сессия заменяется новой и задача повторяется.
+    Замена запускается в фоне, поэтому при warm > 0 воркер сразу получает готовый браузер
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        warm: int = 0,
+        recycle_after: int = 50,
+        max_rss_mb: float = None,
+        debug: bool = False,
+        factory=make_driver
+    ):
+        self.recycle_after = recycle_after
+        self.max_rss_mb = max_rss_mb
+        self.debug = debug
+        self.factory = factory
+
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._started = 0
+        self._starter = ThreadPoolExecutor(max_workers=max(1, size + warm), thread_name_prefix='driver-start')
+
+        # Статистика
+        self.startup_seconds = 0.0
+        self.work_seconds = 0.0
+        self.recycled = 0
+        self.crashed = 0
+
+        for _ in range(size + warm):
+            self._start_async()
+
+    def _start_async(self):
+        self._starter.submit(self._start_one)
+
+    def _start_one(self):
+        for attempt in range(START_ATTEMPTS):
+            if attempt:
+                # Сломанный geckodriver не должен крутиться в цикле запусков
+                time.sleep(START_BACKOFF * 2 ** (attempt - 1))
+            if self._closed:
+                return
+            started = time.monotonic()
+            try:
+                driver = self.factory(debug=self.debug)
+                break
+            except Exception as e:
+                logger.error("Не удалось запустить браузер (попытка %d/%d): %s", attempt + 1, START_ATTEMPTS, e)
+        else:
+            # Пустой слот, чтобы ожидающий воркер не висел вечно
+            self._idle.put(None)
+            return
+        elapsed = time.monotonic() - started
+
+        with self._lock:
+            self.startup_seconds += elapsed
+            self._started += 1
+            number = self._started
+            closed = self._closed
+
+        if closed:
+            driver.quit()
+            return
+        logger.debug("Браузер #%s запущен за %.1f сек", number, elapsed)
+        self._idle.put(ManagedDriver(driver, number))
+
+    def acquire(self) -> ManagedDriver:
+        managed = self._idle.get()
+        if managed is None:
+            # Слот не теряем: новый запуск идет в фоне, а текущая задача получает ошибку
+            if not self._closed:
+                self._start_async()
+            raise RuntimeError("Не удалось запустить браузер")
+        return managed
+
+    def release(self, managed: ManagedDriver, broken: bool = False):
+        managed.orgs_done += 1
+        reason = None
+        if broken:
+            reason = 'сессия упала'
+        elif self.recycle_after and managed.orgs_done >= self.recycle_after:
+            reason = f'обработано {managed.orgs_done} организаций'
+        elif self.max_rss_mb:
+            rss = browser_rss_mb(managed.driver)
+            if rss is not None and rss > self.max_rss_mb:
+                reason = f'RSS {rss:.0f} МБ > {self.max_rss_mb} МБ'
+
+        if reason is None:
+            self._idle.put(managed)
+            return
+
+        logger.info("Перезапуск браузера #%s: %s", managed.number, reason)
+        with self._lock:
+            if broken:
+                self.crashed += 1
+            else:
+                self.recycled += 1
+        self._quit(managed)
+        if not self._closed:
+            self._start_async()
+
+    @staticmethod
+    def _quit(managed: ManagedDriver):
+        try:
+            managed.driver.quit()
+        except Exception as e:
+            logger.debug("Ошибка при закрытии браузера #%s: %s", managed.number, e)
+
+    @staticmethod
+    def _is_alive(managed: ManagedDriver) -> bool:
+        try:
+            managed.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def run(self, fn, retries: int = 1, **kwargs):
+        """Выполнение fn(driver=..., **kwargs) на браузере из пула с повтором при падении сессии"""
+        for attempt in range(retries + 1):
+            managed = self.acquire()
+            broken = False
+            started = time.monotonic()
+            try:
+                return fn(driver=managed.driver, **kwargs)
+            except Exception as e:
+                # Ошибка страницы при живой сессии - не повод перезапускать браузер.
+                # Проверяем при любой ошибке: умерший браузер часто дает ошибку соединения urllib3
+                if self._is_alive(managed):
+                    raise
+                broken = True
+                logger.warning("Сессия браузера #%s потеряна: %s", managed.number, e)
+                if attempt == retries:
+                    raise
+            finally:
+                with self._lock:
+                    self.work_seconds += time.monotonic() - started
+                self.release(managed, broken=broken)
+
+    def stats(self) -> dict:
+        return {
+            'browsers_started': self._started,
+            'recycled': self.recycled,
+            'crashed': self.crashed,
+            'startup_seconds': round(self.startup_seconds, 2),
+            'work_seconds': round(self.work_seconds, 2),
+        }
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        self._starter.shutdown(wait=True)
+        while True:
+            try:
+                managed = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if managed is not None:
+                self._quit(managed)
+
+        stats = self.stats()
+        logger.info(
+            "Браузеров запущено: %s "
+            "(перезапусков %s, падений %s); "
+            "запуск: %s сек, парсинг: %s сек",
+            stats['browsers_started'], stats['recycled'], stats['crashed'],
+            stats['startup_seconds'], stats['work_seconds']
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
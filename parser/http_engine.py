@@ -0,0 +1,220 @@
+# file name: parser/http_engine.py
+import json
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+
+import urllib3
+
+from parser import state_parser
+from parser.main import organization_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0',
+    'Accept': 'text/html,application/xhtml+xml',
+    'Accept-Language': 'ru-RU,ru;q=0.9',
+}
+
+STATE_VIEW_RE = re.compile(
+    r'<script[^>]*class="state-view"[^>]*>(.*?)</script>',
+    re.DOTALL
+)
+
+VOID_TAGS = {'meta', 'link', 'img', 'br', 'hr', 'input', 'source', 'wbr'}
+RATING_ITEMTYPE = 'http://schema.org/Rating'
+
+
+class ReviewMarkupParser(HTMLParser):
+    """
+    Разбор серверной разметки страницы отзывов без браузера:
+    те же поля, что достает Review.parse_base_information
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.ratings = []
+        self.dates = []
+        self.total_text = ''
+        # Стек открытых тегов: (tag, review, date, rating, total)
+        self._stack = []
+        self._rating = None
+        self._date = None
+
+    def _flags(self):
+        if self._stack:
+            return self._stack[-1][1:]
+        return False, False, False, False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        in_review, in_date, in_rating, in_total = self._flags()
+        classes = (attrs.get('class') or '').split()
+
+        if tag == 'meta':
+            if in_review and in_date and attrs.get('itemprop') == 'datePublished':
+                self._date = attrs.get('content')
+            elif in_review and in_rating and attrs.get('itemprop') == 'ratingValue':
+                self._rating = attrs.get('content')
+            return
+        if tag in VOID_TAGS:
+            return
+
+        starts_review = 'business-review-view__info' in classes
+        if starts_review:
+            self._rating = None
+            self._date = None
+        self._stack.append((
+            tag,
+            in_review or starts_review,
+            in_date or 'business-review-view__date' in classes,
+            in_rating or attrs.get('itemtype') == RATING_ITEMTYPE,
+            in_total or 'card-section-header__title' in classes,
+        ))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and self._stack and self._stack[-1][0] == tag:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        # Закрываем до совпадающего тега, чтобы пережить незакрытые теги
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i][0] != tag:
+                continue
+            was_review = self._stack[i][1]
+            del self._stack[i:]
+            if was_review and not self._flags()[0]:
+                self.ratings.append(self._rating)
+                self.dates.append(self._date)
+            return
+
+    def handle_data(self, data):
+        if self._flags()[3]:
+            self.total_text += data
+
+
+def parse_total(text: str) -> int or None:
+    digits = re.sub(pattern=r'\D', repl='', string=text or '')
+    return int(digits) if digits else None
+
+
+def parse_org_page(html: str, org_id: int = None) -> dict:
+    """Отзывы, найденные в HTML страницы организации: из state-view и из разметки"""
+    records = []
+
+    match = STATE_VIEW_RE.search(html)
+    if match:
+        try:
+            state = json.loads(match.group(1))
+            records = state_parser.collect_state_reviews(state, org_id=org_id)
+        except ValueError as e:
+            logger.debug("Не удалось разобрать state-view для %s: %s", org_id, e)
+
+    markup = ReviewMarkupParser()
+    markup.feed(html)
+    markup.close()
+
+    # Разметку используем, если в состоянии отзывов нет
+    if not records:
+        records = [
+            {'review_rating': rating, 'datetime': date, 'place_id': org_id}
+            for rating, date in zip(markup.ratings, markup.dates)
+            if date
+        ]
+
+    return {
+        'records': records,
+        'total': parse_total(markup.total_text),
+        'has_state': match is not None,
+    }
+
+
+class HttpFetchEngine:
+    """
+    Загрузка страниц организаций без браузера через пул keep-alive соединений.
+    fetch_org_reviews возвращает None, если на странице нет нужных данных
+    и организацию надо отдать Selenium
+    """
+
+    def __init__(self, base_url: str = None, maxsize: int = 16, timeout: float = 15, headers: dict = None,
+                 bucket=None):
+        self.base_url = base_url
+        self.bucket = bucket
+        self.maxsize = maxsize
+        self.pool = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=maxsize,
+            block=True,
+            headers={**DEFAULT_HEADERS, **(headers or {})},
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            retries=urllib3.Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+        )
+
+    def fetch_page(self, org_id: int) -> str or None:
+        url = organization_url(org_id, base_url=self.base_url)
+        if self.bucket is not None:
+            self.bucket.acquire()
+
+        started = time.monotonic()
+        try:
+            response = self.pool.request('GET', url)
+        except urllib3.exceptions.HTTPError:
+            if self.bucket is not None:
+                self.bucket.report(error=True)
+            raise
+        if self.bucket is not None:
+            self.bucket.report(
+                latency=time.monotonic() - started,
+                error=response.status == 429 or response.status >= 500
+            )
+
+        if response.status != 200:
+            logger.warning("HTTP %s для %s", response.status, url)
+            return None
+        return response.data.decode('utf-8', errors='replace')
+
+    def fetch_org_reviews(self, org_id: int, limit: int = None) -> list or None:
+        """Отзывы организации или None, если без браузера их не собрать полностью"""
+        try:
+            html = self.fetch_page(org_id)
+        except Exception as e:
+            # Не только urllib3: ошибки декодирования и прочее тоже отдаем Selenium
+            logger.warning("Ошибка загрузки организации %s: %s", org_id, e)
+            return None
+        if html is None:
+            return None
+
+        try:
+            page = parse_org_page(html, org_id=org_id)
+        except Exception as e:
+            # Непривычная страница одной организации не должна ронять весь HTTP-проход
+            logger.warning("Не удалось разобрать страницу организации %s: %s", org_id, e)
+            return None
+        records = page['records']
+        if limit is not None:
+            records = records[:limit]
+
+        # Достаточно, только если набрали лимит или все отзывы организации
+        if limit is not None and len(records) >= limit:
+            return records
+        if page['total'] is not None and len(records) >= page['total']:
+            return records
+
+        logger.debug(
+            "Организация %s: в HTML %s из %s отзывов, нужен браузер",
+            org_id, len(records), page['total']
+        )
+        return None
+
+    def fetch_many(self, ids, limit: int = None, concurrency: int = None):
+        """Параллельная загрузка: выдает пары (org_id, отзывы или None) в порядке ids"""
+        with ThreadPoolExecutor(max_workers=concurrency or self.maxsize) as executor:
+            for org_id, records in zip(ids, executor.map(lambda i: self.fetch_org_reviews(i, limit), ids)):
+                yield org_id, records
+
+    def close(self):
+        self.pool.clear()
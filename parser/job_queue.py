@@ -0,0 +1,289 @@
+# file name: parser/job_queue.py
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+DEFAULT_LEASE_SECONDS = 1800
+DEFAULT_MAX_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    org_id INTEGER PRIMARY KEY,
+    state TEXT NOT NULL DEFAULT 'pending',
+    priority INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    reviews INTEGER,
+    error TEXT,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_pending ON jobs (state, priority DESC, org_id);
+CREATE TABLE IF NOT EXISTS outputs (
+    path TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    lease_expires REAL NOT NULL
+);
+"""
+
+
+def default_owner() -> str:
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+class JobQueue:
+    """
+    Очередь организаций в SQLite (WAL): состояния pending -> leased -> done/failed.
+    Аренда истекает через lease_seconds, и задачу упавшего процесса забирает
+    другой; после max_attempts неудачных аренд задача считается failed.
+    Первыми выдаются организации с большим reviewsNum (priority).
+    Одну базу могут разбирать несколько процессов run_batch, каждый со своим
+    выходным файлом (claim_output). Пока работает heartbeat, аренды процесса
+    продлеваются, и долгая организация не уходит другому процессу
+    """
+
+    def __init__(self, filepath: str, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, owner: str = None):
+        self.filepath = filepath
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.owner = owner or default_owner()
+        self._heartbeat = None
+        self._stopped = threading.Event()
+
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Транзакции открываем сами (BEGIN IMMEDIATE), соединение общее на потоки процесса
+        self._conn = sqlite3.connect(filepath, timeout=30, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+
+    def _transaction(self, fn):
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = fn(self._conn, time.time())
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+            return result
+
+    def add(self, ids, priorities: dict = None, reset_done: bool = False) -> int:
+        """
+        Постановка организаций в очередь. Для уже ожидающих обновляется приоритет,
+        при reset_done завершенные снова становятся pending (инкрементальный режим)
+        """
+        priorities = priorities or {}
+        rows = [(org_id, priorities.get(org_id) or 0) for org_id in ids]
+
+        def add_rows(conn, now):
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT INTO jobs (org_id, priority, updated) VALUES (?, ?, ?) "
+                "ON CONFLICT (org_id) DO UPDATE SET priority = excluded.priority WHERE state = 'pending'",
+                [(org_id, priority, now) for org_id, priority in rows]
+            )
+            if reset_done:
+                conn.executemany(
+                    "UPDATE jobs SET state = 'pending', priority = ?, attempts = 0, error = NULL, updated = ? "
+                    "WHERE org_id = ? AND state IN ('done', 'failed')",
+                    [(priority, now, org_id) for org_id, priority in rows]
+                )
+            return conn.total_changes - before
+
+        changed = self._transaction(add_rows)
+        logger.info("Очередь %s: поставлено или обновлено %d задач", self.filepath, changed)
+        return changed
+
+    def mark_done(self, ids):
+        """Организации, уже собранные в выходной файл до появления очереди"""
+        self._transaction(lambda conn, now: conn.executemany(
+            "UPDATE jobs SET state = 'done', updated = ? WHERE org_id = ? AND state = 'pending'",
+            [(now, org_id) for org_id in ids]
+        ))
+
+    def _expire_leases(self, conn, now: float):
+        expired = conn.execute(
+            "SELECT org_id, lease_owner FROM jobs WHERE state = 'leased' AND lease_expires < ?", (now,)
+        ).fetchall()
+        for org_id, owner in expired:
+            logger.warning("Аренда организации %s у %s истекла", org_id, owner)
+        conn.execute(
+            "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "lease_owner = NULL, lease_expires = NULL, error = 'lease expired', updated = ? "
+            "WHERE state = 'leased' AND lease_expires < ?",
+            (self.max_attempts, now, now)
+        )
+
+    def expire(self):
+        """Вернуть в очередь задачи с истекшей арендой"""
+        self._transaction(self._expire_leases)
+
+    def lease(self, count: int = 1) -> list:
+        """Аренда до count задач с наибольшим приоритетом"""
+        def lease_rows(conn, now):
+            self._expire_leases(conn, now)
+            ids = [row[0] for row in conn.execute(
+                "SELECT org_id FROM jobs WHERE state = 'pending' ORDER BY priority DESC, org_id LIMIT ?", (count,)
+            )]
+            conn.executemany(
+                "UPDATE jobs SET state = 'leased', attempts = attempts + 1, lease_owner = ?, "
+                "lease_expires = ?, updated = ? WHERE org_id = ?",
+                [(self.owner, now + self.lease_seconds, now, org_id) for org_id in ids]
+            )
+            return ids
+
+        return self._transaction(lease_rows)
+
+    def iter_leases(self):
+        """Задачи по одной, пока очередь не опустеет (источник id для scheduler.schedule)"""
+        while True:
+            ids = self.lease(1)
+            if not ids:
+                return
+            yield ids[0]
+
+    def renew(self, org_id: int = None) -> bool:
+        """
+        Продление аренды org_id (или всех аренд и выходных файлов процесса).
+        False, если задача уже не арендована этим процессом
+        """
+        def renew_rows(conn, now):
+            expires = now + self.lease_seconds
+            if org_id is not None:
+                return conn.execute(
+                    "UPDATE jobs SET lease_expires = ? WHERE org_id = ? AND state = 'leased' AND lease_owner = ?",
+                    (expires, org_id, self.owner)
+                ).rowcount > 0
+            conn.execute("UPDATE outputs SET lease_expires = ? WHERE owner = ?", (expires, self.owner))
+            return conn.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE state = 'leased' AND lease_owner = ?", (expires, self.owner)
+            ).rowcount > 0
+
+        return self._transaction(renew_rows)
+
+    def _heartbeat_loop(self, interval: float):
+        while not self._stopped.wait(interval):
+            try:
+                self.renew()
+            except sqlite3.Error as e:
+                logger.error("Не удалось продлить аренды в %s: %s", self.filepath, e)
+
+    def start_heartbeat(self, interval: float = None):
+        """Фоновое продление аренд каждую треть срока аренды"""
+        if self._heartbeat is not None:
+            return
+        self._stopped.clear()
+        self._heartbeat = threading.Thread(
+            target=self._heartbeat_loop, args=(interval or self.lease_seconds / 3,),
+            name='job-queue-heartbeat', daemon=True
+        )
+        self._heartbeat.start()
+
+    def stop_heartbeat(self):
+        if self._heartbeat is not None:
+            self._stopped.set()
+            self._heartbeat.join()
+            self._heartbeat = None
+
+    def claim_output(self, path: str) -> str or None:
+        """
+        Закрепление выходного файла за процессом: писатели перезаписывают и обрезают
+        файл, поэтому два процесса в один файл писать не могут.
+        Возвращает владельца, если файл занят другим живым процессом, иначе None
+        """
+        path = os.path.abspath(path)
+
+        def claim(conn, now):
+            row = conn.execute("SELECT owner, lease_expires FROM outputs WHERE path = ?", (path,)).fetchone()
+            if row and row[0] != self.owner and row[1] >= now:
+                return row[0]
+            conn.execute(
+                "INSERT OR REPLACE INTO outputs (path, owner, lease_expires) VALUES (?, ?, ?)",
+                (path, self.owner, now + self.lease_seconds)
+            )
+            return None
+
+        return self._transaction(claim)
+
+    def complete(self, org_id: int, reviews: int = None) -> bool:
+        """Задача выполнена. False, если аренда уже была отдана другому процессу"""
+        def complete_row(conn, now):
+            cursor = conn.execute(
+                "UPDATE jobs SET state = 'done', reviews = ?, error = NULL, lease_owner = NULL, "
+                "lease_expires = NULL, updated = ? WHERE org_id = ? AND state = 'leased' AND lease_owner = ?",
+                (reviews, now, org_id, self.owner)
+            )
+            return cursor.rowcount > 0
+
+        completed = self._transaction(complete_row)
+        if not completed:
+            logger.warning("Организация %s уже не арендована этим процессом (%s)", org_id, self.owner)
+        return completed
+
+    def fail(self, org_id: int, error) -> str:
+        """Ошибка: задача возвращается в очередь, пока не исчерпаны попытки"""
+        def fail_row(conn, now):
+            conn.execute(
+                "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "error = ?, lease_owner = NULL, lease_expires = NULL, updated = ? "
+                "WHERE org_id = ? AND state = 'leased' AND lease_owner = ?",
+                (self.max_attempts, str(error)[:1000], now, org_id, self.owner)
+            )
+            row = conn.execute("SELECT state FROM jobs WHERE org_id = ?", (org_id,)).fetchone()
+            return row[0] if row else None
+
+        return self._transaction(fail_row)
+
+    def release(self) -> int:
+        """
+        Возврат незавершенных задач этого процесса (остановка по Ctrl+C) без траты попытки
+        и освобождение его выходных файлов
+        """
+        def release_rows(conn, now):
+            return conn.execute(
+                "UPDATE jobs SET state = 'pending', attempts = MAX(attempts - 1, 0), lease_owner = NULL, "
+                "lease_expires = NULL, updated = ? WHERE state = 'leased' AND lease_owner = ?",
+                (now, self.owner)
+            ).rowcount
+
+        def release_all(conn, now):
+            conn.execute("DELETE FROM outputs WHERE owner = ?", (self.owner,))
+            return release_rows(conn, now)
+
+        released = self._transaction(release_all)
+        if released:
+            logger.info("Возвращено в очередь %d незавершенных задач", released)
+        return released
+
+    def retry_failed(self) -> int:
+        return self._transaction(lambda conn, now: conn.execute(
+            "UPDATE jobs SET state = 'pending', attempts = 0, updated = ? WHERE state = 'failed'", (now,)
+        ).rowcount)
+
+    def counts(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        counts.update(rows)
+        return counts
+
+    def close(self):
+        self.stop_heartbeat()
+        with self._lock:
+            self._conn.close()
@@ -1,28 +1,122 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
 from typing import Optional
 
+# Слушатель очереди текущей конфигурации (останавливается при перенастройке)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Ограничение частоты по ключу сообщения: не больше burst записей за interval
+    секунд, сверх этого - каждая sample-я (0 - ни одной). Ключ - extra log_key
+    или шаблон сообщения, поэтому в горячих циклах нужно %-форматирование,
+    а не f-строки. Ограничиваются записи ниже min_level и записи с log_key.
+    Число пропущенных записей дописывается к следующей выпущенной
+    """
+
+    def __init__(self, burst: int = 20, interval: float = 10.0, sample: int = 0,
+                 min_level: int = logging.INFO):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.sample = sample
+        self.min_level = min_level
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, 'log_key', None)
+        if key is None:
+            if record.levelno >= self.min_level:
+                return True
+            key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                # [начало окна, выпущено, пропущено]
+                suppressed = window[2] if window else 0
+                window = self._windows[key] = [now, 0, 0]
+            else:
+                suppressed = 0
+            window[1] += 1
+            allowed = window[1] <= self.burst or (
+                self.sample and (window[1] - self.burst) % self.sample == 0
+            )
+            if not allowed:
+                window[2] += 1
+                return False
+            suppressed += window[2]
+            window[2] = 0
+        if suppressed:
+            record.msg = f'{record.msg} (пропущено похожих: {suppressed})'
+        return True
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler без форматирования в потоке парсера: запись уходит в очередь
+    как есть, строку собирает поток слушателя
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _stop_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def configure_logging(
         debug: bool = False,
-        log_file: Optional[str] = None
+        log_file: Optional[str] = None,
+        max_bytes: int = 50 * 1024 ** 2,
+        backup_count: int = 5,
+        rate_limit: Optional[RateLimitFilter] = None
 ) -> None:
+    global _listener
+
     # Очищаем предыдущие обработчики
+    _stop_listener()
     for handler in logging.getLogger().handlers[:]:
         logging.getLogger().removeHandler(handler)
 
     fmt_str = '%(asctime)s %(levelname)s %(name)s - %(message)s'
     datefmt = '%Y-%m-%d %H:%M:%S'
-
-    # Основной обработчик для stdout
-    handler = logging.StreamHandler(stream=sys.stdout)
     formatter = logging.Formatter(
         fmt=fmt_str,
         datefmt=datefmt,
     )
+
+    # Основной обработчик для stdout
+    handler = logging.StreamHandler(stream=sys.stdout)
     handler.setFormatter(formatter)
+    handlers = [handler]
+
+    # Файл с ротацией по размеру
+    if log_file:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
 
-    logging.getLogger().addHandler(handler)
+    # Форматирование и запись - в отдельном потоке, парсер только кладет запись в очередь
+    log_queue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(rate_limit or RateLimitFilter())
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    logging.getLogger().addHandler(queue_handler)
 
     # Устанавливаем уровень логирования
     if debug:
@@ -32,6 +126,12 @@ def configure_logging(
     else:
         logging.getLogger().setLevel(logging.INFO)
 
-    logging.info(f'Logging configured successfully')
+    logging.info('Logging configured successfully')
     if debug:
-        logging.debug('Debug logging is enabled')
\ No newline at end of file
+        logging.debug('Debug logging is enabled')
+    if log_file:
+        logging.info('Log file: %s', log_file)
+
+
+# Дописываем очередь до выхода из процесса
+atexit.register(_stop_listener)
@@ -3,37 +3,57 @@ import json
 import logging
 import os
 import re
-import time
 
 from selenium.webdriver import Firefox
 from selenium.webdriver.remote.webelement import WebElement
 
+from parser import metrics
 from parser import selenium_helper as sh
 from . import smart_parser
+from . import state_parser
 from parser.classes import Review
+from parser.writer import JsonlWriter, is_append_only
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+BASE_URL = 'https://yandex.ru'
+
+
+def organization_url(org_id: int, base_url: str = None) -> str:
+    return f"{base_url or BASE_URL}/maps/org/yandeks/{org_id}/reviews/"
+
+
+def save_json(data, filepath, org_id=None):
+    # Файлы .jsonl не перезаписываются: данные дописываются одной пачкой
+    if is_append_only(filepath):
+        JsonlWriter(filepath).commit(org_id, data if isinstance(data, list) else [data])
+        return
 
-def save_json(data, filepath):
     # Создаем директорию, если она не существует
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
 
-    with open(filepath, 'w', encoding='utf-8') as json_file:
+    with metrics.timer('save'), open(filepath, 'w', encoding='utf-8') as json_file:
         json.dump(data, json_file, ensure_ascii=False, indent=2)
-    logger.info(f'Saved {filepath}')
+    logger.info('Saved %s', filepath)
 
 
-def mode_script_content(driver: Firefox, filepath):
-    script_element = driver.find_element(by='xpath', value='//script[@class="state-view"]')
+def load_json(filepath, default=None):
+    if not os.path.exists(filepath):
+        return default
+    if is_append_only(filepath):
+        return list(JsonlWriter(filepath).iter_records())
+    with open(filepath, 'r', encoding='utf-8') as json_file:
+        return json.load(json_file)
+
+
+def mode_script_content(driver: Firefox, filepath, limit: int = None, org_id: int = None):
+    script_element = sh.wait_element_by_xpath(driver=driver, xpath='//script[@class="state-view"]')
     script_content = script_element.get_attribute("innerHTML")
-    save_json(json.loads(script_content), filepath)
+    save_json(json.loads(script_content), filepath, org_id=org_id)
 
 
 def mode_reviews(driver: Firefox, filepath, limit: int = None, org_id: int = None):  # Добавляем org_id как параметр
-    # Ждем загрузки страницы
-    time.sleep(3)
-
+    # Ждем загрузки заголовка с количеством отзывов
     total_reviews: WebElement = sh.wait_element_by_xpath(
         driver=driver,
         xpath='//*[@class="card-section-header__title _wide"]',
@@ -43,47 +63,40 @@ def mode_reviews(driver: Firefox, filepath, limit: int = None, org_id: int = Non
 
     if limit is not None and limit < total_reviews_count:
         reviews_to_collect = limit
-        logger.info(f"Лимит установлен. Будет собрано {reviews_to_collect} из {total_reviews_count} отзывов.")
+        logger.info("Лимит установлен. Будет собрано %d из %d отзывов.", reviews_to_collect, total_reviews_count)
     else:
         reviews_to_collect = total_reviews_count
-        logger.info(f"Лимит не установлен. Будет собрано все {total_reviews_count} отзывов.")
+        logger.info("Лимит не установлен. Будет собрано все %d отзывов.", total_reviews_count)
 
-    data = []
-    for i in range(1, reviews_to_collect + 1):
-        try:
-            review_elem = sh.wait_element_by_xpath(
-                xpath=f'''(//*[@class="business-review-view__info"])[{i}]''',
-                driver=driver
-            )
-            driver.execute_script("arguments[0].scrollIntoView(true);", review_elem)
-
-            # Добавляем небольшую задержку для стабилизации
-            time.sleep(0.1)
-
-            # Создаем отзыв с передачей place_id
-            new_review = Review(place_id=org_id)
-            new_review.parse_base_information(review_elem=review_elem)
-
-            # Формируем только необходимые поля
-            review_data = {
-                # 'author': new_review.author,
-                # 'selenium_id': new_review.selenium_id,
-                # 'review_text': new_review.review_text,
-                'review_rating': new_review.review_rating,
-                'datetime': new_review.datetime,
-                'place_id': new_review.place_id,  # Добавляем place_id в данные
-            }
-
-            data.append(review_data)
-            logger.debug(f"Собран отзыв {i}/{reviews_to_collect}")
-
-        except Exception as e:
-            logger.error(f"Ошибка при парсинге отзыва {i}: {e}")
-            continue
+    # Дожидаемся первых отзывов
+    sh.wait_for_new_reviews(driver, timeout=10)
 
-    # Проверяем, существует ли файл
-    if os.path.exists(filepath):
-        logger.info(f"Файл {filepath} уже существует. Загружаем существующие данные...")
+    data = []
+    empty_steps = 0
+    while len(data) < reviews_to_collect and empty_steps < 10:
+        # Все новые отзывы за один вызов вместо XPath по индексу для каждого
+        ratings, dates = sh.extract_new_reviews(driver)
+        new_reviews = Review.bulk_from_arrays(ratings, dates, place_id=org_id)
+        new_reviews = new_reviews[:reviews_to_collect - len(data)]
+
+        # Формируем только необходимые поля
+        data.extend(review.to_record() for review in new_reviews)
+        metrics.incr('reviews', len(new_reviews))
+        logger.debug("Собрано %d/%d отзывов", len(data), reviews_to_collect)
+
+        if new_reviews:
+            empty_steps = 0
+        else:
+            empty_steps += 1
+            # Даем странице подгрузить следующую порцию
+            metrics.incr('scroll_steps')
+            sh.politeness_pause(driver)
+            sh.scroll_to_last_review(driver)
+            sh.wait_for_new_reviews(driver, timeout=5)
+
+    # Проверяем, существует ли файл (в .jsonl новые отзывы просто дописываются)
+    if os.path.exists(filepath) and not is_append_only(filepath):
+        logger.info("Файл %s уже существует. Загружаем существующие данные...", filepath)
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 existing_data = json.load(f)
@@ -97,15 +110,15 @@ def mode_reviews(driver: Firefox, filepath, limit: int = None, org_id: int = Non
 
                 if new_data:
                     combined_data = existing_data + new_data
-                    logger.info(f"Добавлено {len(new_data)} новых отзывов к существующим {len(existing_data)}")
+                    logger.info("Добавлено %s новых отзывов к существующим %s", len(new_data), len(existing_data))
                     data = combined_data
                 else:
                     logger.info("Нет новых отзывов для добавления")
                     data = existing_data
         except Exception as e:
-            logger.error(f"Ошибка при чтении существующего файла: {e}. Создаем новый.")
+            logger.error("Ошибка при чтении существующего файла: %s. Создаем новый.", e)
 
-    save_json(data, filepath)
+    save_json(data, filepath, org_id=org_id)
 
 
 # Режимы работы
@@ -113,30 +126,44 @@ MODE_DICT = {
     'reviews': mode_reviews,
     'smart': smart_parser.mode_reviews_smart, 
     'experimental': mode_script_content,
+    'state': state_parser.mode_reviews_state,
+    'pruned': smart_parser.mode_reviews_pruned,
 }
 
 def get_organization_reviews(driver: Firefox, mode: str, implicitly_wait: int = 0,
-                             org_id: int = 1124715036, limit: int = None, output_path: str = None):
-    organization_url = f"https://yandex.ru/maps/org/yandeks/{org_id}/reviews/"
-    logger.info(f'Start {organization_url=} {implicitly_wait=}')
+                             org_id: int = 1124715036, limit: int = None, output_path: str = None,
+                             since: str = None, snapshots=None, newest_first: bool = False):
+    url = organization_url(org_id)
+    logger.info('Start url=%r implicitly_wait=%s', url, implicitly_wait)
     driver.implicitly_wait(implicitly_wait)
 
     # Определяем путь к файлу
     if output_path:
         filepath = output_path
-        logger.info(f"Используем указанный путь: {filepath}")
+        logger.info("Используем указанный путь: %s", filepath)
     else:
         # Если файл не указан, используем папку json и файл reviews.json
         json_dir = os.path.join(os.getcwd(), 'json')
         filepath = os.path.join(json_dir, 'reviews.json')
-        logger.info(f"Путь не указан. Используем путь по умолчанию: {filepath}")
-
-    driver.get(organization_url)
-    # Передаем org_id в функцию mode_reviews
-    if mode == 'reviews':
-        MODE_DICT[mode](driver=driver, filepath=filepath, limit=limit, org_id=org_id)
-    else:
-        MODE_DICT[mode](driver=driver, filepath=filepath, limit=limit)
+        logger.info("Путь не указан. Используем путь по умолчанию: %s", filepath)
+
+    with metrics.org_scope(org_id):
+        sh.navigate(driver, url)
+        # Передаем org_id во все режимы, чтобы в записях был place_id
+        mode_kwargs = dict(driver=driver, filepath=filepath, limit=limit, org_id=org_id)
+        # Инкрементальный режим: только отзывы новее известной отметки
+        if since is not None:
+            mode_kwargs['since'] = since
+        # Первый инкрементальный проход: сортировка по новизне, чтобы можно было поставить отметку
+        if newest_first:
+            mode_kwargs['newest_first'] = True
+        data = MODE_DICT[mode](**mode_kwargs)
+
+        # Снимок отрисованной страницы для повторного разбора без сайта (SnapshotCache)
+        if snapshots is not None:
+            with metrics.timer('snapshot'):
+                snapshots.record(driver, org_id, mode=mode)
+    return data
 
 
 if __name__ == '__main__':
@@ -0,0 +1,120 @@
+# file name: parser/map_bundle.py
+import json
+import logging
+import math
+import os
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+# Те же пороги, что в getColorByValue из map/map.js
+COLOR_STOPS = [
+    (0.0, '#600010'),
+    (3.0, '#ff0000'),
+    (3.8, '#ff6600'),
+    (4.0, '#ffcc00'),
+    (4.2, '#e1ff00ff'),
+    (4.4, '#0ad70aff'),
+    (4.8, '#008b00ff'),
+    (5.0, '#003c1e'),
+]
+PERFECT_COLOR = '#067198ff'
+PALETTE = [color for _, color in COLOR_STOPS] + [PERFECT_COLOR]
+
+MIN_SIZE = 15
+MAX_SIZE = 50
+SIZE_BUCKETS = 8
+
+
+def color_index(rating) -> int:
+    """Индекс цвета в PALETTE для рейтинга, как в getColorByValue"""
+    rating = rating or 0
+    if rating == 5.0:
+        return len(PALETTE) - 1
+    rating = max(0.0, min(5.0, rating))
+    for i in range(len(COLOR_STOPS) - 1):
+        if COLOR_STOPS[i][0] <= rating <= COLOR_STOPS[i + 1][0]:
+            return i
+    return len(COLOR_STOPS) - 1
+
+
+def size_buckets(values, buckets: int = SIZE_BUCKETS) -> list:
+    """Корень из нормированного значения (как calculateSizeFromParam), квантованный в buckets ступеней"""
+    if not values:
+        return []
+    low, high = min(values), max(values)
+    if high == low:
+        return [buckets // 2] * len(values)
+    return [round(math.sqrt((v - low) / (high - low)) * (buckets - 1)) for v in values]
+
+
+def bucket_size(bucket: int, min_size: int = MIN_SIZE, max_size: int = MAX_SIZE, buckets: int = SIZE_BUCKETS) -> int:
+    return round(min_size + bucket / (buckets - 1) * (max_size - min_size))
+
+
+def circle_icon(color: str, size: int) -> str:
+    """Та же картинка кружка, что getCircleImageUrl"""
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}">'
+        f'<circle cx="{size / 2}" cy="{size / 2}" r="{size / 2 - 1}" fill="{color}"/>'
+        f'<circle cx="{size / 2}" cy="{size / 2}" r="{size / 3}" fill="white"/>'
+        f'<circle cx="{size / 2}" cy="{size / 2}" r="{size / 4}" fill="{color}"/>'
+        f'</svg>'
+    )
+    return 'data:image/svg+xml;charset=utf-8,' + quote(svg, safe='')
+
+
+def build_bundle(places, min_size: int = MIN_SIZE, max_size: int = MAX_SIZE, buckets: int = SIZE_BUCKETS) -> dict:
+    """
+    Данные карты по столбцам: вместо массива объектов - по массиву на поле,
+    плюс готовые индексы цвета и размера и общий набор иконок
+    """
+    places = [p for p in places if p.get('coords') and None not in p['coords'][:2]]
+    sizes = size_buckets([
+        p['reviewsNum'] if p.get('reviewsNum') is not None else (p.get('averageRating') or 0)
+        for p in places
+    ], buckets)
+    colors = [color_index(p.get('averageRating')) for p in places]
+
+    # Иконки только для встречающихся сочетаний цвета и размера
+    icons = {}
+    icon_column = []
+    for color, size in zip(colors, sizes):
+        icon_column.append(icons.setdefault((color, size), len(icons)))
+
+    return {
+        'count': len(places),
+        'columns': {
+            'id': [str(p['id']) for p in places],
+            'name': [p.get('name') for p in places],
+            'lat': [round(p['coords'][0], 6) for p in places],
+            'lon': [round(p['coords'][1], 6) for p in places],
+            'rating': [p.get('averageRating') for p in places],
+            'reviews': [p.get('reviewsNum') for p in places],
+            'color': colors,
+            'size': sizes,
+            'icon': icon_column,
+        },
+        'palette': PALETTE,
+        'sizes': [bucket_size(b, min_size, max_size, buckets) for b in range(buckets)],
+        'icons': [
+            circle_icon(PALETTE[color], bucket_size(size, min_size, max_size, buckets))
+            for (color, size) in icons
+        ],
+    }
+
+
+def write_bundle(places, filepath: str, **kwargs) -> dict:
+    """Запись map/data.js, который подключает map.html"""
+    bundle = build_bundle(places, **kwargs)
+    payload = json.dumps(bundle, ensure_ascii=False, separators=(',', ':'))
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('// Сгенерировано build_map_bundle.py, не редактировать вручную\n')
+        f.write(f'const mapBundle = {payload};\n')
+    os.replace(tmp_path, filepath)
+    logger.info(
+        f"Данные карты: {bundle['count']} мест, {len(bundle['icons'])} иконок, "
+        f"{os.path.getsize(filepath) / 1024:.1f} КБ в {filepath}"
+    )
+    return bundle
@@ -0,0 +1,142 @@
+# file name: parser/map_tiles.py
+import json
+import logging
+import math
+import os
+import shutil
+
+logger = logging.getLogger(__name__)
+
+TILE_SIZE = 256
+# Эксцентриситет эллипсоида WGS84: Яндекс Карты используют эллиптическую проекцию Меркатора
+WGS84_E = 0.0818191908426
+
+
+def lonlat_to_pixels(lat: float, lon: float, zoom: int) -> (float, float):
+    """Глобальные пиксельные координаты точки на заданном масштабе (как projection.toGlobalPixels)"""
+    world = TILE_SIZE * 2 ** zoom
+    phi = math.radians(max(-85.08, min(85.08, lat)))
+    esin = WGS84_E * math.sin(phi)
+    y_merc = math.log(math.tan(math.pi / 4 + phi / 2) * ((1 - esin) / (1 + esin)) ** (WGS84_E / 2))
+    x = (lon + 180) / 360 * world
+    y = (1 - y_merc / math.pi) / 2 * world
+    return x, y
+
+
+def _place_feature(place: dict) -> dict:
+    return {
+        'type': 'Feature',
+        'id': f"p{place['id']}",
+        'geometry': {'type': 'Point', 'coordinates': [place['coords'][0], place['coords'][1]]},
+        'properties': {
+            'yandexId': place['id'],
+            'name': place.get('name'),
+            'averageRating': place.get('averageRating'),
+            'reviewsNum': place.get('reviewsNum'),
+        },
+    }
+
+
+class _Cluster:
+    __slots__ = ('places', 'lat_sum', 'lon_sum', 'rating_sum', 'rated', 'reviews')
+
+    def __init__(self):
+        self.places = []
+        self.lat_sum = 0.0
+        self.lon_sum = 0.0
+        self.rating_sum = 0.0
+        self.rated = 0
+        self.reviews = 0
+
+    def add(self, place: dict):
+        self.places.append(place)
+        self.lat_sum += place['coords'][0]
+        self.lon_sum += place['coords'][1]
+        if place.get('averageRating') is not None:
+            self.rating_sum += place['averageRating']
+            self.rated += 1
+        self.reviews += place.get('reviewsNum') or 0
+
+    def feature(self, zoom: int, cell: tuple) -> dict:
+        if len(self.places) == 1:
+            return _place_feature(self.places[0])
+        count = len(self.places)
+        return {
+            'type': 'Feature',
+            'id': f'c{zoom}_{cell[0]}_{cell[1]}',
+            'geometry': {'type': 'Point', 'coordinates': [self.lat_sum / count, self.lon_sum / count]},
+            'properties': {
+                'cluster': True,
+                'count': count,
+                'averageRating': round(self.rating_sum / self.rated, 2) if self.rated else None,
+                'reviewsNum': self.reviews,
+            },
+        }
+
+
+def build_tiles(
+    places,
+    output_dir: str,
+    min_zoom: int = 0,
+    max_zoom: int = 17,
+    grid_size: int = 64,
+    cluster_max_zoom: int = 15
+) -> dict:
+    """
+    Кластеры по сетке grid_size x grid_size пикселей для каждого масштаба,
+    разложенные по тайлам <output_dir>/<z>/<x>/<y>.json (FeatureCollection).
+    Начиная с cluster_max_zoom + 1 места выдаются поодиночке
+    """
+    if TILE_SIZE % grid_size:
+        raise ValueError(f"grid_size должен делить размер тайла {TILE_SIZE}")
+    places = [p for p in places if p.get('coords') and None not in p['coords'][:2]]
+
+    if os.path.isdir(output_dir) and os.listdir(output_dir):
+        # Удаляем только папку, созданную этой же сборкой
+        if not os.path.exists(os.path.join(output_dir, 'meta.json')):
+            raise ValueError(f"{output_dir} не пуста и не похожа на папку тайлов")
+        shutil.rmtree(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    tiles_written = 0
+    for zoom in range(min_zoom, max_zoom + 1):
+        cell_px = grid_size if zoom <= cluster_max_zoom else 1
+        cells = {}
+        for place in places:
+            x, y = lonlat_to_pixels(place['coords'][0], place['coords'][1], zoom)
+            cell = (int(x // cell_px), int(y // cell_px))
+            cluster = cells.get(cell)
+            if cluster is None:
+                cluster = cells[cell] = _Cluster()
+            cluster.add(place)
+
+        tiles = {}
+        for cell, cluster in cells.items():
+            # Ячейки выровнены по тайлам: каждая целиком принадлежит одному тайлу
+            tile = (cell[0] * cell_px // TILE_SIZE, cell[1] * cell_px // TILE_SIZE)
+            tiles.setdefault(tile, []).append(cluster.feature(zoom, cell))
+
+        for (tile_x, tile_y), features in tiles.items():
+            tile_dir = os.path.join(output_dir, str(zoom), str(tile_x))
+            os.makedirs(tile_dir, exist_ok=True)
+            with open(os.path.join(tile_dir, f'{tile_y}.json'), 'w', encoding='utf-8') as f:
+                json.dump({'type': 'FeatureCollection', 'features': features}, f, ensure_ascii=False,
+                          separators=(',', ':'))
+        tiles_written += len(tiles)
+        logger.debug(f"Масштаб {zoom}: {len(cells)} объектов в {len(tiles)} тайлах")
+
+    lats = [p['coords'][0] for p in places]
+    lons = [p['coords'][1] for p in places]
+    meta = {
+        'minZoom': min_zoom,
+        'maxZoom': max_zoom,
+        'tileSize': TILE_SIZE,
+        'count': len(places),
+        'maxReviews': max((p.get('reviewsNum') or 0 for p in places), default=0),
+        'bounds': [[min(lats), min(lons)], [max(lats), max(lons)]] if places else None,
+    }
+    with open(os.path.join(output_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+    logger.info(f"Записано {tiles_written} тайлов для {len(places)} мест в {output_dir}")
+    return meta
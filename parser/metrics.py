@@ -0,0 +1,269 @@
+# file name: parser/metrics.py
+import cProfile
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_PREFIX = 'yandex_reviews'
+
+
+class StageStats:
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def to_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'total_s': round(self.total, 4),
+            'avg_s': round(self.total / self.count, 4) if self.count else None,
+            'max_s': round(self.max, 4),
+        }
+
+
+class _Scope:
+    """Этапы и счетчики одной организации или всего прогона"""
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+        self.seconds = 0.0
+
+    def add_time(self, name: str, seconds: float):
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        stats.add(seconds)
+
+    def incr(self, name: str, value: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_dict(self) -> dict:
+        return {
+            'seconds': round(self.seconds, 3),
+            'stages': {name: stats.to_dict() for name, stats in sorted(self.stages.items())},
+            'counters': dict(sorted(self.counters.items())),
+        }
+
+
+class Metrics:
+    """
+    Таймеры этапов и счетчики на весь прогон и на каждую организацию.
+    Организация берется из org_scope текущего потока: воркеры run_batch
+    обрабатывают свои организации независимо
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.run = _Scope()
+            self.orgs = {}
+            self.json_path = None
+            self.prometheus_path = None
+            self.export_interval = 10.0
+            self.profile_ids = set()
+            self.profile_dir = 'profiles'
+            self._exported = 0.0
+
+    def configure(self, json_path: str = None, prometheus_path: str = None, export_interval: float = 10.0,
+                  profile_ids=(), profile_dir: str = 'profiles'):
+        self.json_path = json_path
+        self.prometheus_path = prometheus_path
+        self.export_interval = export_interval
+        self.profile_ids = set(profile_ids or ())
+        self.profile_dir = profile_dir
+
+    def _org(self):
+        org_id = getattr(self._local, 'org_id', None)
+        if org_id is None:
+            return None
+        scope = self.orgs.get(org_id)
+        if scope is None:
+            scope = self.orgs[org_id] = _Scope()
+        return scope
+
+    def add_time(self, name: str, seconds: float):
+        with self._lock:
+            self.run.add_time(name, seconds)
+            org = self._org()
+            if org is not None:
+                org.add_time(name, seconds)
+
+    def incr(self, name: str, value: int = 1):
+        with self._lock:
+            self.run.incr(name, value)
+            org = self._org()
+            if org is not None:
+                org.incr(name, value)
+
+    @contextmanager
+    def timer(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    @contextmanager
+    def org_scope(self, org_id):
+        """Все замеры внутри блока относятся к организации org_id"""
+        if org_id is None or getattr(self._local, 'org_id', None) == org_id:
+            # Вложенный блок той же организации (run_batch -> get_organization_reviews)
+            yield
+            return
+
+        previous = getattr(self._local, 'org_id', None)
+        self._local.org_id = org_id
+        profiler = None
+        if org_id in self.profile_ids:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError as e:
+                # Профилировщик уже запущен другим воркером
+                logger.warning("Профилирование организации %s пропущено: %s", org_id, e)
+                profiler = None
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            if profiler is not None:
+                profiler.disable()
+                os.makedirs(self.profile_dir, exist_ok=True)
+                path = os.path.join(self.profile_dir, f'{org_id}.prof')
+                profiler.dump_stats(path)
+                logger.info("Профиль организации %s сохранен в %s", org_id, path)
+            with self._lock:
+                org = self._org()
+                org.seconds += elapsed
+                self.run.add_time('org', elapsed)
+                breakdown = ', '.join(
+                    f'{name} {stats.total:.1f}с' for name, stats in
+                    sorted(org.stages.items(), key=lambda item: -item[1].total)[:4]
+                )
+            self._local.org_id = previous
+            logger.info("Организация %s: %.1f сек (%s)", org_id, elapsed, breakdown)
+            self.maybe_export()
+
+    def summary(self) -> dict:
+        with self._lock:
+            run = self.run.to_dict()
+            run['seconds'] = round(time.time() - self.started, 3)
+            return {
+                'started': self.started,
+                'run': run,
+                'orgs': {str(org_id): scope.to_dict() for org_id, scope in self.orgs.items()},
+            }
+
+    def prometheus_text(self) -> str:
+        with self._lock:
+            stages = sorted(self.run.stages.items())
+            counters = sorted(self.run.counters.items())
+            orgs = len(self.orgs)
+            uptime = time.time() - self.started
+
+        lines = [
+            f'# HELP {PROMETHEUS_PREFIX}_stage_seconds_total Время по этапам парсинга',
+            f'# TYPE {PROMETHEUS_PREFIX}_stage_seconds_total counter',
+        ]
+        lines += [f'{PROMETHEUS_PREFIX}_stage_seconds_total{{stage="{name}"}} {stats.total:.6f}'
+                  for name, stats in stages]
+        lines += [
+            f'# HELP {PROMETHEUS_PREFIX}_stage_calls_total Количество выполнений этапа',
+            f'# TYPE {PROMETHEUS_PREFIX}_stage_calls_total counter',
+        ]
+        lines += [f'{PROMETHEUS_PREFIX}_stage_calls_total{{stage="{name}"}} {stats.count}' for name, stats in stages]
+        lines += [
+            f'# HELP {PROMETHEUS_PREFIX}_events_total Счетчики событий',
+            f'# TYPE {PROMETHEUS_PREFIX}_events_total counter',
+        ]
+        lines += [f'{PROMETHEUS_PREFIX}_events_total{{event="{name}"}} {value}' for name, value in counters]
+        lines += [
+            f'# TYPE {PROMETHEUS_PREFIX}_orgs_total counter',
+            f'{PROMETHEUS_PREFIX}_orgs_total {orgs}',
+            f'# TYPE {PROMETHEUS_PREFIX}_uptime_seconds gauge',
+            f'{PROMETHEUS_PREFIX}_uptime_seconds {uptime:.3f}',
+        ]
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, filepath: str):
+        # Атомарно: node_exporter может читать файл в любой момент
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, filepath)
+
+    def write_json(self, filepath: str):
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, filepath)
+
+    def maybe_export(self):
+        """Промежуточная выгрузка для длинных прогонов не чаще export_interval"""
+        now = time.monotonic()
+        if now - self._exported < self.export_interval:
+            return
+        self._exported = now
+        self.export()
+
+    def export(self):
+        try:
+            if self.prometheus_path:
+                self.write_prometheus(self.prometheus_path)
+            if self.json_path:
+                self.write_json(self.json_path)
+        except OSError as e:
+            logger.warning("Не удалось выгрузить метрики: %s", e)
+
+    def serve(self, port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+        """HTTP-эндпоинт /metrics в фоновом потоке"""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                payload = metrics.prometheus_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        logger.info("Метрики доступны на http://%s:%s/metrics", host, server.server_address[1])
+        return server
+
+
+# Общий реестр процесса
+METRICS = Metrics()
+timer = METRICS.timer
+incr = METRICS.incr
+org_scope = METRICS.org_scope
@@ -0,0 +1,65 @@
+# file name: parser/places.py
+import csv
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+PLACES_CSV = 'full_places.csv'
+PLACES_JSON = os.path.join('data', 'fixed_file_transformed_setted.json')
+PLACES_CSV_FIELDS = ['id', 'averageRating', 'reviewsNum', 'name', 'coords/0', 'coords/1']
+
+
+def _number(value, cast):
+    if value is None or value == '':
+        return None
+    return cast(value)
+
+
+def _compact(value):
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def place_from_row(row: dict) -> dict:
+    """Строка full_places.csv -> запись в формате data/*.json"""
+    return {
+        'id': str(row['id']),
+        'averageRating': _number(row.get('averageRating'), float),
+        'reviewsNum': _number(row.get('reviewsNum'), int),
+        'name': row.get('name'),
+        'coords': [_number(row.get('coords/0'), float), _number(row.get('coords/1'), float)],
+    }
+
+
+def place_to_row(place: dict) -> dict:
+    coords = place.get('coords') or [None, None]
+    return {
+        'id': place['id'],
+        # Целые рейтинги в справочнике записаны без дробной части ("5")
+        'averageRating': _compact(place.get('averageRating')),
+        'reviewsNum': place.get('reviewsNum'),
+        'name': place.get('name'),
+        'coords/0': coords[0],
+        'coords/1': coords[1],
+    }
+
+
+def iter_places(filepath: str = PLACES_CSV):
+    """Места из full_places.csv или из JSON-списка того же содержания"""
+    if filepath.endswith('.json'):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+        return
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            yield place_from_row(row)
+
+
+def load_places(filepath: str = PLACES_CSV) -> dict:
+    """place_id (int) -> место"""
+    places = {int(place['id']): place for place in iter_places(filepath)}
+    logger.debug("Загружено %s мест из %s", len(places), filepath)
+    return places
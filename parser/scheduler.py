@@ -0,0 +1,109 @@
+# file name: parser/scheduler.py
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Общий на все воркеры лимит запросов к хосту (токенов в секунду).
+    Скорость адаптивная: при ошибках и медленных ответах снижается вдвое,
+    при нормальных ответах постепенно возвращается к целевой
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = None,
+        min_rate: float = None,
+        slow_threshold: float = 5.0
+    ):
+        self.target_rate = rate
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.min_rate = min_rate or rate / 16
+        self.slow_threshold = slow_threshold
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Списывает токены (возможно, в долг) и возвращает, сколько ждать"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1):
+        """Блокирующее ожидание токена - для потоков с браузером"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1):
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def report(self, latency: float = None, error: bool = False):
+        """Обратная связь по ответу: подстройка скорости"""
+        with self._lock:
+            if error or (latency is not None and latency > self.slow_threshold):
+                new_rate = max(self.min_rate, self.rate / 2)
+                if new_rate < self.rate:
+                    logger.info("Снижаем скорость запросов: %.2f -> %.2f в сек", self.rate, new_rate)
+                self.rate = new_rate
+            elif self.rate < self.target_rate:
+                self.rate = min(self.target_rate, self.rate * 1.1)
+
+
+async def run_scheduled(ids, handle, on_result, concurrency: int = 1, bucket: TokenBucket = None):
+    """
+    Обработка ids в concurrency параллельных задачах.
+    ids - список или итератор (например, аренды из JobQueue.iter_leases):
+    следующий id берется, только когда воркер освободился.
+    handle(org_id) - блокирующая функция, выполняется в потоке;
+    on_result(org_id, result, error) вызывается в цикле событий, т.е. по одному
+    """
+    id_iter = iter(ids)
+
+    async def worker():
+        while True:
+            org_id = next(id_iter, None)
+            if org_id is None:
+                return
+
+            if bucket is not None:
+                await bucket.acquire_async()
+
+            try:
+                result = await asyncio.to_thread(handle, org_id)
+            except Exception as e:
+                if bucket is not None:
+                    bucket.report(error=True)
+                on_result(org_id, None, e)
+            else:
+                on_result(org_id, result, None)
+
+    workers = max(1, min(concurrency, len(ids)) if hasattr(ids, '__len__') else concurrency)
+    # Поток на каждую задачу, иначе стандартный пул ограничит параллелизм
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scrape-worker')
+    )
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+
+def schedule(ids, handle, on_result, concurrency: int = 1, bucket: TokenBucket = None):
+    """Синхронная обертка над run_scheduled"""
+    if not ids:
+        return
+    asyncio.run(run_scheduled(ids, handle, on_result, concurrency=concurrency, bucket=bucket))
@@ -0,0 +1,78 @@
+# file name: parser/scroll_controller.py
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ScrollController:
+    """
+    Управление прокруткой списка отзывов по заявленному количеству.
+    Цель - min(total, limit); шаг подбирается по тому, сколько пикселей
+    в среднем приходится на один новый отзыв; остановка - по достижении цели
+    или после stall_limit прокруток подряд без новых отзывов
+    """
+
+    def __init__(
+        self,
+        total: int = None,
+        limit: int = None,
+        base_step: int = 700,
+        min_step: int = 300,
+        max_step: int = 20000,
+        stall_limit: int = 3,
+        max_scrolls: int = None
+    ):
+        targets = [t for t in (total, limit) if t is not None]
+        self.target = min(targets) if targets else None
+        self.min_step = min_step
+        self.max_step = max_step
+        self.stall_limit = stall_limit
+
+        self.step = base_step
+        self.scrolls = 0
+        self.empty_streak = 0
+        # Сглаженные оценки: пикселей на отзыв и отзывов за удачную прокрутку
+        self.px_per_review = None
+        self.batch_size = None
+
+        if max_scrolls is None:
+            # Страховка от бесконечного цикла: с запасом на неудачные прокрутки
+            max_scrolls = 3 * (self.target or 1000) + 10
+        self.max_scrolls = max_scrolls
+
+    @staticmethod
+    def _ema(old, new, alpha=0.3):
+        return new if old is None else old + alpha * (new - old)
+
+    def update(self, new_count: int):
+        """Учет результата последней прокрутки"""
+        if self.scrolls == 0 and new_count == 0:
+            return
+
+        if new_count > 0:
+            self.empty_streak = 0
+            if self.scrolls:
+                self.px_per_review = self._ema(self.px_per_review, self.step / new_count)
+            self.batch_size = self._ema(self.batch_size, new_count)
+            # Прокручиваем примерно на одну подгружаемую порцию
+            if self.px_per_review is not None:
+                self.step = int(self.px_per_review * self.batch_size)
+        else:
+            self.empty_streak += 1
+            # Пусто - видимо, не дотянулись до подгрузки: увеличиваем шаг
+            self.step = int(self.step * 1.5)
+
+        self.step = max(self.min_step, min(self.max_step, self.step))
+
+    def next_step(self) -> int:
+        self.scrolls += 1
+        return self.step
+
+    def stop_reason(self, collected: int) -> str or None:
+        if self.target is not None and collected >= self.target:
+            return f"собрано {collected} из {self.target}"
+        if self.empty_streak >= self.stall_limit:
+            return f"нет новых отзывов {self.empty_streak} прокруток подряд"
+        if self.scrolls >= self.max_scrolls:
+            return f"достигнут предел прокруток {self.max_scrolls}"
+        return None
@@ -1,5 +1,7 @@
 import logging
+import re
 import time
+import weakref
 
 from selenium import webdriver
 from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
@@ -10,8 +12,25 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from parser import metrics
+
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Минимальный интервал между прокрутками одного браузера (секунды).
+# Ожидание загрузки засчитывается в этот интервал, а не добавляется к нему
+POLITENESS_DELAY = 0.5
+
+# Частота опроса страницы при ожидании условий
+POLL_INTERVAL = 0.05
+
+# Пауза между попытками wait_element_by_xpath (бенчмарки выставляют 0)
+RETRY_DELAY = 1
+
+_last_action_time = weakref.WeakKeyDictionary()
+
+# Общий лимит запросов к хосту (parser.scheduler.TokenBucket), если задан
+_rate_limiter = None
+
 
 def make_driver(debug=False):
     options = Options()
@@ -42,17 +61,260 @@ def wait_element_by_xpath(
         xpath: str,
         timeout: int = 10
 ) -> WebElement:
-    logger.debug(f'wait_element_by_xpath start {xpath=}')
+    logger.debug('wait_element_by_xpath start xpath=%r', xpath)
 
     for attempt_number in range(1, 4):  # Уменьшил количество попыток
+        metrics.incr('wait_element_attempts')
         try:
-            elem = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.XPATH, xpath))
-            )
-            logger.debug(f"Element found {attempt_number=} {elem.id=}")
+            with metrics.timer('wait_element'):
+                elem = WebDriverWait(driver, timeout).until(
+                    EC.presence_of_element_located((By.XPATH, xpath))
+                )
+            logger.debug('Element found attempt_number=%d elem.id=%s', attempt_number, elem.id)
             return elem
         except (StaleElementReferenceException, TimeoutException) as e:
-            logger.debug(f"Retry {attempt_number=} for {xpath}: {e}")
-            time.sleep(1)
+            metrics.incr('wait_element_timeouts')
+            logger.debug('Retry attempt_number=%d for %s: %s', attempt_number, xpath, e)
+            time.sleep(RETRY_DELAY)
+
+    metrics.incr('wait_element_failures')
+    raise Exception(f"Element not found after retries: {xpath}")
+
+# Один вызов на шаг прокрутки: собираем рейтинг и дату всех ещё не
+# обработанных отзывов, помечаем их и прокручиваем к последнему из них
+EXTRACT_NEW_REVIEWS_JS = """
+const scroll = arguments[0];
+const nodes = document.querySelectorAll('.business-review-view__info:not([data-parsed])');
+const ratings = [];
+const dates = [];
+for (const node of nodes) {
+    node.setAttribute('data-parsed', '1');
+    const date = node.querySelector('.business-review-view__date meta[itemprop="datePublished"]');
+    const rating = node.querySelector('[itemtype="http://schema.org/Rating"] meta[itemprop="ratingValue"]');
+    dates.push(date ? date.getAttribute('content') : null);
+    ratings.push(rating ? rating.getAttribute('content') : null);
+}
+if (scroll && nodes.length) {
+    nodes[nodes.length - 1].scrollIntoView(true);
+}
+return [ratings, dates];
+"""
+
+SCROLL_TO_LAST_REVIEW_JS = """
+const nodes = document.querySelectorAll('.business-review-view__info');
+if (nodes.length) {
+    nodes[nodes.length - 1].scrollIntoView(true);
+}
+"""
+
+
+# Вариант с очисткой DOM: новые отзывы собирает MutationObserver, поэтому
+# запрос не обходит страницу, а обработанные карточки удаляются. Последняя
+# обработанная карточка остается якорем для прокрутки и подгрузки
+EXTRACT_AND_PRUNE_REVIEWS_JS = """
+const scroll = arguments[0];
+if (!window.__reviewObserver) {
+    window.__pendingReviewNodes = Array.from(
+        document.querySelectorAll('.business-review-view__info:not([data-parsed])')
+    );
+    window.__reviewObserver = new MutationObserver(function(mutations) {
+        for (const mutation of mutations) {
+            for (const added of mutation.addedNodes) {
+                if (added.nodeType !== 1) continue;
+                if (added.matches('.business-review-view__info')) {
+                    window.__pendingReviewNodes.push(added);
+                } else {
+                    for (const node of added.querySelectorAll('.business-review-view__info')) {
+                        window.__pendingReviewNodes.push(node);
+                    }
+                }
+            }
+        }
+    });
+    window.__reviewObserver.observe(document.body, {childList: true, subtree: true});
+}
+
+const nodes = window.__pendingReviewNodes.filter(n => n.isConnected && !n.hasAttribute('data-parsed'));
+window.__pendingReviewNodes = [];
+const ratings = [];
+const dates = [];
+for (const node of nodes) {
+    node.setAttribute('data-parsed', '1');
+    const date = node.querySelector('.business-review-view__date meta[itemprop="datePublished"]');
+    const rating = node.querySelector('[itemtype="http://schema.org/Rating"] meta[itemprop="ratingValue"]');
+    dates.push(date ? date.getAttribute('content') : null);
+    ratings.push(rating ? rating.getAttribute('content') : null);
+}
+
+if (nodes.length) {
+    const card = (node) => node.closest('.business-reviews-card-view__review') || node;
+    if (window.__reviewSentinel && window.__reviewSentinel.isConnected) {
+        window.__reviewSentinel.remove();
+    }
+    for (let i = 0; i < nodes.length - 1; i++) {
+        card(nodes[i]).remove();
+    }
+    window.__reviewSentinel = card(nodes[nodes.length - 1]);
+    if (scroll) {
+        nodes[nodes.length - 1].scrollIntoView(true);
+    }
+}
+return [ratings, dates];
+"""
+
+PENDING_REVIEW_NODES_JS = """
+return (window.__pendingReviewNodes || []).filter(n => n.isConnected).length;
+"""
+
+
+def extract_new_reviews(driver: Firefox, scroll: bool = True, prune: bool = False):
+    """
+    Рейтинги и даты всех новых отзывов на странице одним execute_script.
+    При prune=True обработанные карточки удаляются из DOM, и стоимость шага
+    не растет с глубиной прокрутки
+    """
+    script = EXTRACT_AND_PRUNE_REVIEWS_JS if prune else EXTRACT_NEW_REVIEWS_JS
+    with metrics.timer('extract'):
+        ratings, dates = driver.execute_script(script, scroll)
+    return ratings, dates
+
+
+def scroll_to_last_review(driver: Firefox):
+    with metrics.timer('scroll'):
+        driver.execute_script(SCROLL_TO_LAST_REVIEW_JS)
+
+
+COUNT_NEW_REVIEWS_JS = """
+return document.querySelectorAll('.business-review-view__info:not([data-parsed])').length;
+"""
+
+
+def set_politeness_delay(seconds: float):
+    global POLITENESS_DELAY
+    POLITENESS_DELAY = max(0.0, seconds)
+
+
+def set_rate_limiter(limiter):
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def throttle():
+    """Ждем токен общего лимита запросов, если он задан"""
+    if _rate_limiter is not None:
+        _rate_limiter.acquire()
+
+
+def politeness_pause(driver: Firefox):
+    """Досыпаем только остаток минимального интервала с прошлого действия"""
+    now = time.monotonic()
+    last = _last_action_time.get(driver)
+    if last is not None:
+        remaining = POLITENESS_DELAY - (now - last)
+        if remaining > 0:
+            with metrics.timer('politeness'):
+                time.sleep(remaining)
+    # Каждая прокрутка подгружает данные - это запрос к хосту
+    throttle()
+    _last_action_time[driver] = time.monotonic()
+
+
+def navigate(driver: Firefox, url: str, throttled: bool = True):
+    """Открытие страницы в рамках общего лимита с отчетом о времени ответа"""
+    if throttled:
+        throttle()
+    started = time.monotonic()
+    try:
+        with metrics.timer('navigate'):
+            driver.get(url)
+    except Exception:
+        metrics.incr('navigate_errors')
+        if _rate_limiter is not None:
+            _rate_limiter.report(error=True)
+        raise
+    if _rate_limiter is not None:
+        _rate_limiter.report(latency=time.monotonic() - started)
+
+
+def wait_for_js_condition(
+        driver: Firefox,
+        script: str,
+        timeout: float = 10,
+        poll: float = None
+):
+    """Опрос скрипта до истинного результата; при таймауте возвращает None"""
+    try:
+        with metrics.timer('wait'):
+            return WebDriverWait(
+                driver, timeout, poll_frequency=poll or POLL_INTERVAL
+            ).until(lambda d: d.execute_script(script))
+    except TimeoutException:
+        metrics.incr('wait_timeouts')
+        logger.debug('wait_for_js_condition timeout timeout=%s', timeout)
+        return None
+
+
+def wait_for_new_reviews(driver: Firefox, timeout: float = 10, prune: bool = False) -> int:
+    """Ждем появления необработанных отзывов, возвращаем их количество (0 при таймауте)"""
+    script = PENDING_REVIEW_NODES_JS if prune else COUNT_NEW_REVIEWS_JS
+    return wait_for_js_condition(driver, script, timeout=timeout) or 0
+
+
+def sort_reviews_by_newest(driver: Firefox, timeout: float = 10) -> bool:
+    """Переключение списка отзывов на сортировку «По новизне»"""
+    try:
+        wait_element_by_xpath(
+            driver=driver,
+            xpath='//*[contains(@class, "rating-ranking-view")]',
+            timeout=timeout
+        ).click()
+        wait_element_by_xpath(
+            driver=driver,
+            xpath='//*[contains(@class, "rating-ranking-view__popup-line") and contains(., "По новизне")]',
+            timeout=timeout
+        ).click()
+    except Exception as e:
+        logger.warning("Не удалось включить сортировку по новизне: %s", e)
+        return False
+
+    # После смены сортировки список перерисовывается заново
+    wait_for_new_reviews(driver, timeout=timeout)
+    return True
+
+
+# Прокручиваем ближайший прокручиваемый контейнер списка отзывов (или окно)
+SCROLL_REVIEWS_FN_JS = """
+function scrollReviewsBy(px) {
+    const nodes = document.querySelectorAll('.business-review-view__info');
+    let box = nodes.length ? nodes[nodes.length - 1].parentElement : null;
+    while (box && box !== document.body) {
+        const style = getComputedStyle(box);
+        if (/(auto|scroll)/.test(style.overflowY) && box.scrollHeight > box.clientHeight) {
+            box.scrollBy(0, px);
+            return;
+        }
+        box = box.parentElement;
+    }
+    window.scrollBy(0, px);
+}
+"""
+
+SCROLL_REVIEWS_BY_JS = SCROLL_REVIEWS_FN_JS + "scrollReviewsBy(arguments[0]);"
+
+TOTAL_REVIEWS_TEXT_JS = """
+const header = document.querySelector('.card-section-header__title._wide')
+    || document.querySelector('.card-section-header__title');
+return header ? header.textContent : null;
+"""
+
+
+def scroll_reviews_by(driver: Firefox, px: int):
+    with metrics.timer('scroll'):
+        driver.execute_script(SCROLL_REVIEWS_BY_JS, px)
+
 
-    raise Exception(f"Element not found after retries: {xpath}")
\ No newline at end of file
+def read_total_reviews(driver: Firefox, timeout: float = 5) -> int or None:
+    """Количество отзывов из заголовка card-section-header__title"""
+    text = wait_for_js_condition(driver, TOTAL_REVIEWS_TEXT_JS, timeout=timeout)
+    digits = re.sub(pattern=r'\D', repl='', string=text or '')
+    return int(digits) if digits else None
@@ -1,85 +1,136 @@
 # file name: parser/smart_parser.py
-import random
-import time
 import logging
-from selenium.webdriver.common.by import By
-from .classes import Review
+from . import metrics
+from . import selenium_helper as sh
+from .classes import Review, review_key
+from .scroll_controller import ScrollController
+from .writer import is_append_only
 
 logger = logging.getLogger(__name__)
 
-def mode_reviews_smart(driver, filepath, limit=None, org_id=None):
-    """Умный парсинг с прокруткой"""
-    from .main import save_json
-    
-    time.sleep(2)
-    
-    data = []
-    scroll_attempts = 0
-    max_scrolls = 30
-    
-    while (limit is None or len(data) < limit) and scroll_attempts < max_scrolls:
-        # Находим все видимые отзывы
-        review_elems = driver.find_elements(
-            By.XPATH, '//*[@class="business-review-view__info"]'
-        )
-        
-        # Парсим каждый новый отзыв
-        for i, review_elem in enumerate(review_elems[len(data):], start=len(data)):
-            if limit and len(data) >= limit:
-                break
-                
-            try:
-                # Прокручиваем к отзыву
-                driver.execute_script("arguments[0].scrollIntoView(true);", review_elem)
-                time.sleep(0.1)
-                
-                new_review = Review(place_id=org_id)
-                new_review.parse_base_information(review_elem=review_elem)
-                
+
+class CollectedReviews(list):
+    """
+    Собранные отзывы и признак того, что по ним можно двигать отметку
+    инкрементального режима: список шел по новизне и дошел до известного
+    отзыва или до заявленного количества (иначе часть новых отзывов не собрана)
+    """
+    newest_first = False
+    complete = False
+
+    @property
+    def watermark_safe(self) -> bool:
+        return self.newest_first and self.complete
+
+
+def collect_reviews(driver, org_id=None, limit=None, scroll_timeout=5, since=None, prune=False, newest_first=False):
+    """
+    Умная прокрутка открытой страницы отзывов со сбором в память.
+    Если передан since (дата самого свежего известного отзыва), список
+    сортируется по новизне и прокрутка останавливается на первом известном отзыве;
+    newest_first включает сортировку и без since (первый инкрементальный проход).
+    При prune=True обработанные отзывы удаляются со страницы
+    """
+    # Ждем заголовок с количеством и первые отзывы вместо фиксированной паузы
+    total = sh.read_total_reviews(driver, timeout=10)
+    if total != 0:
+        sh.wait_for_new_reviews(driver, timeout=10)
+
+    sorted_newest = False
+    if since is not None or newest_first:
+        sorted_newest = sh.sort_reviews_by_newest(driver)
+        if not sorted_newest:
+            # Без сортировки по новизне нельзя остановиться раньше времени
+            since = None
+
+    # Цель прокрутки - заявленное количество отзывов (в инкрементальном режиме - неизвестно)
+    controller = ScrollController(total=total if since is None else None, limit=limit)
+    logger.info("Организация %s: заявлено отзывов %s, лимит %s", org_id, total, limit)
+
+    data = CollectedReviews()
+    data.newest_first = sorted_newest
+    seen_keys = set()
+    reached_known = False
+
+    while True:
+        # Забираем все новые отзывы за один вызов, прокруткой управляет контроллер
+        ratings, dates = sh.extract_new_reviews(driver, scroll=False, prune=prune)
+
+        collected = len(data)
+        with metrics.timer('dedup'):
+            for new_review in Review.bulk_from_arrays(ratings, dates, place_id=org_id):
+                if limit and len(data) >= limit:
+                    break
+
                 if new_review.datetime:
-                    review_data = {
-                        'review_rating': new_review.review_rating,
-                        'datetime': new_review.datetime,
-                        'place_id': new_review.place_id,
-                    }
-                    
+                    if since is not None and new_review.datetime <= since:
+                        reached_known = True
+                        break
+
+                    review_data = new_review.to_record()
+
                     # Проверяем дубликаты
-                    if not any(d['datetime'] == review_data['datetime'] for d in data):
+                    key = review_key(review_data)
+                    if key not in seen_keys:
+                        seen_keys.add(key)
                         data.append(review_data)
-                        logger.debug(f"Собран отзыв {len(data)}" + (f"/{limit}" if limit else ""))
-                        
-            except Exception as e:
-                logger.debug(f"Ошибка парсинга отзыва: {e}")
-                continue
-        
-        # Если собрали достаточно - выходим
-        if limit and len(data) >= limit:
+                    else:
+                        metrics.incr('duplicates')
+        metrics.incr('reviews', len(data) - collected)
+
+        controller.update(len(dates))
+        logger.debug("Собрано отзывов %d/%s", len(data), limit or '-')
+
+        # Дошли до уже собранных отзывов - дальше только старые
+        if reached_known:
+            logger.info("Достигнут известный отзыв, новых отзывов: %d", len(data))
+            data.complete = True
             break
-            
-        # Умная прокрутка
-        time.sleep(random.uniform(0.5, 1.5))
-        
-        # Разные способы прокрутки
-        if scroll_attempts % 3 == 0:
-            driver.execute_script("window.scrollBy(0, 700);")
-        elif scroll_attempts % 3 == 1:
-            # Прокрутка к последнему отзыву
-            if review_elems:
-                driver.execute_script("arguments[0].scrollIntoView(true);", review_elems[-1])
-        else:
-            # Рандомная прокрутка
-            driver.execute_script(f"window.scrollBy(0, {random.randint(500, 900)});")
-        
-        scroll_attempts += 1
-        
-        # Если долго нет прогресса - выходим
-        if scroll_attempts > 10 and len(data) == 0:
-            logger.warning("Отзывы не загружаются")
+
+        stop_reason = controller.stop_reason(len(data))
+        if stop_reason:
+            logger.info("Остановка прокрутки: %s", stop_reason)
+            # Полным считаем только сбор всех заявленных отзывов: остановка по таймауту
+            # бывает и от медленной сети или капчи
+            data.complete = not (limit and len(data) >= limit) and total is not None and len(seen_keys) >= total
             break
-            
-        if scroll_attempts % 5 == 0:
-            logger.info(f"Прокруток: {scroll_attempts}, собрано отзывов: {len(data)}")
-    
+
+        # Прокрутка не чаще минимального интервала
+        metrics.incr('scroll_steps')
+        sh.politeness_pause(driver)
+        sh.scroll_reviews_by(driver, controller.next_step())
+
+        # Ждем, пока подгрузятся новые отзывы, но не дольше таймаута
+        sh.wait_for_new_reviews(driver, timeout=scroll_timeout, prune=prune)
+
+        if controller.scrolls % 5 == 0:
+            logger.info(
+                "Прокруток: %d, шаг %d px, собрано отзывов: %d", controller.scrolls, controller.step, len(data),
+                extra={'log_key': 'scroll_progress'}
+            )
+
+    return data
+
+def mode_reviews_smart(driver, filepath, limit=None, org_id=None, since=None, prune=False, newest_first=False):
+    """Умный парсинг с прокруткой"""
+    from .main import save_json, load_json
+
+    data = collect_reviews(driver, org_id=org_id, limit=limit, since=since, prune=prune, newest_first=newest_first)
+    logger.info("Собрано %d отзывов для организации %s", len(data), org_id)
+
+    # В инкрементальном режиме дописываем новые отзывы к уже сохраненным
+    # (.jsonl и так пишется только дозаписью)
+    to_save = data
+    if since is not None and not is_append_only(filepath):
+        existing = load_json(filepath, default=[])
+        existing_keys = {review_key(r) for r in existing if 'datetime' in r and 'place_id' in r}
+        to_save = existing + [r for r in data if review_key(r) not in existing_keys]
+
     # Сохраняем
-    save_json(data, filepath)
-    logger.info(f"Собрано {len(data)} отзывов для организации {org_id}")
\ No newline at end of file
+    save_json(to_save, filepath, org_id=org_id)
+    return data
+
+def mode_reviews_pruned(driver, filepath, limit=None, org_id=None, since=None, newest_first=False):
+    """Умный парсинг с удалением обработанных отзывов из DOM: шаг не дорожает с глубиной"""
+    return mode_reviews_smart(driver, filepath, limit=limit, org_id=org_id, since=since, prune=True,
+                              newest_first=newest_first)
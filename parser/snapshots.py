@@ -0,0 +1,295 @@
+# file name: parser/snapshots.py
+import gzip
+import hashlib
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+# Свежие объекты сборщик не трогает: ссылку на них другой процесс мог еще не записать
+GC_GRACE_SECONDS = 600
+
+# Отрисованная страница целиком и исходный JSON состояния
+CAPTURE_PAGE_JS = """
+const state = document.querySelector('script.state-view');
+return [document.documentElement.outerHTML, state ? state.textContent : null];
+"""
+
+
+def _object_path(directory: str, digest: str) -> str:
+    return os.path.join(directory, 'objects', digest[:2], digest + '.gz')
+
+
+def read_object(directory: str, digest: str or None) -> str or None:
+    if digest is None:
+        return None
+    with gzip.open(_object_path(directory, digest), 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+def load_snapshot(directory: str, ref: dict) -> (str, str or None):
+    """HTML и state-view снимка"""
+    return read_object(directory, ref['html']), read_object(directory, ref['state'])
+
+
+def _atomic_write(path: str, data: bytes):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class SnapshotCache:
+    """
+    Снимки страниц отзывов на диске. Содержимое (HTML и state-view) хранится
+    сжатым под своим sha256 в objects/, а refs/<org_id>.json указывает на
+    последний снимок организации. Одинаковые страницы хранятся один раз.
+    Снимки старше ttl секунд и самые старые сверх max_bytes удаляются
+    """
+
+    def __init__(self, directory: str, ttl: float = DEFAULT_TTL, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.objects_dir = os.path.join(directory, 'objects')
+        self.refs_dir = os.path.join(directory, 'refs')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.refs_dir, exist_ok=True)
+        # Снимки пишут несколько воркеров run_batch
+        self._lock = threading.Lock()
+        # Размеры сжатых объектов, чтобы не опрашивать диск на каждом снимке
+        self._object_sizes = {}
+
+        self.refs = self._read_refs()
+        self.evict()
+
+    def _read_refs(self) -> dict:
+        refs = {}
+        for name in os.listdir(self.refs_dir):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.refs_dir, name), 'r', encoding='utf-8') as f:
+                    ref = json.load(f)
+                refs[ref['org_id']] = ref
+            except FileNotFoundError:
+                # Удален другим процессом между listdir и open
+                continue
+            except (ValueError, KeyError) as e:
+                logger.warning("Пропускаем поврежденный снимок %s: %s", name, e)
+        return refs
+
+    def _object_path(self, digest: str) -> str:
+        return _object_path(self.directory, digest)
+
+    def _put_object(self, text: str) -> str:
+        data = text.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        try:
+            # Повторно использованный объект "молодеет" и не попадает под сборку мусора
+            os.utime(path)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _atomic_write(path, gzip.compress(data, compresslevel=6))
+        return digest
+
+    def put(self, org_id: int, html: str, state: str = None, **meta) -> dict:
+        """Сохранение снимка организации (заменяет предыдущий)"""
+        with self._lock:
+            ref = {
+                'org_id': org_id,
+                'taken': time.time(),
+                'html': self._put_object(html),
+                'state': self._put_object(state) if state is not None else None,
+                **meta,
+            }
+            ref['size'] = sum(self._object_size(digest) for digest in {ref['html'], ref['state']} if digest)
+            _atomic_write(os.path.join(self.refs_dir, f'{org_id}.json'), json.dumps(ref).encode('utf-8'))
+            self.refs[org_id] = ref
+            self._evict_locked()
+        logger.debug("Снимок %s: html %s, %.1f КБ", org_id, ref['html'][:12], ref['size'] / 1024)
+        return ref
+
+    def record(self, driver, org_id: int, **meta) -> dict or None:
+        """Снимок страницы, открытой в браузере"""
+        try:
+            html, state = driver.execute_script(CAPTURE_PAGE_JS)
+        except Exception as e:
+            logger.warning("Не удалось снять страницу %s: %s", org_id, e)
+            return None
+        return self.put(org_id, html, state, url=driver.current_url, **meta)
+
+    def get(self, org_id: int) -> dict or None:
+        ref = self.refs.get(org_id)
+        if ref is None or self._expired(ref, time.time()):
+            return None
+        return ref
+
+    def load(self, ref: dict) -> (str, str or None):
+        return load_snapshot(self.directory, ref)
+
+    def _expired(self, ref: dict, now: float) -> bool:
+        return bool(self.ttl) and now - ref['taken'] > self.ttl
+
+    def _drop(self, org_id):
+        self.refs.pop(org_id, None)
+        try:
+            os.remove(os.path.join(self.refs_dir, f'{org_id}.json'))
+        except FileNotFoundError:
+            pass
+
+    def evict(self):
+        with self._lock:
+            self._evict_locked()
+
+    def _evict_locked(self):
+        now = time.time()
+        expired = [org_id for org_id, ref in self.refs.items() if self._expired(ref, now)]
+        for org_id in expired:
+            self._drop(org_id)
+
+        # Размер считаем по уникальным объектам: снимки могут их делить
+        sizes = {}
+        for ref in self.refs.values():
+            for digest in (ref['html'], ref['state']):
+                if digest and digest not in sizes:
+                    sizes[digest] = self._object_size(digest)
+        total = sum(sizes.values())
+        evicted = 0
+        if self.max_bytes and total > self.max_bytes:
+            for ref in sorted(self.refs.values(), key=lambda r: r['taken']):
+                if total <= self.max_bytes:
+                    break
+                self._drop(ref['org_id'])
+                evicted += 1
+                for digest in (ref['html'], ref['state']):
+                    if digest and not self._referenced(digest):
+                        total -= sizes.pop(digest, 0)
+
+        if expired or evicted:
+            removed = self._collect_garbage()
+            logger.info(
+                "Кэш снимков: удалено %s устаревших и %s старых снимков, "
+                "%s объектов, осталось %s снимков",
+                len(expired), evicted, removed, len(self.refs)
+            )
+
+    def _object_size(self, digest: str) -> int:
+        size = self._object_sizes.get(digest)
+        if size is None:
+            path = self._object_path(digest)
+            size = self._object_sizes[digest] = os.path.getsize(path) if os.path.exists(path) else 0
+        return size
+
+    def _referenced(self, digest: str) -> bool:
+        return any(digest in (ref['html'], ref['state']) for ref in self.refs.values())
+
+    def _collect_garbage(self) -> int:
+        """
+        Удаление объектов, на которые не ссылается ни один снимок. Ссылки читаются
+        с диска: кэш могут делить несколько процессов run_batch
+        """
+        refs = list(self.refs.values()) + list(self._read_refs().values())
+        alive = {digest for ref in refs for digest in (ref['html'], ref['state']) if digest}
+        deadline = time.time() - GC_GRACE_SECONDS
+        removed = 0
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            for name in os.listdir(prefix_dir):
+                if not name.endswith('.gz') or name[:-3] in alive:
+                    continue
+                path = os.path.join(prefix_dir, name)
+                try:
+                    if os.path.getmtime(path) > deadline:
+                        continue
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+                self._object_sizes.pop(name[:-3], None)
+                removed += 1
+        return removed
+
+
+def extract_markup(html: str, state: str or None, org_id: int = None) -> list:
+    """Поля Review.parse_base_information из отрисованной разметки"""
+    from parser.http_engine import ReviewMarkupParser
+
+    markup = ReviewMarkupParser()
+    markup.feed(html)
+    markup.close()
+    return [
+        {'review_rating': rating, 'datetime': date, 'place_id': org_id}
+        for rating, date in zip(markup.ratings, markup.dates)
+    ]
+
+
+def extract_state(html: str, state: str or None, org_id: int = None) -> list:
+    """Отзывы из JSON state-view"""
+    from parser import state_parser
+
+    if state is None:
+        return []
+    return state_parser.collect_state_reviews(json.loads(state), org_id=org_id)
+
+
+def extract_page(html: str, state: str or None, org_id: int = None) -> list:
+    """Как HTTP-режим: state-view, а если в нем нет отзывов - разметка"""
+    from parser.http_engine import parse_org_page
+
+    return parse_org_page(html, org_id=org_id)['records']
+
+
+EXTRACTORS = {
+    'markup': extract_markup,
+    'state': extract_state,
+    'page': extract_page,
+}
+
+
+def resolve_extractor(name: str):
+    """Экстрактор по имени из EXTRACTORS или по пути module:function"""
+    if name in EXTRACTORS:
+        return EXTRACTORS[name]
+    module_name, _, func_name = name.partition(':')
+    if not func_name:
+        raise ValueError(f"Неизвестный экстрактор {name}: укажите один из {list(EXTRACTORS)} или module:function")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def _replay_one(task):
+    directory, ref, extractor_name = task
+    started = time.perf_counter()
+    try:
+        # Пропавший или битый объект - ошибка одного снимка, а не всего прогона
+        html, state = load_snapshot(directory, ref)
+        records = resolve_extractor(extractor_name)(html, state, ref['org_id'])
+        error = None
+    except Exception as e:
+        records, error = [], f'{type(e).__name__}: {e}'
+    return ref['org_id'], records, error, time.perf_counter() - started
+
+
+def replay(cache: SnapshotCache, extractor: str = 'markup', org_ids=None, workers: int = None):
+    """
+    Повторный прогон экстрактора по сохраненным снимкам на всех ядрах.
+    Выдает (org_id, records, error, seconds) в порядке организаций
+    """
+    resolve_extractor(extractor)
+    refs = [cache.refs[org_id] for org_id in sorted(cache.refs) if org_ids is None or org_id in org_ids]
+    tasks = [(cache.directory, ref, extractor) for ref in refs]
+    workers = workers or os.cpu_count() or 1
+    logger.info("Воспроизведение %s снимков экстрактором %s в %s процессах", len(tasks), extractor, workers)
+
+    if workers == 1 or len(tasks) <= 1:
+        yield from map(_replay_one, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_replay_one, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
@@ -0,0 +1,212 @@
+# file name: parser/spatial.py
+import heapq
+import json
+import logging
+import math
+import os
+import struct
+import sys
+from array import array
+
+from parser.places import PLACES_CSV, iter_places
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180
+INDEX_MAGIC = b'PLGRID1\n'
+DEFAULT_CELL_DEG = 0.01
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Расстояние по поверхности Земли в метрах"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+class GridIndex:
+    """
+    Индекс мест по сетке cell_deg x cell_deg градусов. Точки отсортированы по ячейкам
+    и лежат в трех массивах (id, широта, долгота); ячейка хранит диапазон строк.
+    Запросы просматривают только ячейки, пересекающиеся с областью поиска
+    """
+
+    def __init__(self, ids: array, lats: array, lons: array, cells: dict, cell_deg: float = DEFAULT_CELL_DEG):
+        self.ids = ids
+        self.lats = lats
+        self.lons = lons
+        # (строка, столбец) -> (начало, конец) в массивах
+        self.cells = cells
+        self.cell_deg = cell_deg
+
+        if cells:
+            rows = [row for row, _ in cells]
+            cols = [col for _, col in cells]
+            self._extent = (min(rows), max(rows), min(cols), max(cols))
+        else:
+            self._extent = (0, -1, 0, -1)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _cell(self, lat: float, lon: float) -> tuple:
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+
+    @classmethod
+    def build(cls, places, cell_deg: float = DEFAULT_CELL_DEG) -> 'GridIndex':
+        """Построение по записям мест {'id', 'coords': [lat, lon]}"""
+        points = []
+        skipped = 0
+        for place in places:
+            coords = place.get('coords') or [None, None]
+            if coords[0] is None or coords[1] is None:
+                skipped += 1
+                continue
+            lat, lon = float(coords[0]), float(coords[1])
+            key = (math.floor(lat / cell_deg), math.floor(lon / cell_deg))
+            points.append((key, int(place['id']), lat, lon))
+        points.sort()
+
+        ids, lats, lons = array('q'), array('d'), array('d')
+        cells = {}
+        for i, (key, place_id, lat, lon) in enumerate(points):
+            ids.append(place_id)
+            lats.append(lat)
+            lons.append(lon)
+            start, _ = cells.get(key, (i, i))
+            cells[key] = (start, i + 1)
+
+        if skipped:
+            logger.warning(f"Пропущено {skipped} мест без координат")
+        logger.debug(f"Индекс: {len(ids)} мест в {len(cells)} ячейках по {cell_deg}°")
+        return cls(ids, lats, lons, cells, cell_deg)
+
+    @classmethod
+    def from_file(cls, filepath: str = PLACES_CSV, cell_deg: float = DEFAULT_CELL_DEG) -> 'GridIndex':
+        """Построение по full_places.csv или JSON со списком мест"""
+        return cls.build(iter_places(filepath), cell_deg)
+
+    def _scan(self, row_min: int, row_max: int, col_min: int, col_max: int):
+        """Строки массивов из ячеек прямоугольника сетки"""
+        row_lo, row_hi, col_lo, col_hi = self._extent
+        row_min, row_max = max(row_min, row_lo), min(row_max, row_hi)
+        col_min, col_max = max(col_min, col_lo), min(col_max, col_hi)
+        if (row_max - row_min + 1) * (col_max - col_min + 1) > len(self.cells):
+            # Область больше заполненной части сетки - дешевле обойти непустые ячейки
+            for (row, col), (start, end) in self.cells.items():
+                if row_min <= row <= row_max and col_min <= col <= col_max:
+                    yield from range(start, end)
+            return
+        for row in range(row_min, row_max + 1):
+            for col in range(col_min, col_max + 1):
+                bounds = self.cells.get((row, col))
+                if bounds is not None:
+                    yield from range(*bounds)
+
+    def bbox(self, south: float, west: float, north: float, east: float) -> list:
+        """id мест внутри прямоугольника"""
+        row_min, col_min = self._cell(south, west)
+        row_max, col_max = self._cell(north, east)
+        return [
+            self.ids[i] for i in self._scan(row_min, row_max, col_min, col_max)
+            if south <= self.lats[i] <= north and west <= self.lons[i] <= east
+        ]
+
+    def radius(self, lat: float, lon: float, meters: float) -> list:
+        """(id, расстояние в метрах) мест в радиусе, по возрастанию расстояния"""
+        dlat = meters / METERS_PER_DEGREE
+        cos_lat = max(math.cos(math.radians(min(89.9, abs(lat) + dlat))), 1e-6)
+        dlon = min(180.0, dlat / cos_lat)
+        row_min, col_min = self._cell(lat - dlat, lon - dlon)
+        row_max, col_max = self._cell(lat + dlat, lon + dlon)
+
+        found = []
+        for i in self._scan(row_min, row_max, col_min, col_max):
+            distance = haversine_m(lat, lon, self.lats[i], self.lons[i])
+            if distance <= meters:
+                found.append((self.ids[i], distance))
+        found.sort(key=lambda item: item[1])
+        return found
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> list:
+        """k ближайших мест: (id, расстояние в метрах), по возрастанию расстояния"""
+        if not self.cells or k <= 0:
+            return []
+        center_row, center_col = self._cell(lat, lon)
+        row_lo, row_hi, col_lo, col_hi = self._extent
+        max_ring = max(abs(center_row - row_lo), abs(center_row - row_hi),
+                       abs(center_col - col_lo), abs(center_col - col_hi))
+        # Минимальный размер ячейки в метрах в пределах сетки (долгота сжимается к полюсам)
+        max_abs_lat = max(abs(lat), abs(row_lo * self.cell_deg), abs((row_hi + 1) * self.cell_deg))
+        cell_m = self.cell_deg * METERS_PER_DEGREE * max(math.cos(math.radians(min(89.9, max_abs_lat))), 1e-6)
+
+        heap = []  # (-расстояние, id): k лучших на данный момент
+        for ring in range(max_ring + 1):
+            for row in range(center_row - ring, center_row + ring + 1):
+                # Внутри кольца - только его граница, внутренность уже просмотрена
+                edge = row in (center_row - ring, center_row + ring)
+                cols = range(center_col - ring, center_col + ring + 1) if edge \
+                    else (center_col - ring, center_col + ring)
+                for col in cols:
+                    bounds = self.cells.get((row, col))
+                    if bounds is None:
+                        continue
+                    for i in range(*bounds):
+                        item = (-haversine_m(lat, lon, self.lats[i], self.lons[i]), self.ids[i])
+                        if len(heap) < k:
+                            heapq.heappush(heap, item)
+                        elif item > heap[0]:
+                            heapq.heapreplace(heap, item)
+            # Всё за пределами кольца ring не ближе ring ячеек от точки
+            if len(heap) == k and -heap[0][0] <= ring * cell_m:
+                break
+
+        return [(place_id, -neg) for neg, place_id in sorted(heap, reverse=True)]
+
+    def save(self, filepath: str):
+        """Запись индекса: заголовок JSON и двоичные массивы"""
+        header = json.dumps({
+            'cell_deg': self.cell_deg,
+            'byteorder': sys.byteorder,
+            'count': len(self.ids),
+            'cells': [[row, col, start, end] for (row, col), (start, end) in self.cells.items()],
+        }).encode('utf-8')
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(INDEX_MAGIC)
+            f.write(struct.pack('<Q', len(header)))
+            f.write(header)
+            for column in (self.ids, self.lats, self.lons):
+                column.tofile(f)
+        os.replace(tmp_path, filepath)
+
+    @classmethod
+    def load(cls, filepath: str) -> 'GridIndex':
+        with open(filepath, 'rb') as f:
+            if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                raise ValueError(f"{filepath} - не файл индекса мест")
+            header_size, = struct.unpack('<Q', f.read(8))
+            header = json.loads(f.read(header_size))
+            columns = []
+            for typecode in ('q', 'd', 'd'):
+                column = array(typecode)
+                column.fromfile(f, header['count'])
+                if header.get('byteorder', sys.byteorder) != sys.byteorder:
+                    column.byteswap()
+                columns.append(column)
+        cells = {(row, col): (start, end) for row, col, start, end in header['cells']}
+        return cls(*columns, cells=cells, cell_deg=header['cell_deg'])
+
+
+def load_or_build(source: str = PLACES_CSV, index_path: str = None, cell_deg: float = DEFAULT_CELL_DEG) -> GridIndex:
+    """Индекс с диска, если он свежее источника; иначе построение и сохранение"""
+    index_path = index_path or source + '.idx'
+    if os.path.exists(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(source):
+        index = GridIndex.load(index_path)
+        if index.cell_deg == cell_deg:
+            return index
+    index = GridIndex.from_file(source, cell_deg)
+    index.save(index_path)
+    logger.info(f"Индекс мест сохранен в {index_path}")
+    return index
@@ -0,0 +1,188 @@
+# file name: parser/state_parser.py
+import json
+import logging
+
+from parser import metrics
+from parser import selenium_helper as sh
+from parser.scroll_controller import ScrollController
+
+logger = logging.getLogger(__name__)
+
+# Перехватываем ответы fetchReviews, которые страница подгружает при прокрутке,
+# и складываем их тексты в буфер на стороне браузера
+INSTALL_STATE_HOOK_JS = """
+if (!window.__reviewStateHook) {
+    window.__reviewStateHook = true;
+    window.__reviewStateUpdates = [];
+    const isReviewsUrl = (url) => String(url || '').indexOf('fetchReviews') !== -1;
+
+    const origFetch = window.fetch;
+    if (origFetch) {
+        window.fetch = function() {
+            const url = arguments[0] && arguments[0].url ? arguments[0].url : arguments[0];
+            return origFetch.apply(this, arguments).then(function(response) {
+                if (isReviewsUrl(url)) {
+                    response.clone().text().then(function(text) {
+                        window.__reviewStateUpdates.push(text);
+                    }).catch(function() {});
+                }
+                return response;
+            });
+        };
+    }
+
+    const origOpen = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function(method, url) {
+        if (isReviewsUrl(url)) {
+            this.addEventListener('load', function() {
+                window.__reviewStateUpdates.push(this.responseText);
+            });
+        }
+        return origOpen.apply(this, arguments);
+    };
+}
+"""
+
+# Забираем накопленные обновления и сразу прокручиваем на шаг контроллера,
+# чтобы страница запросила следующую порцию - один round-trip на шаг
+DRAIN_AND_SCROLL_JS = sh.SCROLL_REVIEWS_FN_JS + """
+const updates = window.__reviewStateUpdates || [];
+window.__reviewStateUpdates = [];
+if (arguments[0]) {
+    scrollReviewsBy(arguments[0]);
+}
+return updates;
+"""
+
+PENDING_UPDATES_JS = """
+return (window.__reviewStateUpdates || []).length;
+"""
+
+
+def read_state_view(driver) -> dict:
+    """Чтение JSON состояния страницы из <script class="state-view">"""
+    script_element = sh.wait_element_by_xpath(
+        driver=driver,
+        xpath='//script[@class="state-view"]',
+    )
+    return json.loads(script_element.get_attribute("innerHTML"))
+
+
+def _is_review(node: dict) -> bool:
+    return 'reviewId' in node and 'rating' in node and (
+        'updatedTime' in node or 'time' in node
+    )
+
+
+def iter_state_reviews(state):
+    """Обход JSON состояния и выдача всех вложенных объектов отзывов"""
+    stack = [state]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if _is_review(node):
+                yield node
+                continue
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            # Сохраняем порядок отзывов как на странице
+            stack.extend(reversed(node))
+
+
+def format_rating(value):
+    """Рейтинг в том же виде, что и в разметке: "4.0" """
+    if value is None:
+        return None
+    try:
+        return str(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def state_review_to_record(review: dict, org_id=None) -> dict:
+    """Отзыв из JSON состояния -> запись того же формата, что и в smart режиме"""
+    place_id = org_id if org_id is not None else review.get('businessId')
+    return {
+        'review_rating': format_rating(review.get('rating')),
+        # Время публикации, как datePublished в разметке: иначе ключ (place_id, datetime)
+        # отредактированного отзыва расходится с DOM-режимами
+        'datetime': review.get('time') or review.get('updatedTime'),
+        'place_id': int(place_id) if place_id is not None else None,
+    }
+
+
+def collect_state_reviews(state, org_id=None, seen_ids: set = None) -> list:
+    """Новые (ещё не встречавшиеся по reviewId) отзывы из JSON состояния"""
+    if seen_ids is None:
+        seen_ids = set()
+
+    records = []
+    for review in iter_state_reviews(state):
+        review_id = review['reviewId']
+        if review_id in seen_ids:
+            continue
+        seen_ids.add(review_id)
+
+        record = state_review_to_record(review, org_id=org_id)
+        if record['datetime']:
+            records.append(record)
+    return records
+
+
+def mode_reviews_state(driver, filepath, limit=None, org_id=None, scroll_timeout=5):
+    """Парсинг отзывов из JSON состояния страницы и его обновлений при прокрутке"""
+    from .main import save_json
+
+    seen_ids = set()
+    data = collect_state_reviews(read_state_view(driver), org_id=org_id, seen_ids=seen_ids)
+    logger.info("Из state-view получено %d отзывов", len(data))
+
+    driver.execute_script(INSTALL_STATE_HOOK_JS)
+
+    controller = ScrollController(total=sh.read_total_reviews(driver), limit=limit)
+    controller.update(len(data))
+
+    while not controller.stop_reason(len(data)):
+        metrics.incr('scroll_steps')
+        with metrics.timer('scroll'):
+            updates = driver.execute_script(DRAIN_AND_SCROLL_JS, controller.next_step()) or []
+
+        new_count = 0
+        with metrics.timer('extract'):
+            for update in updates:
+                try:
+                    new_records = collect_state_reviews(
+                        json.loads(update), org_id=org_id, seen_ids=seen_ids
+                    )
+                except ValueError as e:
+                    logger.debug("Не удалось разобрать обновление состояния: %s", e)
+                    continue
+                data.extend(new_records)
+                new_count += len(new_records)
+        metrics.incr('reviews', new_count)
+
+        controller.update(new_count)
+
+        if controller.scrolls % 5 == 0:
+            logger.info(
+                "Прокруток: %d, собрано отзывов: %d", controller.scrolls, len(data),
+                extra={'log_key': 'scroll_progress'}
+            )
+
+        # Ждем ответа на подгрузку, а не фиксированную паузу
+        sh.wait_for_js_condition(driver, PENDING_UPDATES_JS, timeout=scroll_timeout)
+        sh.politeness_pause(driver)
+
+    # Последние ответы могли прийти уже после выхода из цикла
+    for update in driver.execute_script(DRAIN_AND_SCROLL_JS, 0) or []:
+        try:
+            data.extend(collect_state_reviews(json.loads(update), org_id=org_id, seen_ids=seen_ids))
+        except ValueError:
+            continue
+
+    logger.info("Остановка прокрутки: %s", controller.stop_reason(len(data)))
+    if limit is not None:
+        data = data[:limit]
+
+    save_json(data, filepath, org_id=org_id)
+    logger.info("Собрано %d отзывов для организации %s", len(data), org_id)
@@ -0,0 +1,261 @@
+# file name: parser/synthetic.py
+import csv
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from parser.convert import open_text
+from parser.map_bundle import MIN_SIZE, MAX_SIZE, SIZE_BUCKETS, PALETTE, COLOR_STOPS, bucket_size, circle_icon
+from parser.places import PLACES_CSV_FIELDS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK = 100000
+# Границы координат, как в прежнем random_points_generator
+LAT_BOUNDS = (59.0, 60.0)
+LON_BOUNDS = (30.0, 31.0)
+REVIEWS_SINCE = np.datetime64('2018-01-01T00:00:00', 'ms')
+REVIEWS_UNTIL = np.datetime64('2026-01-01T00:00:00', 'ms')
+
+
+def _chunk_rng(seed: int, chunk: int):
+    # Свой генератор на каждую пачку: пачки независимы друг от друга, но массивы
+    # тянутся размером с пачку, поэтому результат зависит от seed, размера пачки и
+    # (в последней неполной пачке) от общего количества мест
+    return np.random.default_rng([seed, chunk + 1])
+
+
+def normal_coords(rng, size: int, lat_center=59.5, lon_center=30.5, lat_std=0.18, lon_std=0.18):
+    lat = np.clip(rng.normal(lat_center, lat_std, size), *LAT_BOUNDS)
+    lon = np.clip(rng.normal(lon_center, lon_std, size), *LON_BOUNDS)
+    return lat.round(6), lon.round(6)
+
+
+def clustered_coords(rng, size: int, centers: np.ndarray, std: float = 0.1):
+    """Скопления точек: первое получает 40% точек, остальные делят 60%"""
+    clusters = len(centers)
+    weights = np.array([0.4] + [0.6 / (clusters - 1)] * (clusters - 1)) if clusters > 1 else np.ones(1)
+    chosen = rng.choice(clusters, size=size, p=weights)
+    lat = np.clip(rng.normal(centers[chosen, 0], std), *LAT_BOUNDS)
+    lon = np.clip(rng.normal(centers[chosen, 1], std), *LON_BOUNDS)
+    return lat.round(6), lon.round(6)
+
+
+def cluster_centers(seed: int, clusters: int) -> np.ndarray:
+    rng = np.random.default_rng([seed])
+    return np.column_stack([59.3 + rng.random(clusters) * 0.7, 30.3 + rng.random(clusters) * 0.7])
+
+
+def generate_places(rng, size: int, start: int = 0, distribution: str = 'normal', centers=None) -> dict:
+    """Пачка мест по столбцам"""
+    # 10-12 значные id
+    digits = rng.integers(10, 13, size)
+    ids = rng.integers(10 ** (digits - 1), 10 ** digits, dtype=np.int64)
+
+    if distribution == 'clusters':
+        lat, lon = clustered_coords(rng, size, centers)
+    else:
+        lat, lon = normal_coords(rng, size)
+
+    return {
+        'id': ids,
+        # Реалистичное распределение рейтинга с пиком около 4.0-4.5
+        'averageRating': (rng.beta(5, 2, size) * 4 + 1).round(2),
+        # Мало мест с большим количеством отзывов
+        'reviewsNum': np.clip(rng.exponential(2000, size).astype(np.int64), 10, 10000),
+        'name': np.arange(start, start + size),
+        'lat': lat,
+        'lon': lon,
+    }
+
+
+def generate_reviews(rng, places: dict, per_place_limit: int = 50) -> dict:
+    """Отзывы для пачки мест: min(reviewsNum, limit) на место, оценки вокруг averageRating"""
+    counts = np.minimum(places['reviewsNum'], per_place_limit)
+    place_ids = np.repeat(places['id'], counts)
+    centers = np.repeat(places['averageRating'], counts)
+    ratings = np.clip(np.rint(rng.normal(centers, 0.9)), 1, 5).astype(np.uint8)
+
+    span = (REVIEWS_UNTIL - REVIEWS_SINCE).astype(np.int64)
+    moments = REVIEWS_SINCE + rng.integers(0, span, place_ids.size).astype('timedelta64[ms]')
+    return {
+        'review_rating': ratings,
+        'datetime': np.char.add(np.datetime_as_string(moments, unit='ms'), 'Z'),
+        'place_id': place_ids,
+    }
+
+
+def iter_chunks(count: int, chunk_size: int = DEFAULT_CHUNK, seed: int = 0, distribution: str = 'normal',
+                clusters: int = 3, with_reviews: bool = False, per_place_limit: int = 50):
+    """
+    Пачки (места, отзывы или None) общим количеством count мест.
+    Воспроизводимо при тех же seed, chunk_size и count
+    """
+    centers = cluster_centers(seed, clusters) if distribution == 'clusters' else None
+    for chunk, start in enumerate(range(0, count, chunk_size)):
+        rng = _chunk_rng(seed, chunk)
+        places = generate_places(rng, min(chunk_size, count - start), start, distribution, centers)
+        reviews = generate_reviews(rng, places, per_place_limit) if with_reviews else None
+        yield places, reviews
+
+
+def _place_rows(places: dict):
+    return zip(
+        places['id'].tolist(), places['averageRating'].tolist(), places['reviewsNum'].tolist(),
+        places['name'].astype(str).tolist(), places['lat'].tolist(), places['lon'].tolist(),
+    )
+
+
+class PlacesSink:
+    """Запись мест в JSON Lines или CSV (в т.ч. сжатые) по пачкам"""
+
+    def __init__(self, filepath: str):
+        self.file = open_text(filepath, 'w', newline='')
+        self.csv = None
+        if '.csv' in os.path.basename(filepath):
+            self.csv = csv.writer(self.file)
+            self.csv.writerow(PLACES_CSV_FIELDS)
+
+    def write(self, places: dict):
+        rows = _place_rows(places)
+        if self.csv is not None:
+            self.csv.writerows([str(pid), *rest] for pid, *rest in rows)
+            return
+        self.file.write(''.join(
+            json.dumps({'id': str(pid), 'averageRating': rating, 'reviewsNum': reviews, 'name': name,
+                        'coords': [lat, lon]}, ensure_ascii=False) + '\n'
+            for pid, rating, reviews, name, lat, lon in rows
+        ))
+
+    def close(self, discard: bool = False):
+        self.file.close()
+
+
+class ReviewsSink:
+    """Запись отзывов в формате парсера (JSON Lines или CSV)"""
+
+    def __init__(self, filepath: str):
+        self.file = open_text(filepath, 'w', newline='')
+        self.csv = None
+        if '.csv' in os.path.basename(filepath):
+            self.csv = csv.writer(self.file)
+            self.csv.writerow(['review_rating', 'datetime', 'place_id'])
+
+    def write(self, reviews: dict):
+        ratings = np.char.add(reviews['review_rating'].astype(str), '.0').tolist()
+        rows = zip(ratings, reviews['datetime'].tolist(), reviews['place_id'].tolist())
+        if self.csv is not None:
+            self.csv.writerows(rows)
+            return
+        self.file.write(''.join(
+            f'{{"review_rating": "{rating}", "datetime": "{date}", "place_id": {pid}}}\n'
+            for rating, date, pid in rows
+        ))
+
+    def close(self, discard: bool = False):
+        self.file.close()
+
+
+def color_indices(ratings: np.ndarray) -> np.ndarray:
+    """Индексы цвета в PALETTE для столбца рейтингов, как map_bundle.color_index"""
+    thresholds = np.array([value for value, _ in COLOR_STOPS[1:-1]])
+    colors = np.searchsorted(thresholds, np.clip(ratings, 0, 5), side='left')
+    return np.where(ratings == 5.0, len(PALETTE) - 1, colors).astype(np.uint8)
+
+
+class MapBundleSink:
+    """
+    Потоковая запись map/data.js (формат build_map_bundle.py): столбцы пишутся
+    во временные файлы, ступени размера считаются в конце по известным min/max
+    """
+
+    TEXT_COLUMNS = ('id', 'name', 'lat', 'lon', 'rating', 'reviews')
+
+    def __init__(self, filepath: str, buckets: int = SIZE_BUCKETS):
+        self.filepath = filepath
+        self.buckets = buckets
+        self.tmp_dir = tempfile.mkdtemp(prefix='map_bundle_', dir=os.path.dirname(filepath) or '.')
+        self.columns = {name: open(os.path.join(self.tmp_dir, name), 'w', encoding='utf-8')
+                        for name in self.TEXT_COLUMNS}
+        self.binary = {name: open(os.path.join(self.tmp_dir, name + '.bin'), 'wb') for name in ('reviews', 'color')}
+        self.count = 0
+        self.low = None
+        self.high = None
+
+    def _append(self, name: str, values: list):
+        text = ','.join(values)
+        self.columns[name].write(text if self.count == 0 else ',' + text)
+
+    def write(self, places: dict):
+        if not len(places['id']):
+            return
+        self._append('id', [f'"{pid}"' for pid in places['id'].tolist()])
+        self._append('name', [f'"{name}"' for name in places['name'].tolist()])
+        self._append('lat', [repr(v) for v in places['lat'].tolist()])
+        self._append('lon', [repr(v) for v in places['lon'].tolist()])
+        self._append('rating', [repr(v) for v in places['averageRating'].tolist()])
+        self._append('reviews', [str(v) for v in places['reviewsNum'].tolist()])
+
+        reviews = places['reviewsNum'].astype(np.int64)
+        reviews.tofile(self.binary['reviews'])
+        color_indices(places['averageRating']).tofile(self.binary['color'])
+        low, high = int(reviews.min()), int(reviews.max())
+        self.low = low if self.low is None else min(self.low, low)
+        self.high = high if self.high is None else max(self.high, high)
+        self.count += len(reviews)
+
+    def _write_derived(self, out, derive, chunk_size: int = DEFAULT_CHUNK):
+        """Столбец, вычисляемый по пачкам из временных (reviewsNum, цвет)"""
+        reviews = np.memmap(os.path.join(self.tmp_dir, 'reviews.bin'), dtype=np.int64, mode='r')
+        colors = np.memmap(os.path.join(self.tmp_dir, 'color.bin'), dtype=np.uint8, mode='r')
+        for start in range(0, self.count, chunk_size):
+            values = derive(reviews[start:start + chunk_size], colors[start:start + chunk_size])
+            text = ','.join(map(str, values.tolist()))
+            out.write(text if start == 0 else ',' + text)
+
+    def _sizes(self, reviews: np.ndarray) -> np.ndarray:
+        # Как map_bundle.size_buckets
+        if self.high == self.low:
+            return np.full(reviews.size, self.buckets // 2, dtype=np.int64)
+        normalized = np.sqrt((reviews - self.low) / (self.high - self.low))
+        return np.rint(normalized * (self.buckets - 1)).astype(np.int64)
+
+    def close(self, discard: bool = False):
+        for f in [*self.columns.values(), *self.binary.values()]:
+            f.close()
+        if discard:
+            # Генерация прервана - прежний файл карты не трогаем
+            shutil.rmtree(self.tmp_dir)
+            return
+
+        # Иконки на все сочетания цвета и ступени размера: icon = color * buckets + size
+        sizes = [bucket_size(b, MIN_SIZE, MAX_SIZE, self.buckets) for b in range(self.buckets)]
+        icons = [circle_icon(color, size) for color in PALETTE for size in sizes]
+
+        tmp_path = self.filepath + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            out.write('// Сгенерировано generate_synthetic.py, не редактировать вручную\n')
+            out.write(f'const mapBundle = {{"count":{self.count},"columns":{{')
+            for name in self.TEXT_COLUMNS:
+                out.write(f'"{name}":[')
+                with open(os.path.join(self.tmp_dir, name), 'r', encoding='utf-8') as f:
+                    shutil.copyfileobj(f, out)
+                out.write('],')
+            if self.count:
+                out.write('"color":[')
+                self._write_derived(out, lambda reviews, colors: colors)
+                out.write('],"size":[')
+                self._write_derived(out, lambda reviews, colors: self._sizes(reviews))
+                out.write('],"icon":[')
+                self._write_derived(out, lambda reviews, colors: colors.astype(np.int64) * self.buckets
+                                    + self._sizes(reviews))
+                out.write(']},')
+            else:
+                out.write('"color":[],"size":[],"icon":[]},')
+            out.write(f'"palette":{json.dumps(PALETTE)},"sizes":{json.dumps(sizes)},"icons":{json.dumps(icons)}}};\n')
+        os.replace(tmp_path, self.filepath)
+        shutil.rmtree(self.tmp_dir)
@@ -0,0 +1,49 @@
+# file name: parser/watermarks.py
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class WatermarkStore:
+    """Самая свежая дата отзыва по каждому place_id для инкрементального парсинга"""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.marks = {}
+
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    self.marks = {int(k): v for k, v in json.load(f).items()}
+                logger.info("Загружено %s отметок из %s", len(self.marks), filepath)
+            except Exception as e:
+                logger.error("Ошибка при чтении отметок %s: %s", filepath, e)
+
+    def get(self, place_id):
+        return self.marks.get(int(place_id))
+
+    def update(self, place_id, records) -> str or None:
+        """
+        Сдвигаем отметку до самой свежей даты среди записей. Вызывать только для
+        полного сбора по новизне (CollectedReviews.watermark_safe): иначе отзывы
+        старше отметки, но еще не собранные, больше не попадут в выборку
+        """
+        dates = [r['datetime'] for r in records if r.get('datetime')]
+        current = self.get(place_id)
+        if current:
+            dates.append(current)
+        if dates:
+            self.marks[int(place_id)] = max(dates)
+        return self.get(place_id)
+
+    def save(self):
+        # Пишем во временный файл и атомарно подменяем
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.filepath + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({str(k): v for k, v in self.marks.items()}, f, indent=2)
+        os.replace(tmp_path, self.filepath)
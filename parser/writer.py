@@ -0,0 +1,246 @@
+# file name: parser/writer.py
+import json
+import logging
+import os
+
+from parser import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def is_append_only(filepath: str) -> bool:
+    """Выходной файл в формате JSON Lines пишется только дозаписью"""
+    return filepath.endswith('.jsonl')
+
+
+def _newest(records):
+    dates = [r['datetime'] for r in records if r.get('datetime')]
+    return max(dates) if dates else None
+
+
+def iter_manifest(manifest_path: str):
+    """Зафиксированные пачки из манифеста JSON Lines файла"""
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Недописанная последняя строка манифеста - пачка не зафиксирована
+                return
+            yield entry
+
+
+def committed_offset(filepath: str) -> int or None:
+    """Граница зафиксированных данных JSON Lines файла; None, если манифеста нет"""
+    manifest_path = filepath + '.manifest'
+    if not os.path.exists(manifest_path):
+        return None
+    offset = 0
+    for entry in iter_manifest(manifest_path):
+        offset = entry['offset']
+    return offset
+
+
+class JsonArrayWriter:
+    """
+    Прежний формат: один JSON-массив, который перезаписывается целиком
+    после каждой организации
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.records = []
+        # org_id -> дата самого свежего отзыва
+        self.completed = {}
+        self._by_place = None
+
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    self.records = json.load(f)
+                by_place = {}
+                for review in self.records:
+                    if 'place_id' in review:
+                        by_place.setdefault(review['place_id'], []).append(review)
+                self.completed = {pid: _newest(reviews) for pid, reviews in by_place.items()}
+                logger.info("Загружено %s существующих отзывов", len(self.records))
+            except Exception as e:
+                logger.error("Ошибка при чтении файла: %s", e)
+
+    @property
+    def total(self) -> int:
+        return len(self.records)
+
+    def commit(self, org_id, records):
+        self.records.extend(records)
+        if self._by_place is not None:
+            for review in records:
+                self._by_place.setdefault(review.get('place_id'), []).append(review)
+        if org_id is not None:
+            self.completed[org_id] = _newest(records) or self.completed.get(org_id)
+
+        with metrics.timer('save'), open(self.filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.records, f, ensure_ascii=False, indent=2)
+        logger.info("Промежуточное сохранение: всего %s отзывов", self.total)
+
+    def iter_records(self):
+        return iter(self.records)
+
+    def iter_org_records(self, org_id, since: str = None):
+        """Сохраненные отзывы организации новее since"""
+        if self._by_place is None:
+            self._by_place = {}
+            for review in self.records:
+                self._by_place.setdefault(review.get('place_id'), []).append(review)
+        for review in self._by_place.get(org_id, ()):
+            if since is None or (review.get('datetime') or '') > since:
+                yield review
+
+
+class JsonlWriter:
+    """
+    Дозапись в JSON Lines. Каждая пачка отзывов (обычно одна организация)
+    фиксируется строкой в манифесте <file>.manifest со смещением конца пачки.
+    Всё, что лежит в файле данных за последним зафиксированным смещением,
+    считается недописанным и обрезается при открытии
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.manifest_path = filepath + '.manifest'
+        # org_id -> дата самого свежего отзыва
+        self.completed = {}
+        # org_id -> [(начало, конец, самый свежий отзыв)] пачек в файле данных
+        self.batches = {}
+        self.total = 0
+        self.offset = 0
+
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        data_size = os.path.getsize(filepath) if os.path.exists(filepath) else 0
+
+        if os.path.exists(self.manifest_path):
+            self._read_manifest()
+            if data_size > self.offset:
+                logger.warning(
+                    "Обрезаем недописанную пачку в %s: %s байт",
+                    filepath, data_size - self.offset
+                )
+                with open(filepath, 'r+b') as f:
+                    f.truncate(self.offset)
+        else:
+            # Файл без манифеста (например, собран вручную) принимаем целиком
+            if data_size:
+                logger.warning("Манифест не найден, данные %s считаются зафиксированными", filepath)
+                self.total = self._count_lines()
+                self.offset = data_size
+                self._append_manifest({'org_id': None, 'count': self.total, 'offset': self.offset})
+            else:
+                open(self.manifest_path, 'a', encoding='utf-8').close()
+
+        logger.info("Манифест %s: %s организаций, %s отзывов", self.manifest_path, len(self.completed), self.total)
+
+    def _read_manifest(self):
+        # Граница последней целой строки: всё после нее - недописанная запись манифеста
+        good_size = 0
+        with open(self.manifest_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                good_size += len(line)
+                self._add_batch(entry, self.offset)
+                self.offset = entry['offset']
+                self.total += entry['count']
+                if entry.get('org_id') is not None:
+                    self.completed[entry['org_id']] = entry.get('newest') or self.completed.get(entry['org_id'])
+
+        manifest_size = os.path.getsize(self.manifest_path)
+        if manifest_size > good_size:
+            # Иначе следующая запись допишется к обрывку строки и потеряется при чтении
+            logger.warning(
+                "Обрезаем недописанную строку манифеста %s: %s байт",
+                self.manifest_path, manifest_size - good_size
+            )
+            with open(self.manifest_path, 'r+b') as f:
+                f.truncate(good_size)
+
+    def _add_batch(self, entry: dict, start: int):
+        if entry.get('org_id') is not None and entry['count']:
+            self.batches.setdefault(entry['org_id'], []).append((start, entry['offset'], entry.get('newest')))
+
+    def _count_lines(self) -> int:
+        with open(self.filepath, 'rb') as f:
+            return sum(1 for line in f if line.strip())
+
+    def _append_manifest(self, entry: dict):
+        with open(self.manifest_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def commit(self, org_id, records):
+        with metrics.timer('save'):
+            payload = ''.join(json.dumps(r, ensure_ascii=False) + '\n' for r in records).encode('utf-8')
+
+            with open(self.filepath, 'ab') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+                offset = f.tell()
+
+            # Строка в манифесте - точка фиксации пачки
+            entry = {'org_id': org_id, 'count': len(records), 'offset': offset, 'newest': _newest(records)}
+            self._append_manifest(entry)
+
+        self._add_batch(entry, self.offset)
+        self.offset = offset
+        self.total += len(records)
+        if org_id is not None:
+            self.completed[org_id] = entry['newest'] or self.completed.get(org_id)
+        logger.info("Зафиксировано %s отзывов в %s, всего %s", len(records), self.filepath, self.total)
+
+    def iter_records(self):
+        """Чтение зафиксированных записей построчно"""
+        if not os.path.exists(self.filepath):
+            return
+        with open(self.filepath, 'rb') as f:
+            while f.tell() < self.offset:
+                line = f.readline()
+                if not line:
+                    break
+                if line.strip():
+                    yield json.loads(line)
+
+    def iter_org_records(self, org_id, since: str = None):
+        """
+        Сохраненные отзывы организации новее since. Читаются только пачки этой
+        организации, у которых по манифесту есть отзывы новее since
+        """
+        batches = [
+            (start, end) for start, end, newest in self.batches.get(org_id, ())
+            if since is None or newest is None or newest > since
+        ]
+        if not batches:
+            return
+        with open(self.filepath, 'rb') as f:
+            for start, end in batches:
+                f.seek(start)
+                for line in f.read(end - start).splitlines():
+                    if not line.strip():
+                        continue
+                    review = json.loads(line)
+                    if since is None or (review.get('datetime') or '') > since:
+                        yield review
+
+
+def open_writer(filepath: str):
+    """Писатель по расширению выходного файла: .jsonl - дозапись, иначе JSON-массив"""
+    if is_append_only(filepath):
+        return JsonlWriter(filepath)
+    return JsonArrayWriter(filepath)
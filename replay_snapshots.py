@@ -0,0 +1,54 @@
+import argparse
+import logging
+
+from parser.log import configure_logging
+from parser.snapshots import EXTRACTORS, SnapshotCache, replay
+from parser.writer import open_writer
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Повторный разбор сохраненных снимков страниц (run.py/run_batch.py --snapshots) без обращения к сайту'
+    )
+    parser.add_argument('--snapshots', type=str, default='snapshots', help='Папка кэша снимков (default: snapshots)')
+    parser.add_argument('--extractor', type=str, default='markup',
+                        help=f'Экстрактор: {", ".join(EXTRACTORS)} или module:function, '
+                             f'принимающая (html, state, org_id) (default: markup)')
+    parser.add_argument('--ids', type=int, nargs='+', default=None, help='Только эти организации')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Файл для отзывов (.jsonl - дозапись, иначе JSON-массив); без него только сводка')
+    parser.add_argument('--workers', type=int, default=None, help='Количество процессов (default: число ядер)')
+    parser.add_argument('--debug', action='store_true', help='Включить режим отладки')
+
+    args = parser.parse_args()
+    configure_logging(debug=args.debug)
+
+    # Срок хранения не применяем: разбираем все, что есть в кэше
+    cache = SnapshotCache(args.snapshots, ttl=0, max_bytes=0)
+    writer = open_writer(args.output) if args.output else None
+
+    orgs = reviews = failed = 0
+    seconds = 0.0
+    for org_id, records, error, elapsed in replay(
+            cache, args.extractor, org_ids=set(args.ids) if args.ids else None, workers=args.workers):
+        orgs += 1
+        seconds += elapsed
+        if error is not None:
+            failed += 1
+            logger.error(f"Снимок {org_id}: {error}")
+            continue
+        reviews += len(records)
+        logger.debug(f"Снимок {org_id}: {len(records)} отзывов за {elapsed:.3f} сек")
+        if writer is not None:
+            writer.commit(org_id, records)
+
+    logger.info(
+        f"Разобрано {orgs} снимков ({failed} с ошибкой): {reviews} отзывов, "
+        f"{seconds:.2f} сек работы экстрактора"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,12 @@
-
 import argparse
 import logging
+import os
 from selenium import webdriver
 from parser.log import configure_logging
+from parser.metrics import METRICS
 from parser.main import get_organization_reviews
+from parser.snapshots import DEFAULT_TTL, SnapshotCache
+from parser.watermarks import WatermarkStore
 
 
 def main():
@@ -11,33 +14,71 @@ def main():
     parser.add_argument('--org_id', type=int, required=True, help='ID организации')
     parser.add_argument('--limit', type=int, default=None, help='Лимит отзывов')
     parser.add_argument('--debug', action='store_true', help='Включить отладочный режим')
+    parser.add_argument('--log-file', type=str, default=None, help='Дублировать лог в файл (с ротацией по 50 МБ)')
     parser.add_argument('--headless', action='store_true', help='Запуск браузера в фоновом режиме')
-    parser.add_argument('--mode', type=str, default='smart', choices=['reviews', 'smart', 'experimental'], 
-                   help='Режим работы (reviews: по одному, smart: умная прокрутка, experimental: скрипт)')
+    parser.add_argument('--mode', type=str, default='smart', choices=['reviews', 'smart', 'experimental', 'state', 'pruned'], 
+                   help='Режим работы (reviews: по одному, smart: умная прокрутка, experimental: скрипт, '
+                        'state: отзывы из JSON состояния, pruned: smart с удалением обработанных отзывов из DOM)')
     parser.add_argument('--output', type=str, default=None, help='Путь к выходному файлу. Если не указан, используется папка json/reviews.json')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Собирать только отзывы новее уже известных (только для режимов smart и pruned)')
+    parser.add_argument('--watermarks', type=str, default=os.path.join('json', 'watermarks.json'),
+                        help='Файл с датами самых свежих собранных отзывов (default: json/watermarks.json)')
+    parser.add_argument('--politeness', type=float, default=0.5,
+                        help='Минимальный интервал между прокрутками в секундах (default: 0.5)')
+    parser.add_argument('--snapshots', type=str, default=None,
+                        help='Папка кэша снимков страниц для replay_snapshots.py')
+    parser.add_argument('--snapshot-ttl-days', type=float, default=DEFAULT_TTL / 86400,
+                        help='Срок хранения снимков в днях, 0 - бессрочно (default: 7)')
+    parser.add_argument('--metrics', type=str, default=None,
+                        help='JSON со временем по этапам (навигация, ожидание, прокрутка, извлечение, сохранение)')
+    parser.add_argument('--profile', type=str, default=None,
+                        help='Папка для профиля cProfile организации (<org_id>.prof)')
 
     args = parser.parse_args()
+    if args.incremental and args.mode not in ('smart', 'pruned'):
+        parser.error('--incremental поддерживается только в режимах smart и pruned')
 
     # Настройка логирования
-    configure_logging(debug=args.debug)
+    configure_logging(debug=args.debug, log_file=args.log_file)
 
     # Создание драйвера
-    from parser.selenium_helper import make_driver
+    from parser.selenium_helper import make_driver, set_politeness_delay
+    set_politeness_delay(args.politeness)
     driver = make_driver(debug=not args.headless)
 
+    watermarks = WatermarkStore(args.watermarks) if args.incremental else None
+    snapshots = SnapshotCache(args.snapshots, ttl=args.snapshot_ttl_days * 86400) if args.snapshots else None
+    METRICS.configure(
+        json_path=args.metrics,
+        profile_ids=[args.org_id] if args.profile else (),
+        profile_dir=args.profile or 'profiles'
+    )
+
     try:
-        get_organization_reviews(
+        data = get_organization_reviews(
             driver=driver,
             mode=args.mode,
             org_id=args.org_id,
             limit=args.limit,
-            output_path=args.output
+            output_path=args.output,
+            since=watermarks.get(args.org_id) if watermarks else None,
+            snapshots=snapshots,
+            newest_first=args.incremental
         )
+
+        if watermarks is not None:
+            if getattr(data, 'watermark_safe', False):
+                watermarks.update(args.org_id, data)
+                watermarks.save()
+            else:
+                logging.warning("Сбор неполный или не по новизне, отметка организации %s не сдвигается", args.org_id)
     except Exception as e:
         logging.error(f"Ошибка при выполнении парсинга: {e}")
         raise
     finally:
         driver.quit()
+        METRICS.export()
 
 
 if __name__ == '__main__':
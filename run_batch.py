@@ -1,18 +1,25 @@
 # file name: batch_parser.py
 import argparse
-import time
-import random
-import json
 import os
 import logging
 from typing import List
-from datetime import datetime
 
-from selenium.webdriver.common.by import By
-from parser.selenium_helper import make_driver
-from parser.classes import Review
-from parser.main import save_json
+from parser.selenium_helper import navigate, set_politeness_delay, set_rate_limiter
+from parser.scheduler import TokenBucket, schedule
+from parser.driver_pool import DriverManager
+from parser import smart_parser
+from parser.main import organization_url
+from parser.watermarks import WatermarkStore
+from parser.classes import review_key
+from parser.writer import open_writer, is_append_only
+from parser.column_store import export_columns
+from parser.aggregates import AggregateStore
+from parser.http_engine import HttpFetchEngine
+from parser.snapshots import DEFAULT_MAX_BYTES, DEFAULT_TTL, SnapshotCache
+from parser.job_queue import DEFAULT_LEASE_SECONDS, DEFAULT_MAX_ATTEMPTS, PENDING, JobQueue
+from parser.places import PLACES_CSV, load_places
 from parser.log import configure_logging
+from parser import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -27,148 +34,231 @@ def read_ids_from_file(filepath: str) -> List[int]:
                     try:
                         ids.append(int(line))
                     except ValueError:
-                        logger.warning(f"Неверный формат ID: {line}")
+                        logger.warning("Неверный формат ID: %s", line)
         return ids
     except FileNotFoundError:
-        logger.error(f"Файл не найден: {filepath}")
+        logger.error("Файл не найден: %s", filepath)
         return []
 
-def parse_single_org_smart(driver, org_id, limit):
+def parse_single_org_smart(driver, org_id, limit, since=None, prune=False, snapshots: SnapshotCache = None,
+                           newest_first=False):
     """Парсинг одной организации (smart режим) прямо в память"""
-    from parser.main import save_json
-    
-    # Открываем страницу
-    url = f"https://yandex.ru/maps/org/yandeks/{org_id}/reviews/"
-    driver.get(url)
-    time.sleep(2)
-    
-    org_reviews = []
-    scroll_attempts = 0
-    max_scrolls = 30
-    
-    while (limit is None or len(org_reviews) < limit) and scroll_attempts < max_scrolls:
-        # Находим все видимые отзывы
-        review_elems = driver.find_elements(
-            By.XPATH, '//*[@class="business-review-view__info"]'
-        )
-        
-        # Парсим каждый новый отзыв
-        for i, review_elem in enumerate(review_elems[len(org_reviews):], start=len(org_reviews)):
-            if limit and len(org_reviews) >= limit:
-                break
-                
-            try:
-                driver.execute_script("arguments[0].scrollIntoView(true);", review_elem)
-                time.sleep(0.1)
-                
-                new_review = Review(place_id=org_id)
-                new_review.parse_base_information(review_elem=review_elem)
-                
-                if new_review.datetime:
-                    review_data = {
-                        'review_rating': new_review.review_rating,
-                        'datetime': new_review.datetime,
-                        'place_id': org_id,
-                    }
-                    
-                    # Проверяем дубликаты
-                    if not any(d['datetime'] == review_data['datetime'] for d in org_reviews):
-                        org_reviews.append(review_data)
-                        
-            except Exception as e:
-                logger.debug(f"Ошибка парсинга: {e}")
+    # Открываем страницу (токен лимита уже получен планировщиком)
+    navigate(driver, organization_url(org_id), throttled=False)
+
+    reviews = smart_parser.collect_reviews(driver, org_id=org_id, limit=limit, since=since, prune=prune,
+                                           newest_first=newest_first)
+    if snapshots is not None:
+        # При prune обработанные отзывы уже удалены из DOM - в снимке останется state-view
+        with metrics.timer('snapshot'):
+            snapshots.record(driver, org_id, mode='pruned' if prune else 'smart')
+    return reviews
+
+def drop_stored(writer, watermarks: WatermarkStore, org_id, org_reviews) -> list:
+    """
+    Отметка двигается только после полного сбора по новизне, поэтому после
+    неполного сбора или данных без отметки проход повторяет уже сохраненные
+    отзывы новее отметки. Сверяемся только с ними (пачки организации по манифесту)
+    """
+    keys = {review_key(review) for review in writer.iter_org_records(org_id, since=watermarks.get(org_id))}
+    if not keys:
+        return org_reviews
+    return [review for review in org_reviews if review_key(review) not in keys]
+
+def update_aggregates(aggregates: AggregateStore, writer, org_reviews):
+    """Учет только что зафиксированной пачки в агрегатах мест"""
+    if is_append_only(writer.filepath):
+        # Из файла по смещению: после сбоя досчитается всё незачтенное
+        aggregates.sync_jsonl(writer.filepath)
+    else:
+        aggregates.add(org_reviews)
+    aggregates.save()
+
+def http_prepass(ids: List[int], writer, limit_per_org: int, concurrency: int = 16, bucket=None,
+                 aggregates: AggregateStore = None) -> List[int]:
+    """
+    Сбор без браузера для организаций, чьи отзывы целиком есть в HTML.
+    Возвращает ID, которые нужно отдать Selenium
+    """
+    engine = HttpFetchEngine(maxsize=concurrency, bucket=bucket)
+    left = []
+    try:
+        for org_id, org_reviews in engine.fetch_many(ids, limit=limit_per_org):
+            if org_reviews is None:
+                left.append(org_id)
                 continue
-        
-        if limit and len(org_reviews) >= limit:
-            break
-            
-        # Прокрутка
-        time.sleep(random.uniform(0.5, 1.5))
-        driver.execute_script("window.scrollBy(0, 600);")
-        scroll_attempts += 1
-        
-        if scroll_attempts > 10 and len(org_reviews) == 0:
-            break
-    
-    return org_reviews
+            writer.commit(org_id, org_reviews)
+            if aggregates is not None:
+                update_aggregates(aggregates, writer, org_reviews)
+            logger.info("HTTP: добавлено %s отзывов от организации %s", len(org_reviews), org_id)
+    finally:
+        engine.close()
+
+    logger.info("HTTP: собрано %s организаций, браузер нужен для %s", len(ids) - len(left), len(left))
+    return left
 
 def parse_multiple_to_single_file(
     ids: List[int],
     output_file: str,
     limit_per_org: int = 50,
     debug: bool = False,
-    min_delay: int = 2,
-    max_delay: int = 2,
-    headless: bool = True
+    headless: bool = True,
+    workers: int = 1,
+    watermarks: WatermarkStore = None,
+    recycle_after: int = 50,
+    max_rss_mb: float = None,
+    warm_browsers: int = 0,
+    http_first: bool = False,
+    http_concurrency: int = 16,
+    rps: float = 2.0,
+    burst: float = 5,
+    prune_dom: bool = False,
+    export_dir: str = None,
+    aggregates: AggregateStore = None,
+    snapshots: SnapshotCache = None,
+    job_queue: JobQueue = None,
+    priorities: dict = None,
+    requeue_done: bool = False
 ):
     """
-    Парсинг нескольких организаций в один файл БЕЗ временных файлов
+    Парсинг нескольких организаций в один файл БЕЗ временных файлов.
+    Организации обрабатываются в workers браузерах под общим лимитом rps
+    запросов в секунду, а в файл пишет только цикл событий (единственный писатель).
+    С job_queue организации берутся в аренду из общей очереди по убыванию priorities;
+    у каждого процесса на очереди должен быть свой output_file
     """
-    if not ids:
+    if not ids and job_queue is None:
         logger.error("Список ID организаций пуст")
         return
     
     # Создаем директорию если нужно
     os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
     
-    # Загружаем существующие данные
-    all_reviews = []
-    existing_place_ids = set()
-    
-    if os.path.exists(output_file):
-        try:
-            with open(output_file, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-                all_reviews = existing_data
-                for review in existing_data:
-                    if 'place_id' in review:
-                        existing_place_ids.add(review['place_id'])
-                logger.info(f"Загружено {len(all_reviews)} существующих отзывов")
-        except Exception as e:
-            logger.error(f"Ошибка при чтении файла: {e}")
-    
-    driver = make_driver(debug=not headless)
-    
+    if job_queue is not None:
+        # Проверяем до открытия: писатель .jsonl обрезает недописанный хвост файла
+        owner = job_queue.claim_output(output_file)
+        if owner is not None:
+            logger.error("Файл %s уже пишет процесс %s, укажите для этого процесса другой --output", output_file, owner)
+            return
+        job_queue.start_heartbeat()
+
+    # Загружаем состояние выходного файла (для .jsonl - только манифест)
+    writer = open_writer(output_file)
+    existing_place_ids = set(writer.completed)
+
+    # Если уже есть отзывы от этой организации, можно пропустить
+    pending = []
+    for org_id in ids:
+        if watermarks is None and org_id in existing_place_ids:
+            logger.info("Организация %s уже есть в файле, пропускаем", org_id)
+            continue
+        pending.append(org_id)
+
+    if job_queue is not None:
+        # Завершенные организации проходятся заново только по явному requeue_done
+        job_queue.add(ids, priorities, reset_done=requeue_done)
+        if watermarks is None:
+            job_queue.mark_done(existing_place_ids)
+        job_queue.expire()
+
+    # Общий лимит запросов для браузеров и HTTP
+    bucket = TokenBucket(rate=rps, capacity=burst)
+    set_rate_limiter(bucket)
+
     try:
-        for i, org_id in enumerate(ids, 1):
-            logger.info(f"[{i}/{len(ids)}] Парсинг организации ID: {org_id}")
-            
-            # Если уже есть отзывы от этой организации, можно пропустить
-            if org_id in existing_place_ids:
-                logger.info(f"Организация {org_id} уже есть в файле, пропускаем")
-                continue
-            
-            try:
-                # Парсим организацию ПРЯМО В ПАМЯТЬ
-                org_reviews = parse_single_org_smart(
-                    driver=driver,
+        if job_queue is not None:
+            if http_first:
+                logger.warning("HTTP-режим не поддерживается с общей очередью, используем только браузер")
+            total = job_queue.counts()[PENDING]
+            # Следующая аренда берется, только когда освободился воркер
+            pending = job_queue.iter_leases()
+        else:
+            if http_first and pending:
+                if watermarks is not None:
+                    logger.warning("HTTP-режим не поддерживает инкрементальный парсинг, используем только браузер")
+                else:
+                    pending = http_prepass(pending, writer, limit_per_org, concurrency=http_concurrency,
+                                          bucket=bucket, aggregates=aggregates)
+            total = len(pending)
+
+        if not total:
+            logger.info("Нет организаций для парсинга в браузере. Всего собрано %s отзывов", writer.total)
+            return
+
+        workers = max(1, min(workers, total))
+        logger.info("Запуск %s воркеров для %s организаций", workers, total)
+        manager = DriverManager(
+            size=workers,
+            warm=warm_browsers,
+            recycle_after=recycle_after,
+            max_rss_mb=max_rss_mb,
+            debug=not headless
+        )
+        processed = 0
+
+        def handle(org_id):
+            logger.info("Парсинг организации ID: %s", org_id)
+            # Парсим организацию ПРЯМО В ПАМЯТЬ
+            with metrics.org_scope(org_id):
+                return manager.run(
+                    parse_single_org_smart,
                     org_id=org_id,
-                    limit=limit_per_org
+                    limit=limit_per_org,
+                    since=watermarks.get(org_id) if watermarks else None,
+                    prune=prune_dom,
+                    snapshots=snapshots,
+                    newest_first=watermarks is not None
                 )
-                
-                # Добавляем к общему списку
-                all_reviews.extend(org_reviews)
-                logger.info(f"Добавлено {len(org_reviews)} отзывов от организации {org_id}")
-                
-                # Сразу сохраняем в файл
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(all_reviews, f, ensure_ascii=False, indent=2)
-                logger.info(f"Промежуточное сохранение: всего {len(all_reviews)} отзывов")
-                
-            except Exception as e:
-                logger.error(f"Ошибка при парсинге организации {org_id}: {str(e)}")
-                continue
-            
-            # Случайная задержка между организациями
-            if i < len(ids):
-                delay = random.randint(min_delay, max_delay)
-                logger.info(f"Задержка {delay} сек перед следующей организацией...")
-                time.sleep(delay)
-        
-        logger.info(f"Парсинг завершен. Всего собрано {len(all_reviews)} отзывов")
-        
+
+        def on_result(org_id, org_reviews, error):
+            nonlocal processed
+            processed += 1
+            if error is not None:
+                metrics.incr('org_errors')
+                logger.error("[%s/%s] Ошибка при парсинге организации %s: %s", processed, total, org_id, error)
+                if job_queue is not None:
+                    state = job_queue.fail(org_id, error)
+                    logger.info("Организация %s: %s", org_id, 'повтор позже' if state == PENDING else state)
+                return
+
+            # Аренду могли забрать (процесс завис дольше срока аренды) - тогда организацию пишет другой
+            if job_queue is not None and not job_queue.renew(org_id):
+                logger.warning("Аренда организации %s потеряна, результат не сохраняется", org_id)
+                return
+
+            collected = org_reviews
+            if watermarks is not None and org_id in existing_place_ids:
+                org_reviews = drop_stored(writer, watermarks, org_id, org_reviews)
+
+            # Сразу сохраняем в файл
+            writer.commit(org_id, org_reviews)
+            if job_queue is not None:
+                # Ноль отзывов - тоже результат: организация больше не выдается
+                job_queue.complete(org_id, len(org_reviews))
+            logger.info("[%s/%s] Добавлено %s отзывов от организации %s", processed, total, len(org_reviews), org_id)
+            if watermarks is not None:
+                if getattr(collected, 'watermark_safe', False):
+                    watermarks.update(org_id, collected)
+                    watermarks.save()
+                else:
+                    logger.warning("Сбор организации %s неполный или не по новизне, отметка не сдвигается", org_id)
+            if aggregates is not None:
+                update_aggregates(aggregates, writer, org_reviews)
+
+        try:
+            schedule(pending, handle, on_result, concurrency=workers, bucket=bucket)
+        finally:
+            manager.close()
+
+        logger.info("Парсинг завершен. Всего собрано %s отзывов", writer.total)
     finally:
-        driver.quit()
+        set_rate_limiter(None)
+        if job_queue is not None:
+            job_queue.stop_heartbeat()
+            job_queue.release()
+            logger.info("Очередь %s: %s", job_queue.filepath, job_queue.counts())
+        if export_dir:
+            export_columns(writer.iter_records(), export_dir)
 
 def main():
     parser = argparse.ArgumentParser(description='Пакетный парсинг нескольких организаций в один файл')
@@ -178,61 +268,170 @@ def main():
     parser.add_argument('--id-file', type=str, help='Файл со списком ID организаций (по одному на строке)')
     
     # Выходной файл
-    parser.add_argument('--output', type=str, required=True, help='Путь к выходному файлу (все отзывы будут здесь)')
+    parser.add_argument('--output', type=str, required=True,
+                       help='Путь к выходному файлу (все отзывы будут здесь). '
+                            'Для .jsonl данные дописываются пачками с манифестом готовых организаций')
     
     # Параметры парсинга
     parser.add_argument('--limit', type=int, default=50,
                        help='Лимит отзывов на организацию (default: 50)')
-    parser.add_argument('--min-delay', type=int, default=2,
-                       help='Минимальная задержка между организациями в секундах (default: 2)')
-    parser.add_argument('--max-delay', type=int, default=2,
-                       help='Максимальная задержка между организациями в секундах (default: 2)')
+    parser.add_argument('--rps', type=float, default=2.0,
+                       help='Общий лимит запросов к Яндекс Картам в секунду на все воркеры (default: 2)')
+    parser.add_argument('--burst', type=float, default=5,
+                       help='Сколько запросов можно сделать подряд без ожидания (default: 5)')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Собирать только отзывы новее уже известных по каждой организации')
+    parser.add_argument('--watermarks', type=str, default=None,
+                       help='Файл с датами самых свежих отзывов (default: <output>.watermarks.json)')
+    parser.add_argument('--politeness', type=float, default=0.5,
+                       help='Минимальный интервал между прокрутками в секундах (default: 0.5)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Количество параллельных браузеров (default: 1)')
+    parser.add_argument('--http-first', action='store_true',
+                       help='Сначала пробовать собрать отзывы из HTML без браузера')
+    parser.add_argument('--http-concurrency', type=int, default=16,
+                       help='Количество одновременных HTTP-запросов (default: 16)')
+    parser.add_argument('--prune-dom', action='store_true',
+                       help='Удалять обработанные отзывы со страницы (для организаций с тысячами отзывов)')
+    parser.add_argument('--recycle-after', type=int, default=50,
+                       help='Перезапускать браузер после N организаций, 0 - никогда (default: 50)')
+    parser.add_argument('--max-rss-mb', type=float, default=None,
+                       help='Перезапускать браузер, если его память превысила порог (МБ)')
+    parser.add_argument('--warm-browsers', type=int, default=0,
+                       help='Сколько запасных браузеров держать запущенными (default: 0)')
+    parser.add_argument('--export-columns', type=str, default=None,
+                       help='После парсинга выгрузить все отзывы в сжатые столбцы в указанную папку')
+    parser.add_argument('--aggregates', type=str, default=None,
+                       help='Файл агрегатов по местам, обновляемый после каждой организации '
+                            '(места для карты пересобирает aggregate_places.py)')
+    parser.add_argument('--snapshots', type=str, default=None,
+                        help='Папка кэша снимков страниц (HTML и state-view) для replay_snapshots.py')
+    parser.add_argument('--snapshot-ttl-days', type=float, default=DEFAULT_TTL / 86400,
+                        help='Срок хранения снимков в днях, 0 - бессрочно (default: 7)')
+    parser.add_argument('--snapshot-max-mb', type=float, default=DEFAULT_MAX_BYTES / 1024 ** 2,
+                        help='Предельный размер кэша снимков в МБ (default: 2048)')
+    parser.add_argument('--queue', type=str, default=None,
+                        help='Общая очередь организаций в SQLite: аренда с истечением, повторы, '
+                             'можно запускать несколько процессов на одну очередь, у каждого свой --output')
+    parser.add_argument('--lease-minutes', type=float, default=DEFAULT_LEASE_SECONDS / 60,
+                        help='Через сколько минут задача упавшего процесса возвращается в очередь (default: 30)')
+    parser.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help=f'Попыток на организацию до состояния failed (default: {DEFAULT_MAX_ATTEMPTS})')
+    parser.add_argument('--retry-failed', action='store_true', help='Вернуть в очередь организации в состоянии failed')
+    parser.add_argument('--requeue-done', action='store_true',
+                        help='Вернуть в очередь уже завершенные организации из --ids/--id-file (повторный проход)')
+    parser.add_argument('--places', type=str, default=PLACES_CSV,
+                        help=f'Места с reviewsNum для приоритета очереди: большие первыми (default: {PLACES_CSV})')
+    parser.add_argument('--metrics', type=str, default=None,
+                        help='JSON со временем по этапам и счетчиками на прогон и на каждую организацию')
+    parser.add_argument('--prometheus', type=str, default=None,
+                        help='Файл метрик в текстовом формате Prometheus, обновляется по ходу прогона')
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help='Отдавать метрики Prometheus на http://127.0.0.1:PORT/metrics')
+    parser.add_argument('--profile-org', type=int, nargs='+', default=None,
+                        help='Снять cProfile для указанных организаций (файлы <id>.prof в --profile-dir)')
+    parser.add_argument('--profile-dir', type=str, default='profiles',
+                        help='Папка для профилей cProfile (default: profiles)')
     
     # Флаги
     parser.add_argument('--debug', action='store_true', help='Включить режим отладки')
+    parser.add_argument('--log-file', type=str, default=None, help='Дублировать лог в файл (с ротацией по 50 МБ)')
     parser.add_argument('--no-headless', action='store_true', help='Запустить браузер в обычном режиме')
     
     args = parser.parse_args()
     
     # Настраиваем логирование
-    configure_logging(debug=args.debug)
+    configure_logging(debug=args.debug, log_file=args.log_file)
+    set_politeness_delay(args.politeness)
     
     # Получаем список ID
     ids = []
     
     if args.ids:
         ids.extend(args.ids)
-        logger.info(f"Получено {len(args.ids)} ID из аргументов")
+        logger.info("Получено %s ID из аргументов", len(args.ids))
     
     if args.id_file:
         file_ids = read_ids_from_file(args.id_file)
         ids.extend(file_ids)
-        logger.info(f"Получено {len(file_ids)} ID из файла {args.id_file}")
+        logger.info("Получено %s ID из файла %s", len(file_ids), args.id_file)
     
-    if not ids:
-        logger.error("Не указаны ID организаций. Используйте --ids или --id-file")
+    if not ids and not args.queue:
+        logger.error("Не указаны ID организаций. Используйте --ids, --id-file или --queue")
         return
     
     # Убираем дубликаты
     unique_ids = list(dict.fromkeys(ids))
     if len(ids) != len(unique_ids):
-        logger.info(f"Удалено {len(ids) - len(unique_ids)} дубликатов ID")
+        logger.info("Удалено %s дубликатов ID", len(ids) - len(unique_ids))
     
-    logger.info(f"Всего организаций для парсинга: {len(unique_ids)}")
-    logger.info(f"Лимит отзывов на организацию: {args.limit}")
-    logger.info(f"Задержка между организациями: {args.min_delay}-{args.max_delay} сек")
-    logger.info(f"Выходной файл: {args.output}")
+    logger.info("Всего организаций для парсинга: %s", len(unique_ids))
+    logger.info("Лимит отзывов на организацию: %s", args.limit)
+    logger.info("Лимит запросов: %s в сек (пачка до %s)", args.rps, args.burst)
+    logger.info("Выходной файл: %s", args.output)
+    if args.workers > 1:
+        logger.info("Параллельных браузеров: %s", args.workers)
     
-    # Запускаем парсинг
-    parse_multiple_to_single_file(
-        ids=unique_ids,
-        output_file=args.output,
-        limit_per_org=args.limit,
-        debug=args.debug,
-        min_delay=args.min_delay,
-        max_delay=args.max_delay,
-        headless=not args.no_headless
+    watermarks = None
+    if args.incremental:
+        watermarks = WatermarkStore(args.watermarks or f"{args.output}.watermarks.json")
+        logger.info("Инкрементальный режим, отметки: %s", watermarks.filepath)
+
+    metrics.METRICS.configure(
+        json_path=args.metrics,
+        prometheus_path=args.prometheus,
+        profile_ids=args.profile_org,
+        profile_dir=args.profile_dir
     )
+    if args.metrics_port is not None:
+        metrics.METRICS.serve(args.metrics_port)
+
+    job_queue = None
+    priorities = None
+    if args.queue:
+        job_queue = JobQueue(args.queue, lease_seconds=args.lease_minutes * 60, max_attempts=args.max_attempts)
+        if args.retry_failed:
+            logger.info("Возвращено в очередь %s организаций с ошибками", job_queue.retry_failed())
+        if unique_ids and os.path.exists(args.places):
+            # Приоритет - заявленное число отзывов: долгие организации стартуют первыми
+            priorities = {place_id: place.get('reviewsNum') for place_id, place in load_places(args.places).items()}
+        logger.info("Очередь задач: %s (%s)", job_queue.filepath, job_queue.counts())
+
+    # Запускаем парсинг
+    try:
+        parse_multiple_to_single_file(
+            ids=unique_ids,
+            output_file=args.output,
+            limit_per_org=args.limit,
+            debug=args.debug,
+            headless=not args.no_headless,
+            workers=args.workers,
+            watermarks=watermarks,
+            recycle_after=args.recycle_after,
+            max_rss_mb=args.max_rss_mb,
+            warm_browsers=args.warm_browsers,
+            http_first=args.http_first,
+            http_concurrency=args.http_concurrency,
+            rps=args.rps,
+            burst=args.burst,
+            prune_dom=args.prune_dom,
+            export_dir=args.export_columns,
+            aggregates=AggregateStore(args.aggregates) if args.aggregates else None,
+            snapshots=SnapshotCache(
+                args.snapshots,
+                ttl=args.snapshot_ttl_days * 86400,
+                max_bytes=int(args.snapshot_max_mb * 1024 ** 2)
+            ) if args.snapshots else None,
+            job_queue=job_queue,
+            priorities=priorities,
+            requeue_done=args.requeue_done
+        )
+    finally:
+        metrics.METRICS.export()
+        if job_queue is not None:
+            job_queue.release()
+            job_queue.close()
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+import argparse
+import logging
+
+from parser.benchmark import (
+    BATCH_MODE, DEFAULT_SIZES, compare_runs, load_last_results, run_suite, save_results
+)
+from parser.log import configure_logging
+from parser.main import MODE_DICT
+from parser.selenium_helper import make_driver
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Офлайн-бенчмарк режимов парсинга на локальных страницах с заданным числом отзывов'
+    )
+    modes = [*MODE_DICT, BATCH_MODE]
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='Количество отзывов на странице-фикстуре (default: 10 1000 30000)')
+    parser.add_argument('--modes', type=str, nargs='+', default=modes, choices=modes,
+                        help='Режимы для замера (default: все)')
+    parser.add_argument('--limit', type=int, default=None, help='Лимит отзывов на организацию (default: без лимита)')
+    parser.add_argument('--output', type=str, default='bench',
+                        help='Папка с результатами и history.jsonl (default: bench)')
+    parser.add_argument('--latency-ms', type=float, default=0,
+                        help='Задержка ответа fetchReviews в миллисекундах (default: 0)')
+    parser.add_argument('--politeness', type=float, default=0,
+                        help='Интервал между прокрутками на время замера (default: 0)')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Доля ухудшения относительно прошлого прогона, считающаяся регрессией (default: 0.2)')
+    parser.add_argument('--debug', action='store_true', help='Включить режим отладки')
+    parser.add_argument('--no-headless', action='store_true', help='Запустить браузер в обычном режиме')
+
+    args = parser.parse_args()
+    configure_logging(debug=args.debug)
+
+    previous = load_last_results(args.output)
+    driver = make_driver(debug=args.no_headless)
+    try:
+        results = run_suite(
+            driver,
+            args.modes,
+            sizes=args.sizes,
+            limit=args.limit,
+            latency=args.latency_ms / 1000,
+            politeness=args.politeness
+        )
+    finally:
+        driver.quit()
+
+    path = save_results(results, args.output)
+    logger.info("Результаты сохранены в %s", path)
+
+    for run in results['runs']:
+        logger.info(
+            "%12s %6s: %6s отзывов, %8s сек, %s отзывов/сек, %s команд, браузер %s МБ%s",
+            run['mode'], run['size'], run['reviews'], run['wall_s'], run['reviews_per_s'],
+            run['webdriver_calls'], run['browser_peak_rss_mb'], f", ошибка: {run['error']}" if run['error'] else ''
+        )
+
+    if previous:
+        regressions = compare_runs(previous, results, args.threshold)
+        for line in regressions:
+            logger.warning("Регрессия: %s", line)
+        if not regressions:
+            logger.info("Регрессий относительно %s нет", previous.get('revision'))
+
+
+if __name__ == '__main__':
+    main()